@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+LinguaSigna ML Server - Admission Control
+Bounds how much translation work the server accepts, shedding stale frames
+
+At most max_active frames are past admission (in the batcher or running
+inference) at once. Others wait in a bounded global queue, and every session
+has at most one waiting frame: a newer frame from the same session replaces
+the queued one, whose request is answered as dropped. Once the global queue
+is full new frames are rejected straight away (HTTP 429 + Retry-After), so
+latency for admitted frames stays flat instead of growing with the backlog.
+"""
+
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+
+class AdmissionRejected(Exception):
+    """The global queue is full (or the wait timed out) - retry later"""
+
+    def __init__(self, message, retry_after=1):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+class FrameSuperseded(Exception):
+    """A newer frame from the same session replaced this queued one"""
+
+class AdmissionController:
+    """Bounded global queue with latest-frame-wins per-session slots"""
+
+    def __init__(self, max_active=64, max_queued=256, wait_timeout=5.0, retry_after=1):
+        self.max_active = max(1, int(max_active))
+        self.max_queued = max(0, int(max_queued))
+        self.wait_timeout = wait_timeout
+        self.retry_after = retry_after
+        self._lock = threading.Lock()
+        self._active = 0
+        # Future -> session key (None for frames without a session), in arrival order
+        self._waiting = OrderedDict()
+        self._waiting_by_session = {}
+
+        # Stats reported through /status
+        self.admitted = 0
+        self.rejected = 0
+        self.superseded = 0
+        self.timed_out = 0
+
+    def request(self, session_key=None):
+        """Ask to admit one frame - returns a Future that resolves once admitted.
+
+        The Future fails with FrameSuperseded if a newer frame from the same
+        session takes its queue slot, and is failed immediately with
+        AdmissionRejected when the global queue is full.
+        """
+        future = Future()
+        replaced = None
+        with self._lock:
+            if self._active < self.max_active and not self._waiting:
+                self._active += 1
+                self.admitted += 1
+                future.set_result(True)
+                return future
+
+            if session_key is not None and session_key in self._waiting_by_session:
+                # Latest frame wins - the older queued frame gives up its slot
+                replaced = self._waiting_by_session.pop(session_key)
+                del self._waiting[replaced]
+                self.superseded += 1
+            elif len(self._waiting) >= self.max_queued:
+                self.rejected += 1
+                future.set_exception(AdmissionRejected(
+                    "Server overloaded - retry later", self.retry_after
+                ))
+                return future
+
+            self._waiting[future] = session_key
+            if session_key is not None:
+                self._waiting_by_session[session_key] = future
+
+        if replaced is not None:
+            replaced.set_exception(FrameSuperseded("Superseded by a newer frame from this session"))
+        return future
+
+    def release(self):
+        """An admitted frame finished - let the oldest waiting frame in"""
+        with self._lock:
+            self._active -= 1
+            while self._waiting and self._active < self.max_active:
+                future, session_key = self._waiting.popitem(last=False)
+                if session_key is not None:
+                    self._waiting_by_session.pop(session_key, None)
+                self._active += 1
+                self.admitted += 1
+                future.set_result(True)
+
+    def abandon(self, future):
+        """Give up on a requested frame (timeout/cancel), releasing it if it got in"""
+        with self._lock:
+            session_key = self._waiting.pop(future, False)
+            if session_key is not False:
+                if session_key is not None and self._waiting_by_session.get(session_key) is future:
+                    del self._waiting_by_session[session_key]
+                self.timed_out += 1
+                return
+        if future.done() and future.exception() is None:
+            self.release()
+
+    def admit(self, session_key=None):
+        """Block until a frame is admitted - pair with release()"""
+        future = self.request(session_key)
+        try:
+            future.result(self.wait_timeout)
+        except FutureTimeout:
+            self.abandon(future)
+            raise AdmissionRejected("Timed out waiting for admission", self.retry_after)
+
+    def load(self):
+        """(active, queued) read without the lock - for health probes, may be a frame stale"""
+        return self._active, len(self._waiting)
+
+    def stats(self):
+        """Admission counters for the status endpoint"""
+        with self._lock:
+            return {
+                "enabled": True,
+                "max_active": self.max_active,
+                "max_queued": self.max_queued,
+                "active": self._active,
+                "queued": len(self._waiting),
+                "admitted": self.admitted,
+                "rejected": self.rejected,
+                "superseded": self.superseded,
+                "timed_out": self.timed_out
+            }
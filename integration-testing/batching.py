@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+LinguaSigna ML Server - Micro-batching
+Groups frames from concurrent requests into a single translate_batch() call
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+class MicroBatcher:
+    """Collects submitted frames and runs them through the translator in batches.
+
+    A batch is flushed as soon as it holds max_size frames or max_wait_ms has
+    passed since its first frame arrived, whichever comes first. Each caller
+    gets a Future that resolves to its own translation result.
+    """
+
+    def __init__(self, translator, max_size=16, max_wait_ms=5.0):
+        self.translator = translator
+        self.max_size = max(1, int(max_size))
+        self.max_wait = max(0.0, float(max_wait_ms)) / 1000.0
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread = None
+        self._running = False
+
+        # Stats reported through /status
+        self.batches_run = 0
+        self.frames_processed = 0
+        self.largest_batch = 0
+
+    def start(self):
+        """Start the background batching thread (idempotent)"""
+        with self._lock:
+            if self._running:
+                return
+            self._running = True
+            self._thread = threading.Thread(
+                target=self._run, name="micro-batcher", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self, timeout=2.0):
+        """Stop the batching thread after draining queued frames"""
+        with self._lock:
+            if not self._running:
+                return
+            self._running = False
+        self._queue.put(None)
+        if self._thread:
+            self._thread.join(timeout)
+
+    def submit(self, image_data, language="asl"):
+        """Queue one frame and return a Future for its result"""
+        if not self._running:
+            self.start()
+        future = Future()
+        # Timing attributes filled in by the batching thread
+        future.submitted_at = time.perf_counter()
+        future.queue_ms = 0.0
+        future.inference_ms = 0.0
+        future.batch_size = 0
+        self._queue.put((image_data, language, future))
+        return future
+
+    def translate(self, image_data, language="asl", timeout=None):
+        """Blocking convenience wrapper around submit()"""
+        return self.submit(image_data, language).result(timeout)
+
+    def _collect_batch(self, first):
+        """Gather frames after the first until the batch is full or the wait expires"""
+        batch = [first]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_size:
+            remaining = deadline - time.monotonic()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                # Stop sentinel - flush what we have, then let _run exit
+                self._queue.put(None)
+                break
+            batch.append(item)
+        return batch
+
+    def _run(self):
+        while True:
+            first = self._queue.get()
+            if first is None:
+                if not self._running:
+                    return
+                continue
+
+            batch = self._collect_batch(first)
+            frames = [(image_data, language) for image_data, language, _ in batch]
+
+            started = time.perf_counter()
+            try:
+                results = list(self.translator.translate_batch(frames))
+                if len(results) != len(batch):
+                    raise RuntimeError(
+                        f"translate_batch returned {len(results)} results for {len(batch)} frames"
+                    )
+            except Exception as e:
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            inference_ms = (time.perf_counter() - started) * 1000.0
+
+            for (_, _, future), result in zip(batch, results):
+                future.queue_ms = (started - future.submitted_at) * 1000.0
+                future.inference_ms = inference_ms
+                future.batch_size = len(batch)
+                if not future.done():
+                    future.set_result(result)
+
+            self.batches_run += 1
+            self.frames_processed += len(batch)
+            self.largest_batch = max(self.largest_batch, len(batch))
+
+    def queue_depth(self):
+        """Frames waiting for a batch (lock-free read for health probes)"""
+        return self._queue.qsize()
+
+    def stats(self):
+        """Batching counters for the status endpoint"""
+        avg = self.frames_processed / self.batches_run if self.batches_run else 0.0
+        return {
+            "enabled": self._running,
+            "max_batch_size": self.max_size,
+            "max_wait_ms": self.max_wait * 1000.0,
+            "batches_run": self.batches_run,
+            "frames_processed": self.frames_processed,
+            "average_batch_size": round(avg, 2),
+            "largest_batch": self.largest_batch,
+            "queue_depth": self._queue.qsize()
+        }
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+LinguaSigna ML Server - Model Store Benchmark
+Compares loading a template vocabulary plus model weights the old way (read
+an .npz into private memory, recompute features) with mapping a model store,
+and reports memory per worker when several processes load it at once.
+
+Memory figures come from /proc/<pid>/smaps_rollup (Linux): RSS counts shared
+pages in full for every process, PSS splits them between the processes that
+share them, and Private is what each worker alone costs.
+
+Usage:  python benchmark_model_store.py [--templates 10000] [--weights-mb 64] [--workers 4]
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from model_store import ModelStore, encode_strings, write_store
+from template_translator import TemplateVocabulary
+
+def build_files(directory, templates, weights_mb):
+    """The same vocabulary and weights as an .npz pair and as one model store"""
+    rng = np.random.default_rng(0)
+    labels = [f"sign-{index}" for index in range(templates)]
+    landmarks = rng.random((templates, 21, 2), dtype=np.float32)
+    weights = rng.random(weights_mb * 1024 * 1024 // 4, dtype=np.float32)
+
+    vocab_path = os.path.join(directory, "asl.npz")
+    weights_path = os.path.join(directory, "weights.npy")
+    np.savez(vocab_path, labels=np.array(labels), landmarks=landmarks)
+    np.save(weights_path, weights)
+
+    vocabulary = TemplateVocabulary.from_landmarks(labels, landmarks)
+    store_path = os.path.join(directory, "model.lsm")
+    write_store(store_path, {
+        "asl/features": vocabulary.features,
+        "asl/labels": encode_strings(labels),
+        "weights": weights,
+    }, {"kind": "templates", "vocabularies": [{"language": "asl", "templates": templates, "dims": 2}]})
+    return vocab_path, weights_path, store_path
+
+def load_copy(vocab_path, weights_path):
+    """Old path: private copies, features recomputed from landmarks"""
+    vocabulary = TemplateVocabulary.from_file(vocab_path)
+    weights = np.load(weights_path)
+    return vocabulary, weights
+
+def load_mapped(store_path):
+    """Store path: header parse plus views of the mapping"""
+    store = ModelStore(store_path)
+    return TemplateVocabulary.from_store(store, "asl"), store["weights"]
+
+def memory_kb():
+    """Rss / Pss / Private (kB) of this process from smaps_rollup"""
+    fields = {}
+    with open("/proc/self/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) >= 2 and parts[1].isdigit():
+                fields[parts[0].rstrip(":")] = int(parts[1])
+    return {
+        "rss": fields.get("Rss", 0),
+        "pss": fields.get("Pss", 0),
+        "private": fields.get("Private_Clean", 0) + fields.get("Private_Dirty", 0),
+    }
+
+def worker(mode, paths, barrier, results):
+    """Load the model, touch every page, report memory once all workers have loaded"""
+    started = time.perf_counter()
+    if mode == "copy":
+        vocabulary, weights = load_copy(paths[0], paths[1])
+    elif mode == "mmap":
+        vocabulary, weights = load_mapped(paths[2])
+    else:
+        vocabulary, weights = None, None
+    if vocabulary is not None:
+        # Fault in every page, as a worker serving requests eventually would
+        float(vocabulary.features.sum()) + float(weights.sum())
+    load_ms = (time.perf_counter() - started) * 1000.0
+    barrier.wait()
+    results.put(dict(memory_kb(), mode=mode, load_ms=load_ms))
+    barrier.wait()
+
+def run_workers(mode, paths, workers):
+    context = multiprocessing.get_context("spawn")
+    barrier = context.Barrier(workers)
+    results = context.Queue()
+    processes = [context.Process(target=worker, args=(mode, paths, barrier, results)) for _ in range(workers)]
+    for process in processes:
+        process.start()
+    reports = [results.get(timeout=120) for _ in processes]
+    for process in processes:
+        process.join()
+    return {
+        "mode": mode,
+        "workers": workers,
+        "load_ms": round(sum(r["load_ms"] for r in reports) / workers, 1),
+        "rss_mb": round(sum(r["rss"] for r in reports) / workers / 1024, 1),
+        "pss_mb": round(sum(r["pss"] for r in reports) / workers / 1024, 1),
+        "private_mb": round(sum(r["private"] for r in reports) / workers / 1024, 1),
+    }
+
+def time_call(func, repeat):
+    """Best-of-N wall time in milliseconds"""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000.0
+
+def main():
+    parser = argparse.ArgumentParser(description="Model store loading and memory benchmark")
+    parser.add_argument("--templates", type=int, default=10000)
+    parser.add_argument("--weights-mb", type=int, default=64)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", help="write results to this file")
+    args = parser.parse_args()
+
+    print("🚀 LinguaSigna Model Store Benchmark")
+    print(f"   {args.templates} templates + {args.weights_mb} MB weights, {args.workers} workers")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = build_files(directory, args.templates, args.weights_mb)
+        copy_ms = time_call(lambda: load_copy(paths[0], paths[1]), args.repeat)
+        mapped_ms = time_call(lambda: load_mapped(paths[2]), args.repeat)
+        print(f"load (warm page cache):  npz copy {copy_ms:>8.2f} ms   "
+              f"mmap store {mapped_ms:>7.3f} ms   ({copy_ms / mapped_ms:,.0f}x)")
+        print()
+
+        results = {"load_copy_ms": round(copy_ms, 3), "load_mmap_ms": round(mapped_ms, 3), "workers": []}
+        print(f"{'mode':>6s}  {'load ms':>8s}  {'RSS MB':>8s}  {'PSS MB':>8s}  {'private MB':>10s}   (per worker)")
+        for mode in ("bare", "copy", "mmap"):
+            row = run_workers(mode, paths, args.workers)
+            results["workers"].append(row)
+            print(f"{mode:>6s}  {row['load_ms']:>8.1f}  {row['rss_mb']:>8.1f}  "
+                  f"{row['pss_mb']:>8.1f}  {row['private_mb']:>10.1f}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\n📄 Results written to {args.json}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+LinguaSigna ML Server - Probe Latency Under Load
+Saturates /translate on a locally spawned server and measures how long the
+health probes take meanwhile: the dedicated probe port (ML_PROBE_PORT) and,
+for comparison, /health on the main port.
+
+The load runs in a separate process (closed loop, many concurrent clients,
+frame cache off) so the prober isn't competing with it for a GIL. Exits with
+status 1 if the probe port's p99 exceeds --max-ms (5 ms by default) or if
+/translate never got saturated (admission queue never filled up). On a
+single core the prober itself has to be scheduled in between the server's
+threads, so part of the tail there is the client's, not the listener's.
+
+Usage:  python benchmark_probe_latency.py [--server flask|asgi] [--concurrency 128] [--duration 10]
+Needs:  pip install httpx (plus starlette uvicorn for --server asgi)
+"""
+
+import argparse
+import asyncio
+import http.client
+import json
+import multiprocessing
+import os
+import sys
+import time
+
+from benchmark_serving_modes import SERVERS, TEST_PAYLOAD, percentile, start_server
+
+def generate_load(port, concurrency, duration, counts):
+    """Load process: `concurrency` clients posting frames back to back"""
+    import httpx
+
+    # The clients stand in for remote callers - they shouldn't outrank the server for CPU
+    os.nice(10)
+
+    async def run():
+        body = json.dumps(TEST_PAYLOAD).encode()
+        headers = {"Content-Type": "application/json"}
+        limits = httpx.Limits(max_connections=concurrency)
+        stop_at = time.perf_counter() + duration
+        async with httpx.AsyncClient(limits=limits, timeout=60.0) as client:
+            async def client_loop():
+                while time.perf_counter() < stop_at:
+                    try:
+                        response = await client.post(f"http://127.0.0.1:{port}/translate",
+                                                     content=body, headers=headers)
+                        status = response.status_code
+                    except httpx.HTTPError:
+                        status = 0
+                    key = "ok" if status == 200 else "shed" if status == 429 else "error"
+                    with counts.get_lock():
+                        counts[("ok", "shed", "error").index(key)] += 1
+            await asyncio.gather(*(client_loop() for _ in range(concurrency)))
+
+    asyncio.run(run())
+
+def probe(port, paths, interval, duration, results=None):
+    """Probe paths in turn over one keep-alive connection - {path: [(latency_ms, body)]}"""
+    samples = {path: [] for path in paths}
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+    stop_at = time.perf_counter() + duration
+    while time.perf_counter() < stop_at:
+        for path in paths:
+            started = time.perf_counter()
+            try:
+                connection.request("GET", path)
+                response = connection.getresponse()
+                body = response.read()
+            except (OSError, http.client.HTTPException):
+                connection.close()
+                connection = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+                samples[path].append((float("inf"), None))
+                continue
+            samples[path].append(((time.perf_counter() - started) * 1000.0, body))
+            time.sleep(interval)
+    connection.close()
+    if results is not None:
+        # Only latencies cross the process boundary
+        results.put({path: [latency for latency, _ in rows] for path, rows in samples.items()})
+    return samples
+
+def summarize(latencies):
+    ordered = sorted(latencies)
+    return {
+        "count": len(ordered),
+        "p50_ms": round(percentile(ordered, 50), 3),
+        "p99_ms": round(percentile(ordered, 99), 3),
+        "max_ms": round(ordered[-1], 3) if ordered else 0.0
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Health probe latency while /translate is saturated")
+    parser.add_argument("--server", choices=sorted(SERVERS), default="flask")
+    parser.add_argument("--port", type=int, default=5410)
+    parser.add_argument("--probe-port", type=int, default=5411)
+    parser.add_argument("--concurrency", type=int, default=128)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--interval-ms", type=float, default=5.0, help="pause between probes")
+    parser.add_argument("--max-ms", type=float, default=5.0, help="allowed probe-port p99")
+    parser.add_argument("--json", help="write results to this file")
+    args = parser.parse_args()
+
+    # Every frame goes to inference, with a small admission queue that overflows
+    os.environ.update({
+        "ML_PROBE_PORT": str(args.probe_port),
+        "ML_CACHE_ENABLED": "0",
+        "ML_ADMISSION_MAX_ACTIVE": os.environ.get("ML_ADMISSION_MAX_ACTIVE", "16"),
+        "ML_ADMISSION_MAX_QUEUED": os.environ.get("ML_ADMISSION_MAX_QUEUED", "32"),
+    })
+
+    print("🚀 LinguaSigna Probe Latency Benchmark")
+    print(f"   {args.server} server, {args.concurrency} concurrent /translate clients for {args.duration:.0f}s")
+    print("=" * 70)
+
+    server = start_server(args.server, args.port)
+    try:
+        counts = multiprocessing.Array("i", 3)
+        load = multiprocessing.Process(
+            target=generate_load, args=(args.port, args.concurrency, args.duration, counts), daemon=True
+        )
+        load.start()
+        # Let the queue fill up before measuring
+        time.sleep(min(2.0, args.duration / 4))
+        window = args.duration * 0.6
+        interval = args.interval_ms / 1000.0
+
+        # The main port can stall for a long time - probe it from its own process
+        main_results = multiprocessing.Queue()
+        main_prober = multiprocessing.Process(
+            target=probe, args=(args.port, ["/health"], interval, window, main_results), daemon=True
+        )
+        main_prober.start()
+        samples = probe(args.probe_port, ["/health/ready", "/health/load"], interval, window)
+        main_latencies = main_results.get(timeout=window + 30)["/health"]
+        main_prober.join()
+        load.join()
+    finally:
+        server.terminate()
+        server.wait(10)
+
+    runs = {
+        "probe port /health/ready": [latency for latency, _ in samples["/health/ready"]],
+        "probe port /health/load": [latency for latency, _ in samples["/health/load"]],
+        "main port /health": main_latencies,
+    }
+    loads = [json.loads(body) for _, body in samples["/health/load"] if body]
+    saturated = any(sample["waiting"] > 0 for sample in loads)
+    peak_load = max((sample["load"] for sample in loads), default=0.0)
+
+    results = {"translate": {"ok": counts[0], "shed_429": counts[1], "errors": counts[2]},
+               "saturated": saturated, "peak_load": peak_load, "probes": {}}
+    print(f"/translate: {counts[0]} ok, {counts[1]} shed (429), {counts[2]} errors   "
+          f"peak load score {peak_load:.2f}, admission queue {'full' if saturated else 'never filled'}")
+    print()
+    for name, latencies in runs.items():
+        summary = summarize(latencies)
+        results["probes"][name] = summary
+        print(f"   {name:<28s} n={summary['count']:<5d} p50 {summary['p50_ms']:>8.3f} ms   "
+              f"p99 {summary['p99_ms']:>8.3f} ms   max {summary['max_ms']:>8.3f} ms")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\n📄 Results written to {args.json}")
+
+    probe_p99 = max(results["probes"][name]["p99_ms"] for name in runs if name.startswith("probe port"))
+    if not saturated:
+        print("\n❌ /translate was never saturated - raise --concurrency")
+        sys.exit(1)
+    if probe_p99 > args.max_ms:
+        print(f"\n❌ Probe p99 {probe_p99:.3f} ms is over {args.max_ms} ms")
+        sys.exit(1)
+    print(f"\n✅ Probe p99 {probe_p99:.3f} ms stayed under {args.max_ms} ms with /translate saturated")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+LinguaSigna ML Server - Profiler Overhead Benchmark
+Throughput and latency of /translate under closed-loop load with no
+profile running, then while /debug/profile samples at each given rate,
+on one locally spawned server. Runs are interleaved and repeated, and the
+median is reported, since run-to-run noise on a shared box easily exceeds
+the profiler's cost. Also reports the sampler's own measured cost (time
+spent walking stacks, as a share of wall time).
+
+Usage:  python benchmark_profiler_overhead.py [--server flask|asgi] [--rates 100 1000] [--duration 10] [--repeat 3]
+        ML_TRANSLATOR_BACKEND=template python benchmark_profiler_overhead.py   (CPU-bound inference)
+Needs:  pip install httpx (plus starlette uvicorn for --server asgi)
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import threading
+import time
+import urllib.request
+
+from benchmark_serving_modes import SERVERS, run_load, start_server
+
+TOKEN = "benchmark-profiler-token"
+
+def fetch_profile(port, seconds, rate, delay, results):
+    """Start one profile after `delay` seconds and keep its body"""
+    time.sleep(delay)
+    request = urllib.request.Request(
+        f"http://127.0.0.1:{port}/debug/profile?seconds={seconds}&rate={rate}",
+        headers={"Authorization": f"Bearer {TOKEN}"}
+    )
+    with urllib.request.urlopen(request, timeout=seconds + 30) as response:
+        results.append(json.loads(response.read()))
+
+def measure(args, url, rate):
+    """One load run, profiling at `rate` samples per second during it (0 = no profile)"""
+    profiles = []
+    profiling = None
+    if rate:
+        # Profile the middle of the run, not the ramp up and down
+        profiling = threading.Thread(
+            target=fetch_profile, args=(args.port, args.duration - 1.0, rate, 0.5, profiles)
+        )
+        profiling.start()
+    run = asyncio.run(run_load(url, args.concurrency, args.duration))
+    if profiling is not None:
+        profiling.join()
+    run["rate_hz"] = rate
+    if profiles:
+        run["profile"] = {key: profiles[0][key] for key in ("samples", "effective_rate_hz", "stacks", "overhead")}
+    return run
+
+def median_run(runs):
+    """Median throughput, latency and sampler figures over repeated runs at one rate"""
+    summary = {key: statistics.median(run[key] for run in runs)
+               for key in ("requests_per_sec", "p50_ms", "p99_ms")}
+    profiled = [run["profile"] for run in runs if "profile" in run]
+    if profiled:
+        summary["effective_rate_hz"] = statistics.median(p["effective_rate_hz"] for p in profiled)
+        summary["per_sample_us"] = statistics.median(p["overhead"]["per_sample_us"] for p in profiled)
+        summary["share_of_wall"] = statistics.median(p["overhead"]["share_of_wall"] for p in profiled)
+    return summary
+
+def main():
+    parser = argparse.ArgumentParser(description="Cost of a running profile on /translate")
+    parser.add_argument("--server", choices=sorted(SERVERS), default="flask")
+    parser.add_argument("--port", type=int, default=5430)
+    parser.add_argument("--rates", type=float, nargs="+", default=[100.0, 1000.0], help="samples per second")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds per run")
+    parser.add_argument("--repeat", type=int, default=3, help="interleaved runs per rate")
+    parser.add_argument("--json", help="write results to this file")
+    args = parser.parse_args()
+
+    os.environ.update({
+        "ML_PROFILER_ENABLED": "1",
+        "ML_PROFILER_TOKEN": TOKEN,
+        "ML_PROFILER_MAX_SECONDS": str(args.duration),
+        "ML_CACHE_ENABLED": "0",
+    })
+
+    print("🚀 LinguaSigna Profiler Overhead Benchmark")
+    print(f"   {args.server} server, {args.concurrency} concurrent /translate clients, {args.duration:.0f}s per run")
+    print("=" * 70)
+
+    url = f"http://127.0.0.1:{args.port}/translate"
+    server = start_server(args.server, args.port)
+    results = []
+    try:
+        # Warm up before the baseline
+        asyncio.run(run_load(url, args.concurrency, 2.0))
+        for _ in range(args.repeat):
+            for rate in [0.0] + args.rates:
+                results.append(measure(args, url, rate))
+    finally:
+        server.terminate()
+        server.wait(10)
+
+    summaries = {rate: median_run([run for run in results if run["rate_hz"] == rate])
+                 for rate in [0.0] + args.rates}
+    baseline = summaries[0.0]
+    print(f"   median of {args.repeat} runs")
+    for rate, summary in summaries.items():
+        label = f"{rate:.0f} Hz" if rate else "no profile"
+        change = 100.0 * (summary["requests_per_sec"] / baseline["requests_per_sec"] - 1.0)
+        line = (f"   {label:<11s} {summary['requests_per_sec']:>8.1f} req/s ({change:+5.1f}%)   "
+                f"p50 {summary['p50_ms']:>6.1f} ms   p99 {summary['p99_ms']:>6.1f} ms")
+        if rate:
+            line += (f"   sampled at {summary['effective_rate_hz']:.0f} Hz, "
+                     f"{summary['per_sample_us']:.0f} µs/sample, {100.0 * summary['share_of_wall']:.2f}% of wall")
+        print(line)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"runs": results, "median": {str(rate): summary for rate, summary in summaries.items()}},
+                      f, indent=2)
+        print(f"\n📄 Results written to {args.json}")
+
+if __name__ == "__main__":
+    main()
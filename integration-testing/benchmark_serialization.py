@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+LinguaSigna ML Server - Response Serialization Benchmark
+Per-response cost of the old path (body rebuilt with an ISO timestamp, then
+Flask jsonify) against serialization.encode() with compact JSON and
+MessagePack, ISO and epoch timestamps, for /translate, /health and /status
+bodies - and what that adds up to as a share of one core at our request
+rates.
+
+Usage:  python benchmark_serialization.py [--rates 100 1000 5000] [--repeat 2000]
+"""
+
+import argparse
+import json
+import time
+from datetime import datetime
+
+from flask import Flask, jsonify
+
+import serialization
+from serialization import RESPONSE_TIME, encode
+
+def translate_body():
+    return {
+        "success": True,
+        "translation": "Nice to meet you",
+        "confidence": 0.8685735149864741,
+        "language": "asl",
+        "timestamp": RESPONSE_TIME,
+        "processing_time_ms": 12.941,
+        "timings_ms": {"read": 0.201, "motion_check": 0.003, "cache_lookup": 0.769,
+                       "admission_wait": 0.049, "queue_wait": 5.24, "inference": 6.296},
+        "alternatives": [{"text": "Hello", "confidence": 0.61}, {"text": "Please", "confidence": 0.55}]
+    }
+
+def health_body():
+    return {"status": "healthy", "service": "LinguaSigna ML Server", "ready": True,
+            "backend": "mock", "timestamp": RESPONSE_TIME, "version": "1.0.0"}
+
+def status_body():
+    """A /status body with a realistic amount of nested counters"""
+    stats = {f"counter_{index}": index * 1.5 for index in range(12)}
+    return {
+        "server": "ML Translation Server",
+        "status": "running",
+        "endpoints": [f"/endpoint/{index} - description of endpoint {index}" for index in range(7)],
+        "languages_supported": ["asl", "gsl"],
+        **{section: dict(stats, enabled=True) for section in
+           ("backend", "batching", "sessions", "cache", "motion_gate", "hand_tracking", "admission")},
+        "latency": {f"/route/{index}": dict(stats) for index in range(4)},
+        "timestamp": RESPONSE_TIME
+    }
+
+BODIES = {"translate": translate_body, "health": health_body, "status": status_body}
+
+def old_path(make_body):
+    """Previous behaviour: ISO timestamp per call, Flask jsonify (inside an app context)"""
+    body = make_body()
+    body["timestamp"] = datetime.now().isoformat()
+    return jsonify(body).get_data()
+
+def time_per_call(func, repeat):
+    """Best of 5 runs of `repeat` calls, in microseconds per call"""
+    best = float("inf")
+    for _ in range(5):
+        started = time.perf_counter()
+        for _ in range(repeat):
+            func()
+        best = min(best, (time.perf_counter() - started) / repeat)
+    return best * 1e6
+
+def main():
+    parser = argparse.ArgumentParser(description="Response serialization benchmark")
+    parser.add_argument("--rates", type=int, nargs="+", default=[100, 1000, 5000],
+                        help="requests/sec to express the cost at")
+    parser.add_argument("--repeat", type=int, default=2000)
+    parser.add_argument("--json", help="write results to this file")
+    args = parser.parse_args()
+
+    # A request handler already runs inside one - don't count pushing it
+    Flask(__name__).app_context().push()
+    methods = [("jsonify + iso (old)", old_path)]
+    for fmt in ("json", "msgpack"):
+        if fmt == "msgpack" and serialization.msgpack is None:
+            continue
+        for epoch in (False, True):
+            label = f"{fmt} + {'epoch' if epoch else 'iso'}"
+            methods.append((label, lambda make, fmt=fmt, epoch=epoch: encode(make(), fmt, epoch)[0]))
+
+    print("🚀 LinguaSigna Response Serialization Benchmark")
+    print(f"   JSON encoder: {'orjson' if serialization.orjson is not None else 'json (stdlib)'}, "
+          f"msgpack: {'yes' if serialization.msgpack is not None else 'not installed'}")
+    print("=" * 70)
+
+    results = []
+    for name, make_body in BODIES.items():
+        print(f"\n{name}")
+        baseline = None
+        for label, method in methods:
+            size = len(method(make_body))
+            micros = time_per_call(lambda: method(make_body), args.repeat)
+            baseline = baseline or micros
+            load = "  ".join(f"{rate}/s {micros * rate / 1e4:>5.2f}%" for rate in args.rates)
+            print(f"   {label:<20s} {micros:>7.2f} µs  {size:>5d} B  "
+                  f"{baseline / micros:>5.1f}x   core use: {load}")
+            results.append({"body": name, "method": label, "us_per_response": round(micros, 3),
+                            "bytes": size})
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\n📄 Results written to {args.json}")
+
+if __name__ == "__main__":
+    main()
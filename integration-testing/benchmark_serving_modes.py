@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+LinguaSigna ML Server - Serving Mode Benchmark
+Compares requests/sec and p99 latency of the Flask server (ml_server.py)
+against the async ASGI server (ml_server_asgi.py) at several concurrency levels.
+
+Usage:  python benchmark_serving_modes.py [--duration 10] [--concurrency 10 100 1000]
+Needs:  pip install httpx starlette uvicorn
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import os
+import subprocess
+import sys
+import time
+
+SERVERS = {
+    "flask": ["ml_server.py"],
+    "asgi": ["ml_server_asgi.py"],
+}
+
+# Long enough to count as a hand frame for the mock translator
+TEST_PAYLOAD = {
+    "image": base64.b64encode(b"\xff\xd8" + b"\x00" * 2048).decode("utf-8"),
+    "language": "asl"
+}
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(pct / 100.0 * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+def start_server(mode, port):
+    """Spawn one ML server and wait until /health answers"""
+    import urllib.request
+
+    # No probe listener unless the caller set ML_PROBE_PORT - its default
+    # (ML_PORT + 1) would collide with the next server on --port + 1
+    env = dict({"ML_PROBE_PORT": "0"}, **os.environ)
+    env["ML_PORT"] = str(port)
+    process = subprocess.Popen(
+        [sys.executable] + SERVERS[mode],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+
+    deadline = time.time() + 15
+    while time.time() < deadline:
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/health", timeout=1) as response:
+                if response.status == 200:
+                    return process
+        except OSError:
+            time.sleep(0.1)
+    process.kill()
+    raise RuntimeError(f"{mode} server did not start on port {port}")
+
+async def run_load(url, concurrency, duration):
+    """Closed-loop load: `concurrency` clients each send back-to-back requests"""
+    import httpx
+
+    latencies = []
+    errors = 0
+    stop_at = time.perf_counter() + duration
+    body = json.dumps(TEST_PAYLOAD).encode()
+    headers = {"Content-Type": "application/json"}
+    limits = httpx.Limits(max_connections=concurrency)
+
+    async with httpx.AsyncClient(limits=limits, timeout=30.0) as client:
+        async def client_loop():
+            nonlocal errors
+            while time.perf_counter() < stop_at:
+                started = time.perf_counter()
+                try:
+                    response = await client.post(url, content=body, headers=headers)
+                    if response.status_code != 200:
+                        errors += 1
+                        continue
+                except httpx.HTTPError:
+                    errors += 1
+                    continue
+                latencies.append((time.perf_counter() - started) * 1000.0)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(client_loop() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "concurrency": concurrency,
+        "requests": len(latencies),
+        "errors": errors,
+        "requests_per_sec": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 50), 1),
+        "p99_ms": round(percentile(latencies, 99), 1),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Flask vs ASGI ML server")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds per run")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--modes", nargs="+", default=list(SERVERS), choices=list(SERVERS))
+    parser.add_argument("--port", type=int, default=5100)
+    parser.add_argument("--json", help="write results to this file")
+    args = parser.parse_args()
+
+    print("🚀 LinguaSigna ML Server - Serving Mode Benchmark")
+    print("=" * 70)
+
+    results = []
+    for offset, mode in enumerate(args.modes):
+        port = args.port + offset
+        process = start_server(mode, port)
+        try:
+            for concurrency in args.concurrency:
+                result = asyncio.run(run_load(
+                    f"http://127.0.0.1:{port}/translate", concurrency, args.duration
+                ))
+                result["mode"] = mode
+                results.append(result)
+                print(f"{mode:6s} c={concurrency:<5d} "
+                      f"{result['requests_per_sec']:>8.1f} req/s  "
+                      f"p50 {result['p50_ms']:>8.1f} ms  "
+                      f"p99 {result['p99_ms']:>8.1f} ms  "
+                      f"errors {result['errors']}")
+        finally:
+            process.terminate()
+            process.wait(timeout=5)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\n📄 Results written to {args.json}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+LinguaSigna ML Server - Template Matching Benchmark
+Classification latency of TemplateSignTranslator as the vocabulary grows
+from 10 to 10,000 signs, next to a naive loop over the templates (and a
+scipy cKDTree index when scipy is installed).
+
+Usage:  python benchmark_template_translator.py [--vocab 10 100 1000 10000] [--batch 32] [--repeat 20]
+"""
+
+import argparse
+import json
+import math
+import time
+
+import numpy as np
+
+from landmark_features import extract_features
+from template_translator import TemplateSignTranslator, TemplateVocabulary, normalize_rows
+
+def naive_top1(vocabulary, features):
+    """Reference: cosine similarity against one template at a time"""
+    templates = vocabulary.features.tolist()
+    best = []
+    for row in features.tolist():
+        best_score, best_index = -math.inf, -1
+        for index, template in enumerate(templates):
+            score = sum(a * b for a, b in zip(row, template))
+            if score > best_score:
+                best_score, best_index = score, index
+        best.append(best_index)
+    return best
+
+def time_call(func, repeat):
+    """Best-of-N wall time in milliseconds"""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000.0
+
+def main():
+    parser = argparse.ArgumentParser(description="Template matching benchmark")
+    parser.add_argument("--vocab", type=int, nargs="+", default=[10, 100, 1000, 10000])
+    parser.add_argument("--batch", type=int, default=32, help="frames per translate_batch call")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--naive-max", type=int, default=1000,
+                        help="skip the naive loop above this vocabulary size")
+    parser.add_argument("--json", help="write results to this file")
+    args = parser.parse_args()
+
+    try:
+        import scipy  # noqa: F401
+        indexes = ["brute", "kdtree"]
+    except ImportError:
+        indexes = ["brute"]
+
+    print("🚀 LinguaSigna Template Matching Benchmark")
+    print(f"   batch of {args.batch} frames, indexes: {', '.join(indexes)}")
+    print("=" * 70)
+
+    rng = np.random.default_rng(1)
+    frames = [(rng.random((1, 21, 2), dtype=np.float32), "asl") for _ in range(args.batch)]
+    queries = normalize_rows(extract_features(np.concatenate([hands for hands, _ in frames])))
+
+    results = []
+    for size in args.vocab:
+        words = [f"sign-{index}" for index in range(size)]
+        row = {"vocabulary": size}
+        for index in indexes:
+            translator = TemplateSignTranslator(template_dir="", index=index)
+            translator.vocabularies["asl"] = TemplateVocabulary.synthetic(words, index=index)
+            row[f"{index}_batch_ms"] = round(time_call(lambda: translator.translate_batch(frames), args.repeat), 3)
+            row[f"{index}_frame_ms"] = round(time_call(lambda: translator.translate_batch(frames[:1]), args.repeat), 3)
+
+        line = f"vocab {size:>6d}:  "
+        if size <= args.naive_max:
+            vocabulary = translator.vocabularies["asl"]
+            row["naive_frame_ms"] = round(time_call(lambda: naive_top1(vocabulary, queries[:1]), 3), 3)
+            line += f"naive {row['naive_frame_ms']:>8.2f} ms/frame   "
+        else:
+            line += f"naive {'-':>8s} ms/frame   "
+        for index in indexes:
+            line += (f"{index} {row[f'{index}_frame_ms']:>6.3f} ms/frame "
+                     f"{row[f'{index}_batch_ms']:>7.3f} ms/batch   ")
+        results.append(row)
+        print(line)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\n📄 Results written to {args.json}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+LinguaSigna ML Server - /translate Load Generator
+Drives a locally spawned ML server in closed-loop (N concurrent clients,
+each sending back-to-back) and open-loop (fixed arrival rate) modes and
+reports throughput, latency percentiles, error rates and a per-second
+latency series.
+
+Frames are the synthetic hand image from step3_1_integration_test.py by
+default, or a set of real frames (--frames path/to/*.jpg). Open-loop latency
+is measured from each request's scheduled send time, so a server that falls
+behind can't hide the backlog (no coordinated omission). Sends dropped by the
+--max-outstanding cap are recorded with status "skipped" and count as
+errors instead of vanishing from the run.
+
+Usage:
+    python benchmark_translate_load.py --concurrency 1 10 50 --duration 10
+    python benchmark_translate_load.py --rate 20 50 100 --server asgi --binary
+    python benchmark_translate_load.py --frames 'frames/*.jpg' --json out.json --csv out.csv
+    python benchmark_translate_load.py --server-env ML_CACHE_ENABLED=0 ML_WORKER_PROCESSES=4
+
+A single repeated frame mostly hits the server's frame cache; pass
+--server-env ML_CACHE_ENABLED=0 to measure inference instead.
+Needs:  pip install httpx (plus starlette uvicorn for --server asgi)
+"""
+
+import argparse
+import asyncio
+import base64
+import csv
+import glob
+import json
+import os
+import time
+from collections import Counter
+
+from benchmark_serving_modes import SERVERS, percentile, start_server
+
+def load_frames(pattern):
+    """Encoded frames to send - real files matching pattern, or the synthetic test image"""
+    if pattern:
+        paths = sorted(glob.glob(pattern))
+        if not paths:
+            raise SystemExit(f"No frames match {pattern}")
+        frames = []
+        for path in paths:
+            with open(path, "rb") as f:
+                frames.append(f.read())
+        return frames
+
+    from step3_1_integration_test import make_test_image
+    return [make_test_image()]
+
+def build_requests(frames, language, binary):
+    """(body, headers) for every frame, encoded once up front"""
+    if binary:
+        headers = {"Content-Type": "image/jpeg", "X-Language": language}
+        return [(frame, headers) for frame in frames]
+    headers = {"Content-Type": "application/json"}
+    return [
+        (json.dumps({"image": base64.b64encode(frame).decode("utf-8"), "language": language}).encode(),
+         headers)
+        for frame in frames
+    ]
+
+async def send(client, url, body, headers, samples, scheduled, origin):
+    """One request - appends (offset_s, latency_ms, status) to samples"""
+    import httpx
+
+    try:
+        response = await client.post(url, content=body, headers=headers)
+        status = response.status_code
+    except httpx.HTTPError:
+        status = 0
+    finished = time.perf_counter()
+    samples.append((scheduled - origin, (finished - scheduled) * 1000.0, status))
+
+async def closed_loop(url, payloads, concurrency, duration):
+    """`concurrency` clients, each sending its next frame as soon as the last returns"""
+    import httpx
+
+    samples = []
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(limits=limits, timeout=30.0) as client:
+        origin = time.perf_counter()
+        stop_at = origin + duration
+
+        async def client_loop(offset):
+            index = offset
+            while time.perf_counter() < stop_at:
+                body, headers = payloads[index % len(payloads)]
+                index += 1
+                await send(client, url, body, headers, samples, time.perf_counter(), origin)
+
+        await asyncio.gather(*(client_loop(i) for i in range(concurrency)))
+        elapsed = time.perf_counter() - origin
+    return samples, elapsed
+
+async def open_loop(url, payloads, rate, duration, max_outstanding):
+    """Requests fired at a fixed rate regardless of how fast responses come back"""
+    import httpx
+
+    samples = []
+    limits = httpx.Limits(max_connections=max_outstanding)
+    async with httpx.AsyncClient(limits=limits, timeout=30.0) as client:
+        origin = time.perf_counter()
+        interval = 1.0 / rate
+        total = int(rate * duration)
+        tasks = set()
+        for index in range(total):
+            scheduled = origin + index * interval
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if len(tasks) >= max_outstanding:
+                # Client-side cap so a stalled server can't exhaust sockets - the
+                # request still counts, as an error that never got a response
+                samples.append((scheduled - origin, 0.0, "skipped"))
+                continue
+            body, headers = payloads[index % len(payloads)]
+            task = asyncio.create_task(send(client, url, body, headers, samples, scheduled, origin))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+        if tasks:
+            await asyncio.gather(*tasks)
+        elapsed = time.perf_counter() - origin
+    return samples, elapsed
+
+def summarize(samples, elapsed):
+    """Throughput, latency percentiles and error rate for one run"""
+    latencies = sorted(latency for _, latency, status in samples if status == 200)
+    statuses = Counter(str(status) for _, _, status in samples)
+    errors = len(samples) - len(latencies)
+    return {
+        "requests": len(samples),
+        "ok": len(latencies),
+        "errors": errors,
+        "skipped": statuses.get("skipped", 0),
+        "error_rate": round(errors / len(samples), 4) if samples else 0.0,
+        "statuses": dict(statuses),
+        "throughput_rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(percentile(latencies, 50), 1),
+        "p95_ms": round(percentile(latencies, 95), 1),
+        "p99_ms": round(percentile(latencies, 99), 1),
+        "max_ms": round(latencies[-1], 1) if latencies else 0.0,
+    }
+
+def time_series(samples, bucket_s=1.0):
+    """Per-bucket request count, errors and latency percentiles"""
+    buckets = {}
+    for offset, latency, status in samples:
+        buckets.setdefault(int(offset // bucket_s), []).append((latency, status))
+    series = []
+    for index in sorted(buckets):
+        entries = buckets[index]
+        latencies = sorted(latency for latency, status in entries if status == 200)
+        series.append({
+            "t_s": round(index * bucket_s, 3),
+            "requests": len(entries),
+            "errors": len(entries) - len(latencies),
+            "skipped": sum(1 for _, status in entries if status == "skipped"),
+            "p50_ms": round(percentile(latencies, 50), 1),
+            "p99_ms": round(percentile(latencies, 99), 1),
+            "max_ms": round(latencies[-1], 1) if latencies else 0.0,
+        })
+    return series
+
+def write_csv(path, runs):
+    """One row per run per time bucket"""
+    fields = ["server", "mode", "load", "t_s", "requests", "errors", "skipped", "p50_ms", "p99_ms", "max_ms"]
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fields)
+        writer.writeheader()
+        for run in runs:
+            for point in run["series"]:
+                writer.writerow(dict(point, server=run["server"], mode=run["mode"], load=run["load"]))
+
+def print_run(run):
+    summary = run["summary"]
+    label = f"c={run['load']}" if run["mode"] == "closed" else f"{run['load']}/s"
+    print(f"{run['server']:6s} {run['mode']:6s} {label:>8s}  "
+          f"{summary['throughput_rps']:>8.1f} req/s  "
+          f"p50 {summary['p50_ms']:>7.1f}  p95 {summary['p95_ms']:>7.1f}  "
+          f"p99 {summary['p99_ms']:>7.1f}  max {summary['max_ms']:>7.1f} ms  "
+          f"errors {summary['error_rate'] * 100:5.1f}%  skipped {summary['skipped']}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-generate /translate against a local ML server")
+    parser.add_argument("--server", default="flask", choices=list(SERVERS))
+    parser.add_argument("--port", type=int, default=5200)
+    parser.add_argument("--concurrency", type=int, nargs="*", default=None,
+                        help="closed-loop client counts (default 1 10 50 unless --rate is given)")
+    parser.add_argument("--rate", type=float, nargs="*", default=[],
+                        help="open-loop arrival rates in requests/sec")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds per run")
+    parser.add_argument("--max-outstanding", type=int, default=1000,
+                        help="open-loop cap on requests in flight")
+    parser.add_argument("--frames", help="glob of real frames to send instead of the synthetic image")
+    parser.add_argument("--binary", action="store_true", help="send raw JPEG bodies instead of base64 JSON")
+    parser.add_argument("--language", default="asl")
+    parser.add_argument("--server-env", nargs="*", default=[], metavar="KEY=VALUE",
+                        help="settings for the spawned server, e.g. ML_CACHE_ENABLED=0")
+    parser.add_argument("--json", help="write summaries and series to this file")
+    parser.add_argument("--csv", help="write the latency-over-time series to this file")
+    args = parser.parse_args()
+
+    concurrency = args.concurrency
+    if concurrency is None:
+        concurrency = [] if args.rate else [1, 10, 50]
+
+    frames = load_frames(args.frames)
+    payloads = build_requests(frames, args.language, args.binary)
+    url = f"http://127.0.0.1:{args.port}/translate"
+
+    print("🚀 LinguaSigna /translate Load Generator")
+    print(f"   {args.server} server, {len(frames)} frame(s), "
+          f"{'binary' if args.binary else 'base64 JSON'} payloads, {args.duration}s per run")
+    print("=" * 70)
+
+    for setting in args.server_env:
+        name, _, value = setting.partition("=")
+        os.environ[name] = value
+
+    runs = []
+    process = start_server(args.server, args.port)
+    try:
+        for clients in concurrency:
+            samples, elapsed = asyncio.run(closed_loop(url, payloads, clients, args.duration))
+            run = {"server": args.server, "mode": "closed", "load": clients,
+                   "summary": summarize(samples, elapsed), "series": time_series(samples)}
+            runs.append(run)
+            print_run(run)
+        for rate in args.rate:
+            samples, elapsed = asyncio.run(
+                open_loop(url, payloads, rate, args.duration, args.max_outstanding)
+            )
+            run = {"server": args.server, "mode": "open", "load": rate,
+                   "summary": summarize(samples, elapsed),
+                   "series": time_series(samples)}
+            runs.append(run)
+            print_run(run)
+    finally:
+        process.terminate()
+        process.wait(timeout=5)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(runs, f, indent=2)
+        print(f"\n📄 Results written to {args.json}")
+    if args.csv:
+        write_csv(args.csv, runs)
+        print(f"📄 Latency series written to {args.csv}")
+
+if __name__ == "__main__":
+    main()
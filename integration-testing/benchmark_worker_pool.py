@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+LinguaSigna ML Server - Worker Pool Scaling Benchmark
+Measures frames/sec of a CPU-bound translator run through WorkerPool with
+1..N worker processes, next to the same number of threads in one process
+(which the GIL holds to roughly one core).
+
+Usage:  python benchmark_worker_pool.py [--workers 1 2 4] [--frames 400] [--work 20000]
+"""
+
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from sign_translator import SimpleSignTranslator
+from translator_backends import register_backend
+from worker_pool import WorkerPool
+
+BACKEND = "cpu-bound"
+# Workers import the backend by name, so register it as a "module:Class" string
+register_backend(BACKEND, "benchmark_worker_pool:CpuBoundTranslator")
+
+class CpuBoundTranslator(SimpleSignTranslator):
+    """Mock translator that burns pure-Python CPU per frame instead of sleeping"""
+
+    work = int(os.environ.get("BENCH_WORK_UNITS", "20000"))
+
+    def translate_batch(self, frames):
+        for image_data, _ in frames:
+            # Stand-in for decode + detection work that holds the GIL
+            checksum = 0
+            for value in range(self.work):
+                checksum = (checksum * 31 + value) & 0xFFFFFFFF
+        return self._translate_frames(frames)
+
+def run_threads(threads, frames, frame):
+    """Baseline: the translator called from `threads` threads in this process"""
+    translator = CpuBoundTranslator()
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(lambda _: translator.translate(frame, "asl"), range(frames)))
+    return frames / (time.perf_counter() - started)
+
+def run_processes(processes, frames, frame, max_batch):
+    """Frames submitted through a WorkerPool with `processes` workers"""
+    pool = WorkerPool(BACKEND, processes=processes, max_batch=max_batch)
+    pool.load()
+    # Wait for every worker, not just the first, so all cores are in play
+    deadline = time.time() + 30
+    while time.time() < deadline and not all(w["ready"] for w in pool.stats()["workers"]):
+        time.sleep(0.05)
+
+    try:
+        started = time.perf_counter()
+        futures = [pool.submit(frame, "asl") for _ in range(frames)]
+        for future in futures:
+            future.result(60)
+        return frames / (time.perf_counter() - started)
+    finally:
+        pool.stop()
+
+def main():
+    parser = argparse.ArgumentParser(description="Worker pool scaling benchmark")
+    parser.add_argument("--workers", type=int, nargs="+",
+                        default=sorted({1, 2, max(1, os.cpu_count() or 1)}))
+    parser.add_argument("--frames", type=int, default=400)
+    parser.add_argument("--work", type=int, default=20000, help="CPU work units per frame")
+    parser.add_argument("--frame-bytes", type=int, default=64 * 1024)
+    parser.add_argument("--max-batch", type=int, default=16)
+    parser.add_argument("--json", help="write results to this file")
+    args = parser.parse_args()
+
+    # Spawned workers read the work size from the environment
+    os.environ["BENCH_WORK_UNITS"] = str(args.work)
+    CpuBoundTranslator.work = args.work
+    frame = os.urandom(args.frame_bytes)
+
+    print("🚀 LinguaSigna Worker Pool Scaling Benchmark")
+    print(f"   {os.cpu_count()} CPUs, {args.frames} frames of {args.frame_bytes} bytes, "
+          f"{args.work} work units per frame")
+    print("=" * 70)
+
+    results = []
+    baseline = None
+    for workers in args.workers:
+        threads_fps = run_threads(workers, args.frames, frame)
+        processes_fps = run_processes(workers, args.frames, frame, args.max_batch)
+        baseline = baseline or processes_fps
+        results.append({
+            "workers": workers,
+            "threads_fps": round(threads_fps, 1),
+            "processes_fps": round(processes_fps, 1),
+            "process_scaling": round(processes_fps / baseline, 2)
+        })
+        print(f"workers {workers:>3d}:  threads {threads_fps:>8.1f} frames/s   "
+              f"processes {processes_fps:>8.1f} frames/s   "
+              f"scaling {processes_fps / baseline:>5.2f}x")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\n📄 Results written to {args.json}")
+
+if __name__ == "__main__":
+    main()
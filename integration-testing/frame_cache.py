@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+LinguaSigna ML Server - Near-Duplicate Frame Cache
+Reuses translation results for frames that look the same as a recent one
+
+Image frames are keyed by a 64-bit difference hash (dHash) of a tiny
+grayscale thumbnail, so small pixel changes between consecutive camera
+frames still map to nearby keys. Landmark frames are keyed by their
+coordinates quantized to a grid, and recent landmark entries within
+landmark_quantum of the new frame also count as hits. Frames translated
+inside a crop box carry the box as the key's region, so the same frame
+cropped two ways never shares a result. Entries expire after a TTL and
+the table is bounded with least-recently-used eviction.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from frame_decoder import decode_gray_thumbnail, is_landmark_array
+
+class FrameResultCache:
+    """LRU + TTL cache of translation results keyed by frame similarity"""
+
+    def __init__(self, max_entries=1024, ttl_seconds=2.0, hamming_threshold=4,
+                 landmark_quantum=0.01, scan_limit=64):
+        self.max_entries = max(1, int(max_entries))
+        self.ttl = float(ttl_seconds)
+        self.hamming_threshold = int(hamming_threshold)
+        # Grid size for landmark keys, and the max per-coordinate distance
+        # for a near-duplicate landmark hit
+        self.landmark_quantum = float(landmark_quantum)
+        # How many of the most recent entries to compare for a near-duplicate
+        # match when there is no exact hit
+        self.scan_limit = int(scan_limit)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.near_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    # Keys
+
+    def frame_key(self, image_data, language, region=None):
+        """Cache key for a frame: ("dhash" | "lm" | "raw", language, value, region)
+
+        region is the crop box the frame is translated in (None for the
+        full frame) - the hash is always of the full frame.
+        """
+        if is_landmark_array(image_data):
+            return ("lm", language, self._landmark_hash(image_data), region)
+
+        dhash = self._image_dhash(image_data)
+        if dhash is not None:
+            return ("dhash", language, dhash, region)
+
+        # Not decodable as an image - only exact duplicates can match
+        return ("raw", language, hashlib.blake2b(image_data, digest_size=16).digest(), region)
+
+    def _landmark_hash(self, hands):
+        import numpy as np
+
+        quantized = np.round(np.asarray(hands, dtype=np.float32) / self.landmark_quantum)
+        return hashlib.blake2b(quantized.astype(np.int32).tobytes(), digest_size=16).digest()
+
+    def _image_dhash(self, image_data):
+        """64-bit difference hash, or None if the bytes aren't a decodable image"""
+        # Decode at 1/8 scale straight to grayscale - far cheaper than a full decode
+        thumbnail = decode_gray_thumbnail(image_data, reduction=8)
+        if thumbnail is None:
+            return None
+
+        import cv2
+        import numpy as np
+
+        small = cv2.resize(thumbnail, (9, 8), interpolation=cv2.INTER_AREA)
+        bits = (small[:, 1:] > small[:, :-1]).flatten()
+        return int.from_bytes(np.packbits(bits).tobytes(), "big")
+
+    # Lookup / store
+
+    def lookup(self, image_data, language, region=None):
+        """Return (key, found, result); found is False on a miss"""
+        try:
+            key = self.frame_key(image_data, language, region)
+            hands = image_data if key[0] == "lm" else None
+        except Exception:
+            with self._lock:
+                self.misses += 1
+            return None, False, None
+
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return key, True, entry[1]
+                del self._entries[key]
+                self.expirations += 1
+
+            if key[0] != "raw":
+                match = self._nearest_locked(key, hands, now)
+                if match is not None:
+                    self._entries.move_to_end(match)
+                    self.near_hits += 1
+                    return key, True, self._entries[match][1]
+
+            self.misses += 1
+            return key, False, None
+
+    def _nearest_locked(self, key, hands, now):
+        """Most recent live entry similar enough to count as the same frame"""
+        kind, language, value, region = key
+        checked = 0
+        for other in reversed(self._entries):
+            if checked >= self.scan_limit:
+                break
+            checked += 1
+            if other[0] != kind or other[1] != language or other[3] != region:
+                continue
+            expires_at, _, other_hands = self._entries[other]
+            if expires_at <= now:
+                continue
+            if kind == "dhash":
+                if (value ^ other[2]).bit_count() <= self.hamming_threshold:
+                    return other
+            elif other_hands is not None and other_hands.shape == hands.shape:
+                if float(abs(other_hands - hands).max(initial=0.0)) <= self.landmark_quantum:
+                    return other
+        return None
+
+    def store(self, key, result, image_data=None):
+        """Remember the result for a frame key returned by lookup()
+
+        Pass the landmark array as image_data for landmark frames so later
+        frames can be matched by distance, not just by quantized key.
+        """
+        if key is None:
+            return
+        hands = None
+        if key[0] == "lm" and image_data is not None:
+            import numpy as np
+            hands = np.array(image_data, dtype=np.float32)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, result, hands)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        lookups = self.hits + self.near_hits + self.misses
+        return {
+            "enabled": True,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_s": self.ttl,
+            "hamming_threshold": self.hamming_threshold,
+            "landmark_quantum": self.landmark_quantum,
+            "hits": self.hits,
+            "near_hits": self.near_hits,
+            "misses": self.misses,
+            "hit_rate": round((self.hits + self.near_hits) / lookups, 3) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations
+        }
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+LinguaSigna ML Server - Frame Decoding
+Helpers for turning uploaded image bytes into pixel arrays
+"""
+
+import threading
+
+def is_landmark_array(image_data):
+    """True for (hands, 21, 2|3) landmark arrays from the landmark API"""
+    shape = getattr(image_data, "shape", None)
+    return shape is not None and len(shape) == 3
+
+def decode_gray_thumbnail(image_data, reduction=8):
+    """Decode an encoded image straight to a reduced-size grayscale array.
+
+    Uses OpenCV's IMREAD_REDUCED_GRAYSCALE_* flags so JPEGs are scaled down
+    during decoding instead of after a full-size decode. Returns None if
+    OpenCV isn't installed or the bytes aren't a decodable image.
+    """
+    try:
+        import cv2
+        import numpy as np
+    except ImportError:
+        return None
+
+    flags = {
+        1: cv2.IMREAD_GRAYSCALE,
+        2: cv2.IMREAD_REDUCED_GRAYSCALE_2,
+        4: cv2.IMREAD_REDUCED_GRAYSCALE_4,
+        8: cv2.IMREAD_REDUCED_GRAYSCALE_8,
+    }
+    image_data, _ = split_crop(image_data)
+    if image_data is None or len(image_data) == 0:
+        return None
+    buffer = np.frombuffer(image_data, dtype=np.uint8)
+    return cv2.imdecode(buffer, flags[reduction])
+
+class CroppedFrame:
+    """Encoded frame bytes plus a region of interest for the decoder.
+
+    box is (x, y, width, height) in normalized 0-1 coordinates of the full
+    frame. fallback marks a guessed region (hand tracking) that the backend
+    should give up on for the full frame if it finds nothing inside.
+    Backends that never decode pixels can treat it like the bytes.
+    """
+
+    __slots__ = ("data", "box", "fallback")
+
+    def __init__(self, data, box, fallback=False):
+        self.data = data
+        self.box = box
+        self.fallback = fallback
+
+    def __len__(self):
+        return len(self.data)
+
+def split_crop(image_data):
+    """(encoded bytes, crop box or None) for a frame that may carry a crop"""
+    if isinstance(image_data, CroppedFrame):
+        return image_data.data, image_data.box
+    return image_data, None
+
+def parse_crop_box(value):
+    """Normalized (x, y, w, h) from "x,y,w,h" or a 4-item list - ValueError if invalid"""
+    if isinstance(value, str):
+        value = value.split(",")
+    try:
+        parts = [float(part) for part in value]
+    except (TypeError, ValueError):
+        # Not iterable, or a part that isn't a number ("a", None, [1, 2])
+        parts = None
+    if parts is None or len(parts) != 4:
+        raise ValueError("crop must be four numbers x,y,w,h")
+    x, y, w, h = parts
+    if not (0.0 <= x < 1.0 and 0.0 <= y < 1.0 and 0.0 < w <= 1.0 and 0.0 < h <= 1.0
+            and x + w <= 1.0 + 1e-6 and y + h <= 1.0 + 1e-6):
+        raise ValueError("crop must be normalized x,y,w,h inside the frame")
+    return (x, y, w, h)
+
+# JPEG start-of-frame markers (baseline, progressive, ...) - not DHT/JPG/DAC
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+def image_size(data):
+    """(width, height) read from a JPEG or PNG header without decoding, else None"""
+    view = memoryview(data).cast("B") if not isinstance(data, (bytes, bytearray)) else data
+    if len(view) >= 24 and bytes(view[:8]) == b"\x89PNG\r\n\x1a\n":
+        return (int.from_bytes(view[16:20], "big"), int.from_bytes(view[20:24], "big"))
+    if len(view) < 4 or view[0] != 0xFF or view[1] != 0xD8:
+        return None
+
+    # Walk the JPEG segments up to the start-of-frame header
+    position = 2
+    while position + 9 < len(view):
+        if view[position] != 0xFF:
+            return None
+        marker = view[position + 1]
+        if marker == 0xFF:
+            position += 1
+            continue
+        if marker in _JPEG_SOF_MARKERS:
+            height = int.from_bytes(view[position + 5:position + 7], "big")
+            width = int.from_bytes(view[position + 7:position + 9], "big")
+            return (width, height)
+        position += 2 + int.from_bytes(view[position + 2:position + 4], "big")
+    return None
+
+class FrameDecoder:
+    """Decodes frames straight to a detector's working resolution, in RGB.
+
+    JPEGs are scaled down by 2/4/8 inside the decoder (DCT-domain scaling via
+    IMREAD_REDUCED_COLOR_*) to the smallest size that still covers max_side,
+    an optional crop box is taken as a view, and the final resize and
+    BGR->RGB conversion are written into buffers that are reused across
+    calls. Not thread-safe (see thread_local_decoder); the returned array is
+    overwritten by the next decode of the same output size.
+    """
+
+    def __init__(self, max_side=256, max_buffers=4):
+        self.max_side = int(max_side)
+        self.max_buffers = max(1, int(max_buffers))
+        self._buffers = {}
+
+    def _buffer(self, shape):
+        import numpy as np
+
+        buffer = self._buffers.pop(shape, None)
+        if buffer is None:
+            if len(self._buffers) >= self.max_buffers:
+                # Drop the least recently used size
+                self._buffers.pop(next(iter(self._buffers)))
+            buffer = np.empty(shape, dtype=np.uint8)
+        self._buffers[shape] = buffer
+        return buffer
+
+    def reduction_for(self, size, box, max_side):
+        """Largest DCT reduction (1, 2, 4, 8) that keeps the crop at least max_side"""
+        if size is None or max_side <= 0:
+            return 1
+        _, _, box_w, box_h = box
+        needed = max(size[0] * box_w, size[1] * box_h)
+        for reduction in (8, 4, 2):
+            if needed / reduction >= max_side:
+                return reduction
+        return 1
+
+    def decode(self, image_data, max_side=None, crop=None):
+        """Decode to RGB no larger than max_side - returns (rgb, region) or (None, None)
+
+        region is the decoded area as normalized (x, y, w, h) of the full
+        frame, for mapping detections on a crop back to frame coordinates.
+        """
+        try:
+            import cv2
+            import numpy as np
+        except ImportError:
+            return None, None
+
+        data, frame_crop = split_crop(image_data)
+        box = crop or frame_crop or (0.0, 0.0, 1.0, 1.0)
+        max_side = self.max_side if max_side is None else int(max_side)
+        if data is None or len(data) == 0:
+            return None, None
+
+        flags = {
+            1: cv2.IMREAD_COLOR,
+            2: cv2.IMREAD_REDUCED_COLOR_2,
+            4: cv2.IMREAD_REDUCED_COLOR_4,
+            8: cv2.IMREAD_REDUCED_COLOR_8,
+        }
+        reduction = self.reduction_for(image_size(data), box, max_side)
+        image = cv2.imdecode(np.frombuffer(data, dtype=np.uint8), flags[reduction])
+        if image is None:
+            return None, None
+
+        # Crop as a view of the decoded image - no copy
+        height, width = image.shape[:2]
+        x0 = min(width - 1, int(box[0] * width))
+        y0 = min(height - 1, int(box[1] * height))
+        x1 = max(x0 + 1, min(width, int(round((box[0] + box[2]) * width))))
+        y1 = max(y0 + 1, min(height, int(round((box[1] + box[3]) * height))))
+        view = image[y0:y1, x0:x1]
+        region = (x0 / width, y0 / height, (x1 - x0) / width, (y1 - y0) / height)
+
+        crop_h, crop_w = view.shape[:2]
+        scale = max_side / max(crop_w, crop_h) if max_side > 0 else 1.0
+        if scale < 1.0:
+            out_w = max(1, int(round(crop_w * scale)))
+            out_h = max(1, int(round(crop_h * scale)))
+            rgb = self._buffer((out_h, out_w, 3))
+            cv2.resize(view, (out_w, out_h), dst=rgb, interpolation=cv2.INTER_AREA)
+            # Channel swap in place in the same buffer
+            cv2.cvtColor(rgb, cv2.COLOR_BGR2RGB, dst=rgb)
+        else:
+            rgb = self._buffer((crop_h, crop_w, 3))
+            cv2.cvtColor(view, cv2.COLOR_BGR2RGB, dst=rgb)
+        return rgb, region
+
+_local = threading.local()
+
+def thread_local_decoder():
+    """Per-thread FrameDecoder, so concurrent callers never share buffers"""
+    decoder = getattr(_local, "decoder", None)
+    if decoder is None:
+        decoder = _local.decoder = FrameDecoder()
+    return decoder
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+LinguaSigna ML Server - Hand ROI Tracking
+Runs hand detection on a crop around where a session's hands last were
+
+Independent HTTP frames give MediaPipe no tracking state, so every frame
+would otherwise pay for a full-frame palm search. Signers stay mostly in
+place, so each session keeps the bounding box of the hands found in its
+last translated frame, and the next frame is decoded and searched only
+inside that box grown by a margin. Backends that report a "hand_box" in
+their results make this work; the crop is marked as a fallback crop, so a
+backend that finds nothing inside it retries the full frame. Full-frame
+detection also runs every redetect_every frames (to pick up a second hand
+entering the picture) and whenever the track is lost.
+"""
+
+import threading
+
+class HandTracker:
+    """Chooses the detection region for each session frame"""
+
+    def __init__(self, margin=0.5, redetect_every=15, min_side=0.25):
+        # Fraction of the hand box added on every side
+        self.margin = max(0.0, float(margin))
+        self.redetect_every = max(1, int(redetect_every))
+        # Smallest ROI side (normalized) so a fast hand can't leave it in one frame
+        self.min_side = min(1.0, max(0.0, float(min_side)))
+        self._lock = threading.Lock()
+
+        self.roi_frames = 0
+        self.full_frames = 0
+        self.lost = 0
+
+    def expand(self, box):
+        """Grow a normalized (x, y, w, h) hand box by the margin, clipped to the frame"""
+        x, y, w, h = box
+        w_out = min(1.0, max(w * (1.0 + 2.0 * self.margin), self.min_side))
+        h_out = min(1.0, max(h * (1.0 + 2.0 * self.margin), self.min_side))
+        x0 = min(max(0.0, x + w / 2.0 - w_out / 2.0), 1.0 - w_out)
+        y0 = min(max(0.0, y + h / 2.0 - h_out / 2.0), 1.0 - h_out)
+        return (x0, y0, w_out, h_out)
+
+    def roi(self, session, language):
+        """Crop box to detect in for this session's next frame, or None for the full frame"""
+        box = session.hand_box
+        tracked = (
+            box is not None
+            and session.hand_language == language
+            and session.hand_tracked_frames < self.redetect_every
+        )
+        with self._lock:
+            if tracked:
+                self.roi_frames += 1
+            else:
+                self.full_frames += 1
+        if not tracked:
+            return None
+        session.hand_tracked_frames += 1
+        return self.expand(box)
+
+    def record(self, session, language, roi, result):
+        """Update the session's track from a fresh result (roi is what roi() returned)"""
+        box = result.get("hand_box") if result else None
+        if box is None:
+            if session.hand_box is not None:
+                with self._lock:
+                    self.lost += 1
+            session.hand_box = None
+            return
+        if roi is None:
+            # A full-frame detection restarts the redetect countdown
+            session.hand_tracked_frames = 0
+        session.hand_box = tuple(box)
+        session.hand_language = language
+
+    def stats(self):
+        frames = self.roi_frames + self.full_frames
+        return {
+            "enabled": True,
+            "margin": self.margin,
+            "redetect_every": self.redetect_every,
+            "roi_frames": self.roi_frames,
+            "full_frames": self.full_frames,
+            "lost": self.lost,
+            "roi_rate": round(self.roi_frames / frames, 3) if frames else 0.0
+        }
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+LinguaSigna ML Server - Landmark Wire Format
+Compact binary encoding for hand landmarks sent by on-device detection
+
+A payload is a packed little-endian float32 array of shape
+(hands, 21, dims) with dims 2 (x, y) or 3 (x, y, z) - 168 or 252 bytes per
+hand. Several frames can share one payload; the X-Frame-Hands header then
+lists how many hands belong to each frame, in order (e.g. "1,2,0").
+"""
+
+LANDMARKS_PER_HAND = 21
+FLOAT32_BYTES = 4
+
+# Content type and headers for /translate/landmarks
+LANDMARK_CONTENT_TYPE = "application/x-landmarks-f32"
+DIMS_HEADER = "X-Landmark-Dims"
+FRAME_HANDS_HEADER = "X-Frame-Hands"
+
+class LandmarkFormatError(ValueError):
+    """Raised when a landmark payload doesn't match the wire format"""
+
+def parse_dims(value):
+    """Validate the X-Landmark-Dims header (defaults to 2)"""
+    if value in (None, ''):
+        return 2
+    try:
+        dims = int(value)
+    except ValueError:
+        raise LandmarkFormatError(f"Invalid landmark dims: {value}")
+    if dims not in (2, 3):
+        raise LandmarkFormatError(f"Landmark dims must be 2 or 3, got {dims}")
+    return dims
+
+def parse_frame_hands(value):
+    """Parse the X-Frame-Hands header into a list of per-frame hand counts"""
+    if value in (None, ''):
+        return None
+    try:
+        counts = [int(part) for part in value.split(',')]
+    except ValueError:
+        raise LandmarkFormatError(f"Invalid frame hand counts: {value}")
+    if any(count < 0 for count in counts):
+        raise LandmarkFormatError("Frame hand counts must not be negative")
+    return counts
+
+def decode_landmarks(body, dims=2):
+    """View a payload as a (hands, 21, dims) float32 array without copying"""
+    import numpy as np
+
+    hand_bytes = LANDMARKS_PER_HAND * dims * FLOAT32_BYTES
+    if len(body) % hand_bytes:
+        raise LandmarkFormatError(
+            f"Payload of {len(body)} bytes is not a whole number of "
+            f"{LANDMARKS_PER_HAND}x{dims} float32 hands"
+        )
+
+    hands = np.frombuffer(body, dtype='<f4').reshape(-1, LANDMARKS_PER_HAND, dims)
+    if not np.isfinite(hands).all():
+        raise LandmarkFormatError("Landmarks must be finite numbers")
+    return hands
+
+def split_frames(hands, frame_hands=None):
+    """Split decoded hands into per-frame views (no copies)"""
+    if frame_hands is None:
+        return [hands]
+    if sum(frame_hands) != len(hands):
+        raise LandmarkFormatError(
+            f"X-Frame-Hands adds up to {sum(frame_hands)} hands but payload has {len(hands)}"
+        )
+    frames = []
+    start = 0
+    for count in frame_hands:
+        frames.append(hands[start:start + count])
+        start += count
+    return frames
+
+def encode_landmarks(hands):
+    """Pack hand landmarks (nested lists or arrays) into the wire format"""
+    import numpy as np
+
+    array = np.asarray(hands, dtype='<f4')
+    if array.ndim == 2:
+        array = array[np.newaxis]
+    if array.ndim != 3 or array.shape[1] != LANDMARKS_PER_HAND or array.shape[2] not in (2, 3):
+        raise LandmarkFormatError(f"Expected (hands, 21, 2|3) landmarks, got {array.shape}")
+    return np.ascontiguousarray(array).tobytes()
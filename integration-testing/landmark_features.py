@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+LinguaSigna ML Server - Landmark Feature Extraction
+Vectorized hand features for whole batches of MediaPipe landmarks
+
+Input is any array shaped (..., 21, dims) - typically (batch, hands, 21, 2|3).
+Every hand is turned into one feature row:
+
+  - 21 * dims wrist-relative coordinates, scaled so the wrist to middle
+    finger knuckle distance is 1 (hand size and position invariant)
+  - 10 pairwise fingertip distances
+  - 15 finger joint angles in radians
+
+All work is done with whole-array NumPy operations into buffers that are
+allocated once and only grown when a larger batch arrives.
+"""
+
+import itertools
+import threading
+
+import numpy as np
+
+LANDMARKS_PER_HAND = 21
+WRIST = 0
+MIDDLE_MCP = 9
+FINGERTIPS = (4, 8, 12, 16, 20)
+FINGERTIP_PAIRS = tuple(itertools.combinations(FINGERTIPS, 2))
+
+# (previous, joint, next) landmark triplets along each finger
+JOINT_TRIPLETS = (
+    (0, 1, 2), (1, 2, 3), (2, 3, 4),          # thumb
+    (0, 5, 6), (5, 6, 7), (6, 7, 8),          # index
+    (0, 9, 10), (9, 10, 11), (10, 11, 12),    # middle
+    (0, 13, 14), (13, 14, 15), (14, 15, 16),  # ring
+    (0, 17, 18), (17, 18, 19), (18, 19, 20),  # pinky
+)
+
+_EPSILON = 1e-6
+
+def feature_size(dims=2):
+    """Length of one hand's feature row"""
+    return LANDMARKS_PER_HAND * dims + len(FINGERTIP_PAIRS) + len(JOINT_TRIPLETS)
+
+class LandmarkFeatureExtractor:
+    """Batch feature extractor with reusable scratch buffers.
+
+    Not thread-safe: each thread should use its own instance (see
+    thread_local_extractor). The array returned by extract() is a view of an
+    internal buffer and is overwritten by the next call unless `out` is given.
+    """
+
+    def __init__(self, dims=2, capacity=64):
+        if dims not in (2, 3):
+            raise ValueError(f"Landmark dims must be 2 or 3, got {dims}")
+        self.dims = dims
+        self.feature_size = feature_size(dims)
+
+        self._coord_end = LANDMARKS_PER_HAND * dims
+        self._dist_end = self._coord_end + len(FINGERTIP_PAIRS)
+
+        self._pair_a = np.array([a for a, _ in FINGERTIP_PAIRS])
+        self._pair_b = np.array([b for _, b in FINGERTIP_PAIRS])
+        self._joint_prev = np.array([a for a, _, _ in JOINT_TRIPLETS])
+        self._joint_mid = np.array([b for _, b, _ in JOINT_TRIPLETS])
+        self._joint_next = np.array([c for _, _, c in JOINT_TRIPLETS])
+
+        self.capacity = 0
+        self._allocate(max(1, int(capacity)))
+
+    def _allocate(self, capacity):
+        pairs = len(FINGERTIP_PAIRS)
+        joints = len(JOINT_TRIPLETS)
+        dims = self.dims
+
+        self._out = np.empty((capacity, self.feature_size), dtype=np.float32)
+        self._scale = np.empty((capacity,), dtype=np.float32)
+        self._pair_first = np.empty((capacity, pairs, dims), dtype=np.float32)
+        self._pair_second = np.empty((capacity, pairs, dims), dtype=np.float32)
+        self._joint_mid_pts = np.empty((capacity, joints, dims), dtype=np.float32)
+        self._vec_in = np.empty((capacity, joints, dims), dtype=np.float32)
+        self._vec_out = np.empty((capacity, joints, dims), dtype=np.float32)
+        self._dot = np.empty((capacity, joints), dtype=np.float32)
+        self._norm_in = np.empty((capacity, joints), dtype=np.float32)
+        self._norm_out = np.empty((capacity, joints), dtype=np.float32)
+        self.capacity = capacity
+
+    def _ensure_capacity(self, hands):
+        if hands > self.capacity:
+            # Grow geometrically so a slowly rising batch size doesn't reallocate every call
+            self._allocate(max(hands, self.capacity * 2))
+
+    def extract(self, landmarks, out=None):
+        """Features for every hand in a (..., 21, dims) array -> (..., feature_size)"""
+        landmarks = np.asarray(landmarks, dtype=np.float32)
+        if landmarks.ndim < 2 or landmarks.shape[-2:] != (LANDMARKS_PER_HAND, self.dims):
+            raise ValueError(
+                f"Expected (..., {LANDMARKS_PER_HAND}, {self.dims}) landmarks, got {landmarks.shape}"
+            )
+
+        leading = landmarks.shape[:-2]
+        hands = landmarks.reshape(-1, LANDMARKS_PER_HAND, self.dims)
+        count = hands.shape[0]
+        self._ensure_capacity(count)
+
+        if out is None:
+            features = self._out[:count]
+        else:
+            features = out.reshape(count, self.feature_size)
+
+        # Wrist-relative coordinates, written straight into the output rows
+        coords = features[:, :self._coord_end].reshape(count, LANDMARKS_PER_HAND, self.dims)
+        np.subtract(hands, hands[:, WRIST:WRIST + 1, :], out=coords)
+
+        # Scale normalization by wrist -> middle knuckle length
+        scale = self._scale[:count]
+        knuckle = coords[:, MIDDLE_MCP, :]
+        np.einsum('nd,nd->n', knuckle, knuckle, out=scale)
+        np.sqrt(scale, out=scale)
+        np.maximum(scale, _EPSILON, out=scale)
+        np.divide(coords, scale[:, None, None], out=coords)
+
+        # Pairwise fingertip distances
+        distances = features[:, self._coord_end:self._dist_end]
+        first = self._pair_first[:count]
+        second = self._pair_second[:count]
+        np.take(coords, self._pair_a, axis=1, out=first)
+        np.take(coords, self._pair_b, axis=1, out=second)
+        np.subtract(first, second, out=first)
+        np.einsum('npd,npd->np', first, first, out=distances)
+        np.sqrt(distances, out=distances)
+
+        # Joint angles: angle at the middle point of each triplet
+        angles = features[:, self._dist_end:]
+        mid = self._joint_mid_pts[:count]
+        vec_in = self._vec_in[:count]
+        vec_out = self._vec_out[:count]
+        np.take(coords, self._joint_mid, axis=1, out=mid)
+        np.take(coords, self._joint_prev, axis=1, out=vec_in)
+        np.take(coords, self._joint_next, axis=1, out=vec_out)
+        np.subtract(vec_in, mid, out=vec_in)
+        np.subtract(vec_out, mid, out=vec_out)
+
+        dot = self._dot[:count]
+        norm_in = self._norm_in[:count]
+        norm_out = self._norm_out[:count]
+        np.einsum('njd,njd->nj', vec_in, vec_out, out=dot)
+        np.einsum('njd,njd->nj', vec_in, vec_in, out=norm_in)
+        np.einsum('njd,njd->nj', vec_out, vec_out, out=norm_out)
+        np.multiply(norm_in, norm_out, out=norm_in)
+        np.sqrt(norm_in, out=norm_in)
+        np.maximum(norm_in, _EPSILON, out=norm_in)
+        np.divide(dot, norm_in, out=dot)
+        np.clip(dot, -1.0, 1.0, out=dot)
+        np.arccos(dot, out=angles)
+
+        return features.reshape(leading + (self.feature_size,))
+
+_local = threading.local()
+
+def thread_local_extractor(dims=2):
+    """Per-thread extractor, so concurrent callers never share scratch buffers"""
+    extractors = getattr(_local, "extractors", None)
+    if extractors is None:
+        extractors = _local.extractors = {}
+    extractor = extractors.get(dims)
+    if extractor is None:
+        extractor = extractors[dims] = LandmarkFeatureExtractor(dims)
+    return extractor
+
+def extract_features(landmarks):
+    """Convenience wrapper returning a fresh (caller-owned) feature array"""
+    landmarks = np.asarray(landmarks, dtype=np.float32)
+    extractor = thread_local_extractor(landmarks.shape[-1])
+    return extractor.extract(landmarks).copy()
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+LinguaSigna ML Server - Per-Language Routing
+Gives every sign language its own translator, queue and admission control
+
+With one shared translator a burst of GSL frames queues up in front of ASL
+users. A LanguageRouter instead keeps one lane per language: a backend
+loaded with only that language's vocabulary (languages=[language] is passed
+to the backend factory), either in-process behind its own micro-batcher or
+as its own worker pool, plus its own admission controller. Frames are
+dispatched by their language field, so each lane fills, batches and sheds
+load independently, and /status reports every lane separately.
+
+Lanes load independently too: a language that is slow to load (or fails)
+doesn't hold up the others, and add_language() starts a new lane in a
+running server without touching the existing ones (POST /admin/languages,
+see translation_service.add_language).
+
+Enable with ML_LANGUAGE_WORKERS (e.g. "asl=2,gsl=1"). The router stands in
+for both the translator backend and the micro-batcher, like the worker pool.
+"""
+
+import threading
+import time
+
+from admission import AdmissionController
+from batching import MicroBatcher
+from translator_backends import TranslatorBackend, available_backends
+from worker_pool import WorkerPool
+
+class LanguageLane:
+    """One language's backend, batcher (or worker pool) and admission control"""
+
+    def __init__(self, language, backend, batcher, admission=None):
+        self.language = language
+        self.backend = backend
+        self.batcher = batcher
+        self.admission = admission
+
+    def start(self):
+        self.batcher.start()
+
+    def stop(self):
+        self.batcher.stop()
+
+    def stats(self):
+        return {
+            "backend": self.backend.stats(),
+            "batching": self.batcher.stats() if self.batcher is not self.backend else {"enabled": False},
+            "admission": self.admission.stats() if self.admission is not None else {"enabled": False}
+        }
+
+class LanguageRouter:
+    """Dispatches frames to per-language lanes by their language"""
+
+    def __init__(self, backend_name="mock", languages=("asl", "gsl"), workers=None, default_workers=0,
+                 max_batch=16, max_wait_ms=5.0, pool_options=None, admission_options=None):
+        self.name = backend_name
+        self.workers = dict(workers or {})
+        self.default_workers = int(default_workers)
+        self.max_size = max(1, int(max_batch))
+        self.max_wait_ms = max_wait_ms
+        self.pool_options = dict(pool_options or {})
+        self.admission_options = admission_options
+        self._lock = threading.Lock()
+        self._started = False
+        self._warming = False
+        self.lanes = {}
+        for language in languages:
+            self.lanes[language] = self._build_lane(language)
+
+    def _build_lane(self, language):
+        processes = self.workers.get(language, self.default_workers)
+        options = {"languages": [language]}
+        if processes > 0:
+            backend = batcher = WorkerPool(
+                self.name, processes=processes, max_batch=self.max_size,
+                backend_options=options, label=language, **self.pool_options
+            )
+        else:
+            backend = TranslatorBackend(self.name, options)
+            batcher = MicroBatcher(backend, max_size=self.max_size, max_wait_ms=self.max_wait_ms)
+        admission = (AdmissionController(**self.admission_options)
+                     if self.admission_options is not None else None)
+        return LanguageLane(language, backend, batcher, admission)
+
+    def languages(self):
+        return list(self.lanes)
+
+    def lane(self, language):
+        try:
+            return self.lanes[language]
+        except KeyError:
+            raise ValueError(f"No translator lane for language: {language}")
+
+    def add_language(self, language, processes=None):
+        """Open a lane for a new language while the others keep serving - returns the lane"""
+        with self._lock:
+            if language in self.lanes:
+                return self.lanes[language]
+            if processes is not None:
+                self.workers[language] = int(processes)
+            lane = self._build_lane(language)
+            # Bring it up the same way the existing lanes were
+            if self._warming:
+                lane.backend.start_warm_up()
+            if self._started:
+                lane.start()
+            self.lanes = dict(self.lanes, **{language: lane})
+        print(f"🌐 Added {language.upper()} lane ({self.workers.get(language, self.default_workers)} worker processes)")
+        return lane
+
+    # Translator / batcher interface
+
+    def start(self):
+        """Start every lane's batcher or worker pool (idempotent)"""
+        self._started = True
+        for lane in list(self.lanes.values()):
+            lane.start()
+
+    def start_warm_up(self):
+        """Load every lane's backend in the background"""
+        self._warming = True
+        for lane in list(self.lanes.values()):
+            lane.backend.start_warm_up()
+
+    def load(self):
+        for lane in list(self.lanes.values()):
+            lane.backend.load()
+
+    def stop(self):
+        self._started = False
+        for lane in list(self.lanes.values()):
+            lane.stop()
+
+    def submit(self, image_data, language="asl"):
+        return self.lane(language).batcher.submit(image_data, language)
+
+    def translate(self, image_data, language="asl"):
+        return self.lane(language).backend.translate(image_data, language)
+
+    def translate_batch(self, frames):
+        """Translate a mixed-language batch, one translate_batch() call per lane"""
+        by_language = {}
+        for index, (_, language) in enumerate(frames):
+            by_language.setdefault(language, []).append(index)
+        results = [None] * len(frames)
+        for language, indices in by_language.items():
+            lane_results = self.lane(language).backend.translate_batch([frames[index] for index in indices])
+            for index, result in zip(indices, lane_results):
+                results[index] = result
+        return results
+
+    def queue_depth(self):
+        """Frames waiting in every lane's batcher or worker pool"""
+        return sum(lane.batcher.queue_depth() for lane in list(self.lanes.values()))
+
+    # Readiness - the router serves as soon as any lane does; requests for a
+    # language whose lane is still loading are turned away per language
+
+    @property
+    def state(self):
+        states = [lane.backend.state for lane in list(self.lanes.values())]
+        if "ready" in states:
+            return "ready"
+        if states and all(state == "failed" for state in states):
+            return "failed"
+        if all(state == "unloaded" for state in states):
+            return "unloaded"
+        return "loading"
+
+    @property
+    def error(self):
+        errors = [f"{lane.language}: {lane.backend.error}" for lane in list(self.lanes.values())
+                  if lane.backend.error]
+        return "; ".join(errors) or None
+
+    def is_ready(self):
+        return self.state == "ready"
+
+    def wait_ready(self, timeout=None):
+        """Block until every lane has finished loading (or the timeout passes) - True if any is ready"""
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        for lane in list(self.lanes.values()):
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            lane.backend.wait_ready(remaining)
+        return self.is_ready()
+
+    def stats(self):
+        """Router state plus backend, batching and admission counters per language"""
+        return {
+            "name": self.name,
+            "state": self.state,
+            "ready": self.is_ready(),
+            "error": self.error,
+            "available": available_backends(),
+            "mode": "per_language",
+            "languages": {language: lane.stats() for language, lane in list(self.lanes.items())}
+        }
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+LinguaSigna ML Server - MediaPipe Translator Backend
+The guide's real pipeline: MediaPipe hand detection feeding the translator
+
+Select with ML_TRANSLATOR_BACKEND=mediapipe. Needs:
+    pip install mediapipe opencv-python
+"""
+
+import threading
+import time
+
+import ml_config
+from frame_decoder import CroppedFrame, thread_local_decoder
+from sign_translator import SimpleSignTranslator
+
+class MediaPipeSignTranslator(SimpleSignTranslator):
+    """Detects hands with MediaPipe, then translates the landmarks"""
+
+    # Longest side frames are decoded to before detection (the palm detector
+    # itself runs at 192x192, so bigger frames only cost decode time)
+    decode_max_side = 256
+
+    def __init__(self, max_num_hands=2, min_detection_confidence=0.7, languages=None):
+        super().__init__(languages=languages)
+        # Heavy imports happen here, on the warm-up thread - not at server import
+        import cv2
+        import mediapipe as mp
+        import numpy as np
+
+        self._cv2 = cv2
+        self._np = np
+        # One graph serves every session and ROI crop, so nothing may carry
+        # over between calls: static mode runs palm detection on every frame
+        # instead of tracking from the previous (unrelated) one
+        self.hands = mp.solutions.hands.Hands(
+            static_image_mode=True,
+            max_num_hands=max_num_hands,
+            min_detection_confidence=min_detection_confidence
+        )
+        # MediaPipe graphs aren't safe to call from several threads at once
+        self._detect_lock = threading.Lock()
+
+    def warm_up(self):
+        """Run one blank frame through the graph so the first request isn't slow"""
+        blank = self._np.zeros((256, 256, 3), dtype=self._np.uint8)
+        with self._detect_lock:
+            self.hands.process(blank)
+
+    def decode_size(self, language):
+        """Decode resolution for a language: per-language setting, global setting, backend default"""
+        return (ml_config.DECODE_MAX_SIDE_BY_LANGUAGE.get(language)
+                or ml_config.DECODE_MAX_SIDE
+                or self.decode_max_side)
+
+    def find_hands(self, image_data, language="asl", timings=None):
+        """Decode a frame (and its crop box, if any) and return a (hands, 21, 2) landmark array
+
+        Landmarks are in normalized coordinates of the full frame, even
+        when only a crop was decoded. A fallback crop (a tracked hand
+        region) that turns up no hands is retried on the full frame.
+        Decode and detection milliseconds are added to `timings` if given.
+        """
+        np = self._np
+        timings = {} if timings is None else timings
+
+        empty = np.empty((0, 21, 2), dtype=np.float32)
+        if image_data is None or len(image_data) == 0:
+            return empty
+        decoder = thread_local_decoder()
+        started = time.perf_counter()
+        rgb_image, region = decoder.decode(image_data, self.decode_size(language))
+        started = _add_ms(timings, "decode", started)
+        if rgb_image is None:
+            return empty
+
+        with self._detect_lock:
+            results = self.hands.process(rgb_image)
+        started = _add_ms(timings, "detect", started)
+        if not results.multi_hand_landmarks and isinstance(image_data, CroppedFrame) and image_data.fallback:
+            # Hands left the tracked region - search the whole frame
+            rgb_image, region = decoder.decode(image_data.data, self.decode_size(language))
+            started = _add_ms(timings, "decode", started)
+            with self._detect_lock:
+                results = self.hands.process(rgb_image)
+            _add_ms(timings, "detect", started)
+        if not results.multi_hand_landmarks:
+            return empty
+
+        hands = np.array(
+            [[(point.x, point.y) for point in hand.landmark] for hand in results.multi_hand_landmarks],
+            dtype=np.float32
+        )
+        # Crop-relative -> full-frame coordinates
+        x, y, w, h = region
+        hands *= np.array([w, h], dtype=np.float32)
+        hands += np.array([x, y], dtype=np.float32)
+        return hands
+
+    def hand_box(self, hands):
+        """Normalized (x, y, w, h) around every detected hand, for session ROI tracking"""
+        if hands.shape[0] == 0:
+            return None
+        low = self._np.clip(hands.min(axis=(0, 1)), 0.0, 1.0)
+        high = self._np.clip(hands.max(axis=(0, 1)), 0.0, 1.0)
+        return [round(float(value), 4) for value in (low[0], low[1], high[0] - low[0], high[1] - low[1])]
+
+    def translate_batch(self, frames):
+        """Detect hands in image frames, then translate every frame's landmarks
+
+        Every result carries the batch's decode / detect / classify
+        milliseconds as "stage_ms" and the batch size as "stage_frames";
+        the server charges each frame its share of "inference".
+        """
+        timings = {}
+        detected = []
+        boxes = []
+        for image_data, language in frames:
+            if self._is_landmarks(image_data):
+                boxes.append(None)
+            else:
+                image_data = self.find_hands(image_data, language, timings)
+                boxes.append(self.hand_box(image_data))
+            detected.append((image_data, language))
+        started = time.perf_counter()
+        results = self._translate_frames(detected)
+        _add_ms(timings, "classify", started)
+        for result, box, (hands, _) in zip(results, boxes, detected):
+            if result:
+                result["stage_ms"] = timings
+                result["stage_frames"] = len(frames)
+            if result and box is not None:
+                result["hand_box"] = box
+                # Detected landmarks feed the session's sequence window
+                result["hands"] = hands
+        return results
+
+def _add_ms(timings, name, started):
+    """Add the milliseconds since `started` to timings[name] - returns the new start"""
+    now = time.perf_counter()
+    timings[name] = timings.get(name, 0.0) + (now - started) * 1000.0
+    return now
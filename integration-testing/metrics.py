@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+LinguaSigna ML Server - Metrics
+Per-request stage timing and in-process latency histograms
+
+Each request gets a RequestTimer that records how long every pipeline
+stage took (read, base64_decode, cache_lookup, queue_wait, inference,
+serialize, ...). Timings go back to the client in the response body and a
+Server-Timing header, and are folded into histograms that /metrics
+exposes in Prometheus text format.
+
+Backends that time their own decode / detect / classify steps have those
+split out of inference. A backend times a whole batch, so each request
+is charged its frames' share of the batch time, not the full batch - the
+stage histograms then add up to the real backend time. Server-Timing
+marks those stages with desc="batch share".
+"""
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+# Histogram bucket upper bounds in seconds
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Quantiles reported from each histogram's recent-observation window
+QUANTILES = (0.5, 0.9, 0.99)
+
+# Completed requests kept (with their finish time) for time-windowed quantiles
+RECENT_REQUESTS = 4096
+
+class LatencyHistogram:
+    """Cumulative bucket counts plus a sliding window for quantiles"""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS, window=2048):
+        self.buckets = tuple(buckets)
+        self.bucket_counts = [0] * len(self.buckets)
+        self.count = 0
+        self.total = 0.0
+        self.recent = deque(maxlen=window)
+
+    def observe(self, seconds):
+        self.count += 1
+        self.total += seconds
+        self.recent.append(seconds)
+        for index, bound in enumerate(self.buckets):
+            if seconds <= bound:
+                self.bucket_counts[index] += 1
+                break
+
+    def quantile(self, q):
+        """Quantile over the recent window (0.0 when empty)"""
+        if not self.recent:
+            return 0.0
+        ordered = sorted(self.recent)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+class NullTimer:
+    """Stand-in when a caller doesn't track timings"""
+
+    @contextmanager
+    def stage(self, name):
+        yield
+
+    def add(self, name, milliseconds):
+        pass
+
+    def split(self, name, parts, description=None):
+        pass
+
+    def fail(self, error):
+        pass
+
+    def elapsed_ms(self):
+        return 0.0
+
+    def timings_ms(self):
+        return {}
+
+NULL_TIMER = NullTimer()
+
+class RequestTimer:
+    """Stage timings for one request"""
+
+    def __init__(self, registry, endpoint):
+        self.registry = registry
+        self.endpoint = endpoint
+        self.started = time.perf_counter()
+        self.stages = {}
+        self.descriptions = {}
+        self.error_type = None
+        self._finished = False
+
+    @contextmanager
+    def stage(self, name):
+        """Time a block as the named stage (repeated stages accumulate)"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, (time.perf_counter() - started) * 1000.0)
+
+    def add(self, name, milliseconds):
+        """Record a stage duration measured elsewhere (e.g. in the batcher)"""
+        self.stages[name] = self.stages.get(name, 0.0) + milliseconds
+
+    def split(self, name, parts, description=None):
+        """Move sub-stages timed inside `name` (e.g. by the backend) out into stages of their own"""
+        for part, milliseconds in parts.items():
+            self.add(part, milliseconds)
+            if description:
+                self.descriptions[part] = description
+        self.stages[name] = max(0.0, self.stages.get(name, 0.0) - sum(parts.values()))
+
+    def elapsed_ms(self):
+        return (time.perf_counter() - self.started) * 1000.0
+
+    def timings_ms(self):
+        return {name: round(ms, 3) for name, ms in self.stages.items()}
+
+    def server_timing(self):
+        """Value for the Server-Timing response header"""
+        parts = [
+            f'{name};dur={ms:.3f};desc="{self.descriptions[name]}"' if name in self.descriptions
+            else f"{name};dur={ms:.3f}"
+            for name, ms in self.stages.items()
+        ]
+        parts.append(f"total;dur={self.elapsed_ms():.3f}")
+        return ", ".join(parts)
+
+    def fail(self, error):
+        """Mark the request as failed with an exception or error type name"""
+        self.error_type = error if isinstance(error, str) else type(error).__name__
+
+    def finish(self, status_code):
+        """Fold this request into the registry (only the first call counts)"""
+        if self._finished:
+            return
+        self._finished = True
+        self.registry.record(self, status_code)
+
+class MetricsRegistry:
+    """Thread-safe request counters, in-flight gauge and latency histograms"""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self._stage_histograms = {}
+        self._request_histograms = {}
+        self._requests = {}
+        self._errors = {}
+        # (finished monotonic time, seconds) of the latest requests, any endpoint
+        self._completed = deque(maxlen=RECENT_REQUESTS)
+        self.in_flight = 0
+
+    def start(self, endpoint):
+        """Begin timing a request - pair with RequestTimer.finish()"""
+        with self._lock:
+            self.in_flight += 1
+        return RequestTimer(self, endpoint)
+
+    def record(self, timer, status_code):
+        total = timer.elapsed_ms() / 1000.0
+        error_type = timer.error_type
+        if error_type is None and status_code >= 400:
+            error_type = "client_error" if status_code < 500 else "server_error"
+
+        with self._lock:
+            self.in_flight -= 1
+            key = (timer.endpoint, str(status_code))
+            self._requests[key] = self._requests.get(key, 0) + 1
+            if error_type:
+                self._errors[error_type] = self._errors.get(error_type, 0) + 1
+
+            histogram = self._request_histograms.get(timer.endpoint)
+            if histogram is None:
+                histogram = self._request_histograms[timer.endpoint] = LatencyHistogram(self.buckets)
+            histogram.observe(total)
+            self._completed.append((time.monotonic(), total))
+
+            for name, ms in timer.stages.items():
+                histogram = self._stage_histograms.get(name)
+                if histogram is None:
+                    histogram = self._stage_histograms[name] = LatencyHistogram(self.buckets)
+                histogram.observe(ms / 1000.0)
+
+    def recent_latencies(self, window_s):
+        """Latencies (seconds) of requests that finished in the last window_s seconds"""
+        since = time.monotonic() - window_s
+        with self._lock:
+            completed = list(self._completed)
+        return [seconds for finished, seconds in completed if finished >= since]
+
+    def record_error(self, error_type):
+        """Count an error that happened outside a timed request (dropped stream frames, probe samples)"""
+        with self._lock:
+            self._errors[error_type] = self._errors.get(error_type, 0) + 1
+
+    def snapshot(self):
+        """Percentiles per stage and endpoint, for JSON status output"""
+        with self._lock:
+            def summarize(histogram):
+                return {
+                    "count": histogram.count,
+                    "p50_ms": round(histogram.quantile(0.5) * 1000.0, 3),
+                    "p90_ms": round(histogram.quantile(0.9) * 1000.0, 3),
+                    "p99_ms": round(histogram.quantile(0.99) * 1000.0, 3)
+                }
+            return {
+                "in_flight": self.in_flight,
+                "endpoints": {name: summarize(h) for name, h in self._request_histograms.items()},
+                "stages": {name: summarize(h) for name, h in self._stage_histograms.items()},
+                "errors": dict(self._errors)
+            }
+
+    def render_prometheus(self):
+        """All metrics in Prometheus text exposition format"""
+        lines = []
+        with self._lock:
+            lines.append("# HELP ml_requests_in_flight Requests currently being processed")
+            lines.append("# TYPE ml_requests_in_flight gauge")
+            lines.append(f"ml_requests_in_flight {self.in_flight}")
+
+            lines.append("# HELP ml_requests_total Completed requests by endpoint and status")
+            lines.append("# TYPE ml_requests_total counter")
+            for (endpoint, status), count in sorted(self._requests.items()):
+                lines.append(f'ml_requests_total{{endpoint="{endpoint}",status="{status}"}} {count}')
+
+            lines.append("# HELP ml_errors_total Errors by type")
+            lines.append("# TYPE ml_errors_total counter")
+            for error_type, count in sorted(self._errors.items()):
+                lines.append(f'ml_errors_total{{type="{error_type}"}} {count}')
+
+            self._render_histograms(lines, "ml_request_duration_seconds",
+                                    "End-to-end request latency", "endpoint",
+                                    self._request_histograms)
+            self._render_histograms(lines, "ml_stage_duration_seconds",
+                                    "Latency of each pipeline stage", "stage",
+                                    self._stage_histograms)
+        return "\n".join(lines) + "\n"
+
+    def _render_histograms(self, lines, name, help_text, label, histograms):
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} histogram")
+        for key, histogram in sorted(histograms.items()):
+            cumulative = 0
+            for bound, count in zip(histogram.buckets, histogram.bucket_counts):
+                cumulative += count
+                lines.append(f'{name}_bucket{{{label}="{key}",le="{bound}"}} {cumulative}')
+            lines.append(f'{name}_bucket{{{label}="{key}",le="+Inf"}} {histogram.count}')
+            lines.append(f'{name}_sum{{{label}="{key}"}} {histogram.total:.6f}')
+            lines.append(f'{name}_count{{{label}="{key}"}} {histogram.count}')
+
+        # Recent-window quantiles as a separate gauge family
+        lines.append(f"# HELP {name}_quantile {help_text} (recent-window quantiles)")
+        lines.append(f"# TYPE {name}_quantile gauge")
+        for key, histogram in sorted(histograms.items()):
+            for q in QUANTILES:
+                lines.append(
+                    f'{name}_quantile{{{label}="{key}",quantile="{q}"}} {histogram.quantile(q):.6f}'
+                )
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
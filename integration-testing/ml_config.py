@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+LinguaSigna ML Server - Configuration
+Tunable settings, overridable through environment variables
+"""
+
+import os
+
+def env_int(name, default):
+    """Read an integer setting from the environment"""
+    value = os.environ.get(name)
+    return int(value) if value not in (None, '') else default
+
+def env_float(name, default):
+    """Read a float setting from the environment"""
+    value = os.environ.get(name)
+    return float(value) if value not in (None, '') else default
+
+def env_bool(name, default):
+    """Read a boolean setting from the environment"""
+    value = os.environ.get(name)
+    if value in (None, ''):
+        return default
+    return value.strip().lower() in ('1', 'true', 'yes', 'on')
+
+def env_list(name, default):
+    """Read a comma-separated list (lowercased) from the environment"""
+    value = os.environ.get(name)
+    if value in (None, ''):
+        return list(default)
+    return [item.strip().lower() for item in value.split(',') if item.strip()]
+
+def env_int_map(name, default=None):
+    """Read "key=int,key=int" pairs (e.g. per-language settings) from the environment"""
+    value = os.environ.get(name)
+    result = dict(default or {})
+    for item in (value or '').split(','):
+        key, _, number = item.partition('=')
+        if key.strip() and number.strip():
+            result[key.strip().lower()] = int(number)
+    return result
+
+# Server
+HOST = os.environ.get('ML_HOST', '0.0.0.0')
+PORT = env_int('ML_PORT', 5000)
+
+# Languages accepted by the translate endpoints
+LANGUAGES = env_list('ML_LANGUAGES', ['asl', 'gsl'])
+
+# Per-language lanes (see language_router.py): each language gets its own
+# backend holding only its vocabulary, its own queue and admission control.
+# "asl=2,gsl=1" sizes each lane in worker processes (0 = in-process backend
+# with its own micro-batcher); a language listed here but not in
+# ML_LANGUAGES is added to it, and unlisted languages get ML_WORKER_PROCESSES.
+# More languages can be added to a running server with POST /admin/languages
+LANGUAGE_WORKERS = env_int_map('ML_LANGUAGE_WORKERS')
+LANGUAGES += [language for language in LANGUAGE_WORKERS if language not in LANGUAGES]
+LANGUAGE_ROUTING = env_bool('ML_LANGUAGE_ROUTING', bool(LANGUAGE_WORKERS))
+
+# Micro-batching: group concurrent frames into one translate_batch() call
+BATCH_ENABLED = env_bool('ML_BATCH_ENABLED', True)
+BATCH_MAX_SIZE = env_int('ML_BATCH_MAX_SIZE', 16)
+BATCH_MAX_WAIT_MS = env_float('ML_BATCH_MAX_WAIT_MS', 5.0)
+BATCH_RESULT_TIMEOUT_S = env_float('ML_BATCH_RESULT_TIMEOUT_S', 10.0)
+
+# ASGI serving mode (ml_server_asgi.py)
+ASGI_EXECUTOR_WORKERS = env_int('ML_ASGI_EXECUTOR_WORKERS', min(32, (os.cpu_count() or 1) + 4))
+
+# Pre-fork launcher (ml_server_prefork.py): one model load, N forked servers
+PREFORK_WORKERS = env_int('ML_PREFORK_WORKERS', os.cpu_count() or 1)
+# Server each worker runs: "flask" (threaded WSGI) or "asgi" (uvicorn)
+PREFORK_APP = os.environ.get('ML_PREFORK_APP', 'flask')
+PREFORK_BACKLOG = env_int('ML_PREFORK_BACKLOG', 4096)
+# Time a stopping worker gets to finish in-flight requests before SIGKILL
+PREFORK_GRACEFUL_TIMEOUT_S = env_float('ML_PREFORK_GRACEFUL_TIMEOUT_S', 30.0)
+# Time a replacement worker gets to start serving during a reload
+PREFORK_READY_TIMEOUT_S = env_float('ML_PREFORK_READY_TIMEOUT_S', 30.0)
+
+# Streaming translation sessions (WebSocket /ws/translate)
+SESSION_IDLE_TIMEOUT_S = env_float('ML_SESSION_IDLE_TIMEOUT_S', 60.0)
+SESSION_MAX_COUNT = env_int('ML_SESSION_MAX_COUNT', 10000)
+WS_MAX_IN_FLIGHT = env_int('ML_WS_MAX_IN_FLIGHT', 2)
+
+# Near-duplicate frame result cache
+CACHE_ENABLED = env_bool('ML_CACHE_ENABLED', True)
+CACHE_MAX_ENTRIES = env_int('ML_CACHE_MAX_ENTRIES', 1024)
+CACHE_TTL_S = env_float('ML_CACHE_TTL_S', 2.0)
+# Max differing bits (of 64) between image hashes that still count as a hit
+CACHE_HAMMING_THRESHOLD = env_int('ML_CACHE_HAMMING_THRESHOLD', 4)
+# Grid size landmarks are rounded to before hashing (normalized coordinates)
+CACHE_LANDMARK_QUANTUM = env_float('ML_CACHE_LANDMARK_QUANTUM', 0.01)
+
+# Motion gating: reuse a session's last translation while the signer is still
+MOTION_GATE_ENABLED = env_bool('ML_MOTION_GATE_ENABLED', True)
+# Mean thumbnail change (0-1) or landmark displacement below which a frame is "static"
+MOTION_THRESHOLD = env_float('ML_MOTION_THRESHOLD', 0.02)
+# Max consecutive frames that may reuse a result before a fresh translation
+MOTION_MAX_REUSE = env_int('ML_MOTION_MAX_REUSE', 5)
+
+# Hand ROI tracking: detect only around a session's last hand box
+HAND_TRACKING_ENABLED = env_bool('ML_HAND_TRACKING_ENABLED', True)
+# Fraction of the hand box added on each side of the detection crop
+HAND_TRACKING_MARGIN = env_float('ML_HAND_TRACKING_MARGIN', 0.5)
+# Force a full-frame detection after this many crop-only frames
+HAND_TRACKING_REDETECT_EVERY = env_int('ML_HAND_TRACKING_REDETECT_EVERY', 15)
+# Smallest crop side (fraction of the frame)
+HAND_TRACKING_MIN_SIDE = env_float('ML_HAND_TRACKING_MIN_SIDE', 0.25)
+
+# Dynamic sign recognition over a sliding window of each session's frames
+SEQUENCE_ENABLED = env_bool('ML_SEQUENCE_ENABLED', True)
+# Frames in the window (about one second at 30 fps)
+SEQUENCE_WINDOW = env_int('ML_SEQUENCE_WINDOW', 30)
+# Frames needed before the window is classified at all
+SEQUENCE_MIN_FRAMES = env_int('ML_SEQUENCE_MIN_FRAMES', 15)
+# Cosine similarity a window needs to be reported as a sign
+SEQUENCE_MIN_CONFIDENCE = env_float('ML_SEQUENCE_MIN_CONFIDENCE', 0.9)
+# Consecutive frames without hands before the window restarts
+SEQUENCE_MAX_GAP = env_int('ML_SEQUENCE_MAX_GAP', 5)
+# Directory of <language>.npz recorded signs; unset uses a synthetic vocabulary
+SEQUENCE_DIR = os.environ.get('ML_SEQUENCE_DIR', '')
+
+# Health and saturation probes (see probes.py)
+# Dedicated probe listener (/health/live, /health/ready, /health/load); 0 disables
+PROBE_PORT = env_int('ML_PROBE_PORT', PORT + 1)
+# How often the saturation snapshot behind the probes is rebuilt
+PROBE_REFRESH_MS = env_float('ML_PROBE_REFRESH_MS', 100.0)
+# Probe listener answers 503 "stale" when the server sent no sample for this long
+PROBE_STALE_S = env_float('ML_PROBE_STALE_S', 5.0)
+# Niceness for the probe listener process - negative ranks it ahead of inference
+# threads when cores are oversubscribed (needs CAP_SYS_NICE; ignored otherwise)
+PROBE_NICE = env_int('ML_PROBE_NICE', -5)
+# Requests finished within this window make up the reported p99
+PROBE_WINDOW_S = env_float('ML_PROBE_WINDOW_S', 10.0)
+# p99 at which latency alone puts the load score at 1.0
+LOAD_TARGET_P99_MS = env_float('ML_LOAD_TARGET_P99_MS', 500.0)
+
+# On-demand sampling profiler, GET /debug/profile (see profiler.py)
+# Off by default; also stays off until ML_PROFILER_TOKEN is set
+PROFILER_ENABLED = env_bool('ML_PROFILER_ENABLED', False)
+# Shared secret, sent as "Authorization: Bearer <token>" or X-Profiler-Token
+PROFILER_TOKEN = os.environ.get('ML_PROFILER_TOKEN', '')
+# Default stack samples per second (?rate= overrides, up to 1000)
+PROFILER_RATE_HZ = env_float('ML_PROFILER_RATE_HZ', 100.0)
+# Default and longest profile, in seconds (?seconds=)
+PROFILER_DEFAULT_SECONDS = env_float('ML_PROFILER_DEFAULT_SECONDS', 5.0)
+PROFILER_MAX_SECONDS = env_float('ML_PROFILER_MAX_SECONDS', 30.0)
+# Largest share of wall time the sampler may spend walking stacks
+PROFILER_MAX_OVERHEAD = env_float('ML_PROFILER_MAX_OVERHEAD', 0.02)
+
+# POST /admin/languages opens a lane for a new language in the running
+# server (needs ML_LANGUAGE_WORKERS); off until a token is set. Sent as
+# "Authorization: Bearer <token>" or X-Admin-Token
+ADMIN_TOKEN = os.environ.get('ML_ADMIN_TOKEN', '')
+
+# Translator backend (see translator_backends.py)
+TRANSLATOR_BACKEND = os.environ.get('ML_TRANSLATOR_BACKEND', 'mock')
+# "background" loads on a warm-up thread at startup, "lazy" on first request
+BACKEND_WARMUP = os.environ.get('ML_BACKEND_WARMUP', 'background')
+# How long a request waits for a still-loading backend before a 503
+BACKEND_READY_TIMEOUT_S = env_float('ML_BACKEND_READY_TIMEOUT_S', 2.0)
+
+# Template matching backend (see template_translator.py)
+# Directory of <language>.npz vocabularies; unset uses a synthetic vocabulary
+TEMPLATE_DIR = os.environ.get('ML_TEMPLATE_DIR', '')
+# Matches returned per frame (best + alternatives)
+TEMPLATE_TOP_K = env_int('ML_TEMPLATE_TOP_K', 3)
+# "brute" (one matrix product) or "kdtree" (needs scipy)
+TEMPLATE_INDEX = os.environ.get('ML_TEMPLATE_INDEX', 'brute')
+# Memory-mapped store of precomputed templates (model_store.py); wins over ML_TEMPLATE_DIR
+TEMPLATE_STORE = os.environ.get('ML_TEMPLATE_STORE', '')
+# How often a backend checks whether its store file was replaced
+MODEL_STORE_CHECK_S = env_float('ML_MODEL_STORE_CHECK_S', 1.0)
+
+# Inference worker processes (see worker_pool.py); 0 runs the translator in-process
+WORKER_PROCESSES = env_int('ML_WORKER_PROCESSES', 0)
+# Shared-memory frame slots - bigger frames fall back to the pipe
+WORKER_SLOT_BYTES = env_int('ML_WORKER_SLOT_BYTES', 1 << 20)
+# 0 = two full batches per worker
+WORKER_SLOTS = env_int('ML_WORKER_SLOTS', 0)
+WORKER_START_METHOD = os.environ.get('ML_WORKER_START_METHOD', 'spawn')
+
+# Admission control (see admission.py): bound queued work, newest frame per session wins
+ADMISSION_ENABLED = env_bool('ML_ADMISSION_ENABLED', True)
+# Frames allowed past admission (batching or running inference) at once
+ADMISSION_MAX_ACTIVE = env_int('ML_ADMISSION_MAX_ACTIVE', 2 * BATCH_MAX_SIZE)
+# Frames allowed to wait for admission before new ones get a 429
+ADMISSION_MAX_QUEUED = env_int('ML_ADMISSION_MAX_QUEUED', 64)
+ADMISSION_WAIT_TIMEOUT_S = env_float('ML_ADMISSION_WAIT_TIMEOUT_S', 5.0)
+# Retry-After seconds sent with 429 responses
+ADMISSION_RETRY_AFTER_S = env_int('ML_ADMISSION_RETRY_AFTER_S', 1)
+
+# Frame decoding (see frame_decoder.FrameDecoder): longest side, in pixels, that
+# image frames are decoded to for hand detection. 0 uses the backend's default;
+# ML_DECODE_MAX_SIDE_BY_LANGUAGE overrides per language, e.g. "asl=256,gsl=320"
+DECODE_MAX_SIDE = env_int('ML_DECODE_MAX_SIDE', 0)
+DECODE_MAX_SIDE_BY_LANGUAGE = env_int_map('ML_DECODE_MAX_SIDE_BY_LANGUAGE')
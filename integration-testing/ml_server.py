@@ -4,149 +4,214 @@ LinguaSigna ML Server - Simple Implementation for Integration Testing
 Based on our simplified guide
 """
 
-from flask import Flask, request, jsonify
-import base64
-import json
-import random
-import time
-from datetime import datetime
+from flask import Flask, Response, request
 
-app = Flask(__name__)
+import ml_config
+from landmark_codec import DIMS_HEADER, FRAME_HANDS_HEADER
+from metrics import PROMETHEUS_CONTENT_TYPE
+from serialization import encode, response_format
+from translation_service import (
+    LANGUAGE_HEADER,
+    batcher,
+    handle_translate,
+    handle_translate_binary,
+    handle_add_language,
+    handle_profile,
+    handle_translate_landmarks,
+    health_payload,
+    is_binary_upload,
+    is_multipart_upload,
+    metrics,
+    probe_monitor,
+    readiness_payload,
+    router,
+    session_options,
+    start_backend,
+    start_probes,
+    status_payload,
+    translator,
+)
 
-class SimpleSignTranslator:
-    def __init__(self):
-        self.asl_words = [
-            "Hello", "Thank you", "Please", "Sorry", "Yes", "No",
-            "Good morning", "How are you?", "Nice to meet you"
-        ]
-        self.gsl_words = [
-            "Akwaaba", "Medaase", "Mepa wo kyɛw", "Kafra", "Aane", "Daabi",
-            "Mema wo akye", "Wo ho te sɛn?", "Me ani agye"
-        ]
-    
-    def translate(self, image_data, language="asl"):
-        """Mock translation - returns random sign language word"""
-        # Simulate processing time
-        time.sleep(0.1)
-        
-        # Simple logic: if image_data exists, return translation
-        if image_data and len(image_data) > 10:  # Basic validation
-            words = self.asl_words if language == "asl" else self.gsl_words
-            translation = random.choice(words)
-            confidence = random.uniform(0.80, 0.95)
-            
-            return {
-                "text": translation,
-                "confidence": confidence,
-                "language": language,
-                "timestamp": datetime.now().isoformat()
-            }
-        else:
-            return None
+app = Flask(__name__)
 
-# Initialize translator
-translator = SimpleSignTranslator()
+def render(body, status_code=200):
+    """Encode a body in the format the client negotiated (JSON or MessagePack)"""
+    payload, content_type = encode(body, *response_format(request.headers, request.args))
+    response = Response(payload, status=status_code, content_type=content_type)
+    response.headers['Vary'] = 'Accept'
+    return response
 
 @app.route('/', methods=['GET'])
 def health():
     """Health check endpoint"""
-    return jsonify({
-        "status": "healthy",
-        "service": "LinguaSigna ML Server",
-        "timestamp": datetime.now().isoformat(),
-        "version": "1.0.0"
-    })
+    return render(health_payload())
 
 @app.route('/health', methods=['GET'])
 def health_check():
     """Alternative health check endpoint"""
     return health()
 
+@app.route('/health/live', methods=['GET'])
+def liveness():
+    """Liveness probe - the process is up and serving"""
+    return health()
+
+@app.route('/health/ready', methods=['GET'])
+def readiness():
+    """Readiness probe - 503 until the translator backend has loaded"""
+    body, status_code = readiness_payload()
+    return render(body, status_code)
+
+@app.route('/health/load', methods=['GET'])
+def load():
+    """Saturation probe - queue depth, in-flight, recent p99 and a 0-1 load score"""
+    return render(probe_monitor.snapshot())
+
+def timed_json(body, status_code, timer):
+    """Serialize a response, attach Server-Timing and close out the request metrics"""
+    with timer.stage("serialize"):
+        response = render(body, status_code)
+    response.headers['Server-Timing'] = timer.server_timing()
+    if status_code == 429:
+        response.headers['Retry-After'] = str(body.get('retry_after', 1))
+    timer.finish(status_code)
+    return response
+
+def internal_error(e, timer):
+    print(f"Translation error: {e}")
+    timer.fail(e)
+    return timed_json({
+        "success": False,
+        "error": f"Internal server error: {str(e)}"
+    }, 500, timer)
+
 @app.route('/translate', methods=['POST'])
 def translate_frame():
-    """Main translation endpoint"""
+    """Main translation endpoint
+    
+    Accepts {"image": <base64>, "language": ...} JSON, a raw image body
+    (language in the X-Language header or ?language=), or multipart with
+    an "image" file and a "language" field. A session id (JSON session_id
+    or X-Session-Id) turns on motion gating across that client's frames.
+    """
+    timer = metrics.start('/translate')
     try:
-        # Get request data
-        data = request.json
-        
-        if not data:
-            return jsonify({
-                "success": False,
-                "error": "No JSON data provided"
-            }), 400
-        
-        # Extract image and language
-        image_data = data.get('image', '')
-        language = data.get('language', 'asl').lower()
-        
-        # Validate language
-        if language not in ['asl', 'gsl']:
-            return jsonify({
-                "success": False,
-                "error": f"Unsupported language: {language}"
-            }), 400
-        
-        # Try to decode base64 image (basic validation)
-        try:
-            if image_data:
-                decoded_data = base64.b64decode(image_data)
-            else:
-                decoded_data = None
-        except Exception:
-            return jsonify({
-                "success": False,
-                "error": "Invalid base64 image data"
-            }), 400
-        
-        # Perform translation
-        result = translator.translate(decoded_data, language)
-        
-        if result:
-            return jsonify({
-                "success": True,
-                "translation": result["text"],
-                "confidence": result["confidence"],
-                "language": result["language"],
-                "timestamp": result["timestamp"],
-                "processing_time_ms": 100
-            })
+        if is_binary_upload(request.content_type):
+            # Read the body once; it is passed on as a memoryview
+            language = request.headers.get(LANGUAGE_HEADER) or request.args.get('language')
+            with timer.stage("read"):
+                raw_body = request.get_data(cache=False)
+            body, status_code = handle_translate_binary(
+                raw_body, language, session_options(request.headers), timer
+            )
+        elif is_multipart_upload(request.content_type):
+            with timer.stage("read"):
+                upload = request.files.get('image')
+                raw_body = upload.read() if upload else b''
+                language = (request.form.get('language')
+                            or request.headers.get(LANGUAGE_HEADER)
+                            or request.args.get('language'))
+            body, status_code = handle_translate_binary(
+                raw_body, language, session_options(request.headers), timer
+            )
         else:
-            return jsonify({
-                "success": False,
-                "message": "No hands detected or invalid image",
-                "language": language,
-                "timestamp": datetime.now().isoformat()
-            })
+            # Get request data
+            with timer.stage("read"):
+                data = request.get_json(silent=True)
+            body, status_code = handle_translate(data, timer)
+        return timed_json(body, status_code, timer)
             
     except Exception as e:
-        print(f"Translation error: {e}")
-        return jsonify({
-            "success": False,
-            "error": f"Internal server error: {str(e)}"
-        }), 500
+        return internal_error(e, timer)
+
+@app.route('/translate/landmarks', methods=['POST'])
+def translate_landmarks():
+    """Landmark-only translation endpoint
+    
+    Body is packed little-endian float32 hands (see landmark_codec.py);
+    language comes from X-Language or ?language=.
+    """
+    timer = metrics.start('/translate/landmarks')
+    try:
+        language = request.headers.get(LANGUAGE_HEADER) or request.args.get('language')
+        with timer.stage("read"):
+            raw_body = request.get_data(cache=False)
+        body, status_code = handle_translate_landmarks(
+            raw_body,
+            language,
+            request.headers.get(DIMS_HEADER),
+            request.headers.get(FRAME_HANDS_HEADER),
+            session_options(request.headers),
+            timer
+        )
+        return timed_json(body, status_code, timer)
+    
+    except Exception as e:
+        return internal_error(e, timer)
+
+@app.route('/metrics', methods=['GET'])
+def prometheus_metrics():
+    """Prometheus metrics endpoint"""
+    return Response(metrics.render_prometheus(), mimetype=PROMETHEUS_CONTENT_TYPE)
 
 @app.route('/status', methods=['GET'])
 def status():
     """Server status endpoint"""
-    return jsonify({
-        "server": "ML Translation Server",
-        "status": "running",
-        "endpoints": [
-            "/health - Health check",
-            "/translate - POST translation endpoint",
-            "/status - This status endpoint"
-        ],
-        "languages_supported": ["asl", "gsl"],
-        "timestamp": datetime.now().isoformat()
-    })
+    return render(status_payload())
+
+@app.route('/debug/profile', methods=['GET'])
+def profile():
+    """Sampling profiler - collapsed stacks and top functions (token required)
+    
+    Holds this request for ?seconds= while the server keeps serving;
+    ?format=collapsed returns only the flamegraph input as text.
+    """
+    body, status_code = handle_profile(request.headers, request.args)
+    if status_code == 200 and request.args.get('format') == 'collapsed':
+        return Response(body["collapsed"], mimetype='text/plain')
+    response = render(body, status_code)
+    if status_code == 401:
+        response.headers['WWW-Authenticate'] = 'Bearer'
+    return response
+
+@app.route('/admin/languages', methods=['POST'])
+def add_language():
+    """Open a lane for a new language while the others keep serving (token required)"""
+    body, status_code = handle_add_language(request.headers, request.get_json(silent=True))
+    response = render(body, status_code)
+    if status_code == 401:
+        response.headers['WWW-Authenticate'] = 'Bearer'
+    return response
 
 if __name__ == '__main__':
     print("🚀 Starting LinguaSigna ML Server...")
-    print("📡 Server will be available at http://localhost:5000")
+    print(f"📡 Server will be available at http://localhost:{ml_config.PORT}")
     print("🔗 Endpoints:")
     print("   GET  /health - Health check")
-    print("   POST /translate - Translation API")
+    print("   GET  /health/ready - Readiness probe")
+    print("   GET  /health/load - Saturation probe")
+    print("   POST /translate - Translation API (JSON, raw image or multipart)")
+    print("   POST /translate/landmarks - Landmark translation API")
     print("   GET  /status - Server status")
+    print("   GET  /metrics - Prometheus metrics")
+    if ml_config.PROFILER_ENABLED:
+        print("   GET  /debug/profile - Sampling profiler (token required)")
+    if ml_config.ADMIN_TOKEN:
+        print("   POST /admin/languages - Add a language lane (token required)")
+    start_backend()
+    start_probes()
+    print(f"🧠 Translator backend: {translator.name} ({ml_config.BACKEND_WARMUP} warm-up)")
+    if router is not None:
+        if ml_config.BATCH_ENABLED:
+            batcher.start()
+        lanes = ", ".join(f"{language}={router.workers.get(language, router.default_workers)}"
+                          for language in router.languages())
+        print(f"🌐 Per-language lanes (worker processes, 0 = in-process): {lanes}")
+    elif ml_config.WORKER_PROCESSES > 0:
+        print(f"⚙️  Worker pool: {ml_config.WORKER_PROCESSES} processes, up to {batcher.max_size} frames per batch")
+    elif ml_config.BATCH_ENABLED:
+        batcher.start()
+        print(f"📦 Micro-batching: up to {batcher.max_size} frames / {ml_config.BATCH_MAX_WAIT_MS}ms")
     print("✅ ML Server ready for integration testing!")
     
-    app.run(host='0.0.0.0', port=5000, debug=False)
+    app.run(host=ml_config.HOST, port=ml_config.PORT, debug=False, threaded=True)
@@ -0,0 +1,517 @@
+#!/usr/bin/env python3
+"""
+LinguaSigna ML Server - Async (ASGI) Serving Mode
+Same /health, /translate and /status contract as ml_server.py, served from an
+asyncio event loop so in-flight requests don't each pin a thread. Also serves
+persistent streaming sessions on the /ws/translate WebSocket.
+
+Run with:  python ml_server_asgi.py
+      or:  uvicorn ml_server_asgi:app --port 5000
+"""
+
+import asyncio
+import contextlib
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+from starlette.applications import Starlette
+from starlette.responses import Response
+from starlette.routing import Route, WebSocketRoute
+from starlette.websockets import WebSocketDisconnect
+
+import ml_config
+from admission import AdmissionRejected, FrameSuperseded
+from landmark_codec import DIMS_HEADER, FRAME_HANDS_HEADER
+from metrics import NULL_TIMER, PROMETHEUS_CONTENT_TYPE
+from serialization import MSGPACK_CONTENT_TYPE, TIMESTAMP_PARAM, encode, response_format, wants_epoch
+from translation_service import (
+    LANGUAGE_HEADER,
+    SUPPORTED_LANGUAGES,
+    admission_for,
+    admission_key,
+    backend_for,
+    backend_not_ready,
+    batcher,
+    cache_lookup,
+    cache_store,
+    handle_add_language,
+    handle_profile,
+    health_payload,
+    is_binary_upload,
+    is_multipart_upload,
+    landmark_batch_response,
+    metrics,
+    hand_roi,
+    motion_check,
+    motion_record,
+    parse_binary_request,
+    parse_landmark_request,
+    parse_translate_request,
+    probe_monitor,
+    readiness_payload,
+    record_backend_stages,
+    record_batch_timing,
+    resolve_session,
+    session_options,
+    session_record,
+    sessions,
+    shed_response,
+    split_options,
+    start_backend,
+    start_probes,
+    status_payload,
+    translation_response,
+    translator,
+    with_crop,
+)
+
+# CPU-bound decode and inference run here, never on the event loop
+executor = ThreadPoolExecutor(
+    max_workers=ml_config.ASGI_EXECUTOR_WORKERS,
+    thread_name_prefix="ml-worker"
+)
+
+async def run_blocking(func, *args):
+    """Run a blocking call on the inference executor"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, func, *args)
+
+@contextlib.asynccontextmanager
+async def admitted_async(session=None, timer=NULL_TIMER, language=None):
+    """Hold an admission slot (in the language's queue) while a frame is translated, waiting off the event loop"""
+    admission = admission_for(language)
+    if admission is None:
+        yield
+        return
+    future = admission.request(admission_key(session))
+    with timer.stage("admission_wait"):
+        try:
+            # shield() keeps a timeout from cancelling the controller's Future
+            await asyncio.wait_for(
+                asyncio.shield(asyncio.wrap_future(future)),
+                timeout=admission.wait_timeout
+            )
+        except asyncio.TimeoutError:
+            admission.abandon(future)
+            raise AdmissionRejected("Timed out waiting for admission", admission.retry_after)
+        except asyncio.CancelledError:
+            admission.abandon(future)
+            raise
+    try:
+        yield
+    finally:
+        admission.release()
+
+async def translate_async(image_data, language, timer=NULL_TIMER, session=None, crop=None, roi=None):
+    """Translate one frame without holding a thread while it waits"""
+    # Hashing decodes a thumbnail, so it runs on the executor too
+    with timer.stage("cache_lookup"):
+        key, found, result = await run_blocking(cache_lookup, image_data, language, roi or crop)
+    if found:
+        return result
+    
+    frame = with_crop(image_data, roi or crop, fallback=roi is not None)
+    async with admitted_async(session, timer, language):
+        if ml_config.BATCH_ENABLED:
+            # The batcher owns its own thread - just await the Future it hands back
+            future = batcher.submit(frame, language)
+            result = await asyncio.wait_for(
+                asyncio.wrap_future(future),
+                timeout=ml_config.BATCH_RESULT_TIMEOUT_S
+            )
+            record_batch_timing(timer, future)
+        else:
+            with timer.stage("inference"):
+                result = await run_blocking(translator.translate, frame, language)
+    record_backend_stages(timer, [result])
+    cache_store(key, result, image_data)
+    return result
+
+async def translate_many_async(frames, language, timer=NULL_TIMER):
+    """Translate a multi-frame payload under one admission slot (see run_translation_many)"""
+    with timer.stage("cache_lookup"):
+        lookups = await run_blocking(lambda: [cache_lookup(frame, language) for frame in frames])
+    misses = [index for index, (_, found, _) in enumerate(lookups) if not found]
+    results = [result for _, _, result in lookups]
+    if not misses:
+        return results
+    
+    async with admitted_async(None, timer, language):
+        if ml_config.BATCH_ENABLED:
+            # Every frame goes to the batcher at once, so they usually share one batch
+            futures = [batcher.submit(frames[index], language) for index in misses]
+            fresh = await asyncio.wait_for(
+                asyncio.gather(*(asyncio.wrap_future(future) for future in futures)),
+                timeout=ml_config.BATCH_RESULT_TIMEOUT_S
+            )
+            # Report the slowest frame's queue wait and inference
+            record_batch_timing(timer, max(futures, key=lambda future: future.queue_ms + future.inference_ms))
+        else:
+            with timer.stage("inference"):
+                fresh = await run_blocking(translator.translate_batch,
+                                           [(frames[index], language) for index in misses])
+    record_backend_stages(timer, fresh)
+    
+    for index, result in zip(misses, fresh):
+        results[index] = result
+        cache_store(lookups[index][0], result, frames[index])
+    return results
+
+async def translate_session_async(session, image_data, language, timer=NULL_TIMER, crop=None):
+    """Motion-gated translate_async for session frames - returns (result, reused)"""
+    if session is None:
+        return await translate_async(image_data, language, timer, crop=crop), False
+    
+    with timer.stage("motion_check"):
+        signature, reused, result = await run_blocking(motion_check, session, image_data, language)
+    if reused:
+        return result, True
+    
+    # Session state sits behind threading locks - take them on the executor, not the loop
+    roi = await run_blocking(hand_roi, session, image_data, language, crop)
+    result = await translate_async(image_data, language, timer, session, crop, roi)
+    await run_blocking(motion_record, session, signature, language, result)
+    result = await run_blocking(session_record, session, image_data, language, roi, result)
+    return result, False
+
+async def backend_error(language=None):
+    """503 error if the translator (for this language) isn't loaded yet - waits off the event loop"""
+    if backend_for(language).is_ready():
+        return None
+    return await run_blocking(backend_not_ready, language)
+
+def render(request, body, status_code=200):
+    """Encode a body in the format the client negotiated (JSON or MessagePack)"""
+    payload, content_type = encode(body, *response_format(request.headers, request.query_params))
+    return Response(payload, status_code=status_code, media_type=content_type,
+                    headers={'Vary': 'Accept'})
+
+def timed_json(request, body, status_code, timer):
+    """Serialize a response, attach Server-Timing and close out the request metrics"""
+    with timer.stage("serialize"):
+        response = render(request, body, status_code)
+    response.headers['Server-Timing'] = timer.server_timing()
+    if status_code == 429:
+        response.headers['Retry-After'] = str(body.get('retry_after', 1))
+    timer.finish(status_code)
+    return response
+
+def internal_error(request, e, timer):
+    print(f"Translation error: {e}")
+    timer.fail(e)
+    return timed_json(request, {
+        "success": False,
+        "error": f"Internal server error: {str(e)}"
+    }, 500, timer)
+
+async def health(request):
+    """Health check endpoint"""
+    return render(request, health_payload())
+
+async def readiness(request):
+    """Readiness probe - 503 until the translator backend has loaded"""
+    body, status_code = readiness_payload()
+    return render(request, body, status_code)
+
+async def load(request):
+    """Saturation probe - queue depth, in-flight, recent p99 and a 0-1 load score"""
+    return render(request, probe_monitor.snapshot())
+
+async def translate_frame(request):
+    """Main translation endpoint (JSON, raw image or multipart - see ml_server.py)"""
+    timer = metrics.start('/translate')
+    try:
+        content_type = request.headers.get('content-type')
+        if is_binary_upload(content_type):
+            # Read the body once; it is passed on as a memoryview
+            language = request.headers.get(LANGUAGE_HEADER) or request.query_params.get('language')
+            with timer.stage("read"):
+                raw_body = await request.body()
+            decoded_data, language, error = parse_binary_request(raw_body, language)
+            options = session_options(request.headers)
+        elif is_multipart_upload(content_type):
+            # Needs python-multipart
+            with timer.stage("read"):
+                form = await request.form()
+                upload = form.get('image')
+                language = (form.get('language')
+                            or request.headers.get(LANGUAGE_HEADER)
+                            or request.query_params.get('language'))
+                image_bytes = await upload.read() if upload is not None and hasattr(upload, 'read') else b''
+            decoded_data, language, error = parse_binary_request(image_bytes, language)
+            options = session_options(request.headers)
+        else:
+            with timer.stage("read"):
+                try:
+                    data = await request.json()
+                except ValueError:
+                    data = None
+            decoded_data, language, error = await run_blocking(parse_translate_request, data, timer)
+            options = session_options(data)
+
+        if not error:
+            options, crop, error = split_options(options)
+        # Backend first, as in _translate_parsed, so a 503 never opens a session
+        if not error:
+            error = await backend_error(language)
+        if not error:
+            session, error = resolve_session(language, **options)
+        if error:
+            body, status_code = error
+            return timed_json(request, body, status_code, timer)
+        
+        result, reused = await translate_session_async(session, decoded_data, language, timer, crop)
+        return timed_json(request, translation_response(result, language, reused, timer), 200, timer)
+    
+    except (AdmissionRejected, FrameSuperseded) as e:
+        body, status_code = shed_response(e, language, timer)
+        return timed_json(request, body, status_code, timer)
+    except Exception as e:
+        return internal_error(request, e, timer)
+
+async def translate_landmarks(request):
+    """Landmark-only translation endpoint (see ml_server.py)"""
+    timer = metrics.start('/translate/landmarks')
+    try:
+        language = request.headers.get(LANGUAGE_HEADER) or request.query_params.get('language')
+        with timer.stage("read"):
+            raw_body = await request.body()
+        with timer.stage("landmark_decode"):
+            frames, language, batched, error = parse_landmark_request(
+                raw_body,
+                language,
+                request.headers.get(DIMS_HEADER),
+                request.headers.get(FRAME_HANDS_HEADER)
+            )
+        if not error and not batched:
+            options, _, error = split_options(session_options(request.headers))
+        if not error:
+            error = await backend_error(language)
+        if not error and not batched:
+            session, error = resolve_session(language, **options)
+        if error:
+            body, status_code = error
+            return timed_json(request, body, status_code, timer)
+        
+        if not batched:
+            result, reused = await translate_session_async(session, frames[0], language, timer)
+            return timed_json(request, translation_response(result, language, reused, timer), 200, timer)
+        
+        # One admission slot for the whole payload, like the Flask path
+        results = await translate_many_async(frames, language, timer)
+        return timed_json(request, landmark_batch_response(results, language, timer), 200, timer)
+    
+    except (AdmissionRejected, FrameSuperseded) as e:
+        body, status_code = shed_response(e, language, timer)
+        return timed_json(request, body, status_code, timer)
+    except Exception as e:
+        return internal_error(request, e, timer)
+
+async def status(request):
+    """Server status endpoint"""
+    return render(request, status_payload())
+
+async def prometheus_metrics(request):
+    """Prometheus metrics endpoint"""
+    return Response(metrics.render_prometheus(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+async def add_language(request):
+    """Open a lane for a new language (see ml_server.py) - built off the event loop"""
+    try:
+        data = await request.json()
+    except ValueError:
+        data = None
+    loop = asyncio.get_running_loop()
+    # Starting a lane can spawn worker processes - not on an inference thread either
+    body, status_code = await loop.run_in_executor(None, handle_add_language, request.headers, data)
+    response = render(request, body, status_code)
+    if status_code == 401:
+        response.headers['WWW-Authenticate'] = 'Bearer'
+    return response
+
+async def profile(request):
+    """Sampling profiler (see ml_server.py) - samples on a thread of its own, not the event loop"""
+    loop = asyncio.get_running_loop()
+    # The default executor, so a profile doesn't hold an inference thread
+    body, status_code = await loop.run_in_executor(None, handle_profile, request.headers, request.query_params)
+    if status_code == 200 and request.query_params.get('format') == 'collapsed':
+        return Response(body["collapsed"], media_type='text/plain')
+    response = render(request, body, status_code)
+    if status_code == 401:
+        response.headers['WWW-Authenticate'] = 'Bearer'
+    return response
+
+async def translate_stream(websocket):
+    """Streaming translation session
+    
+    Protocol:
+      - connect to /ws/translate?language=asl
+      - server sends {"type": "session", "session_id", "language"}
+      - client sends each frame as a binary message
+      - server pushes {"type": "result", "seq", ...} as frames finish; seq
+        numbers follow frame arrival order and results older than one
+        already sent are dropped, so clients only ever move forward
+      - frames arriving while ML_WS_MAX_IN_FLIGHT are pending are answered
+        with {"type": "dropped", "seq", "reason": "busy"}; frames shed by
+        admission control get reason "overloaded" or "superseded"
+      - text messages {"type": "language", "language": "gsl"} switch
+        language, {"type": "motion", "threshold", "max_reuse"} tune motion
+        gating (also settable as ?motion_threshold=&max_reuse=) and
+        {"type": "close"} ends the session
+      - ?format=msgpack sends server messages as binary MessagePack instead
+        of JSON text, ?timestamps=epoch sends epoch-millisecond timestamps
+    """
+    language = (websocket.query_params.get('language') or 'asl').lower()
+    if language not in SUPPORTED_LANGUAGES:
+        await websocket.close(code=1008, reason=f"Unsupported language: {language}")
+        return
+    
+    if await backend_error(language):
+        # 1013 = try again later
+        await websocket.close(code=1013, reason="Translator backend not ready")
+        return
+    
+    await websocket.accept()
+    session = sessions.create(language)
+    try:
+        session.configure_motion(websocket.query_params.get('motion_threshold'),
+                                 websocket.query_params.get('max_reuse'))
+    except ValueError:
+        pass
+    send_lock = asyncio.Lock()
+    pending = set()
+    message_format = "msgpack" if websocket.query_params.get('format') == "msgpack" else "json"
+    epoch = wants_epoch(websocket.query_params.get(TIMESTAMP_PARAM))
+    
+    async def send(message):
+        payload, content_type = encode(message, message_format, epoch)
+        async with send_lock:
+            if content_type == MSGPACK_CONTENT_TYPE:
+                await websocket.send_bytes(payload)
+            else:
+                await websocket.send_text(payload.decode("utf-8"))
+    
+    async def process_frame(seq, frame, frame_language):
+        timer = metrics.start('/ws/translate')
+        status_code = 200
+        try:
+            result, reused = await translate_session_async(session, memoryview(frame), frame_language, timer)
+            if session.accept_result(seq, result):
+                message = translation_response(result, frame_language, reused, timer)
+                message["type"] = "result"
+                message["seq"] = seq
+                await send(message)
+        except AdmissionRejected:
+            status_code = 429
+            timer.fail("admission_rejected")
+            await send({"type": "dropped", "seq": seq, "reason": "overloaded"})
+        except FrameSuperseded:
+            timer.fail("frame_superseded")
+            await send({"type": "dropped", "seq": seq, "reason": "superseded"})
+        except Exception as e:
+            status_code = 500
+            timer.fail(e)
+            await send({"type": "error", "seq": seq, "error": str(e)})
+        finally:
+            timer.finish(status_code)
+    
+    try:
+        await send({
+            "type": "session",
+            "session_id": session.session_id,
+            "language": session.language
+        })
+        
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
+            
+            if message.get("bytes") is not None:
+                seq = session.next_frame()
+                if len(pending) >= ml_config.WS_MAX_IN_FLIGHT:
+                    # Never reaches a timed request - count the drop directly
+                    metrics.record_error("ws_busy")
+                    await send({"type": "dropped", "seq": seq, "reason": "busy"})
+                    continue
+                task = asyncio.create_task(process_frame(seq, message["bytes"], session.language))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+                continue
+            
+            try:
+                control = json.loads(message.get("text") or "{}")
+            except ValueError:
+                metrics.record_error("ws_invalid_control")
+                await send({"type": "error", "error": "Invalid control message"})
+                continue
+            
+            if control.get("type") == "language":
+                new_language = str(control.get("language", "")).lower()
+                if new_language in SUPPORTED_LANGUAGES:
+                    session.language = new_language
+                    await send({"type": "language", "language": new_language})
+                else:
+                    await send({"type": "error", "error": f"Unsupported language: {new_language}"})
+            elif control.get("type") == "motion":
+                try:
+                    session.configure_motion(control.get("threshold"), control.get("max_reuse"))
+                    await send({"type": "motion",
+                                "threshold": session.motion_threshold,
+                                "max_reuse": session.motion_max_reuse})
+                except (TypeError, ValueError):
+                    await send({"type": "error", "error": "Invalid motion settings"})
+            elif control.get("type") == "close":
+                break
+    
+    except WebSocketDisconnect:
+        pass
+    finally:
+        for task in pending:
+            task.cancel()
+        sessions.remove(session.session_id)
+        with contextlib.suppress(Exception):
+            await websocket.close()
+
+@contextlib.asynccontextmanager
+async def lifespan(app):
+    """Start the backend warm-up and batcher with the server, stop on shutdown"""
+    start_backend()
+    start_probes()
+    if ml_config.BATCH_ENABLED:
+        batcher.start()
+    yield
+    batcher.stop()
+    executor.shutdown(wait=False)
+
+app = Starlette(
+    routes=[
+        Route('/', health, methods=['GET']),
+        Route('/health', health, methods=['GET']),
+        Route('/health/live', health, methods=['GET']),
+        Route('/health/ready', readiness, methods=['GET']),
+        Route('/health/load', load, methods=['GET']),
+        Route('/translate', translate_frame, methods=['POST']),
+        Route('/translate/landmarks', translate_landmarks, methods=['POST']),
+        Route('/status', status, methods=['GET']),
+        Route('/metrics', prometheus_metrics, methods=['GET']),
+        Route('/debug/profile', profile, methods=['GET']),
+        Route('/admin/languages', add_language, methods=['POST']),
+        WebSocketRoute('/ws/translate', translate_stream),
+    ],
+    lifespan=lifespan
+)
+
+if __name__ == '__main__':
+    import uvicorn
+    
+    print("🚀 Starting LinguaSigna ML Server (async mode)...")
+    print(f"📡 Server will be available at http://localhost:{ml_config.PORT}")
+    print("🔌 Streaming: ws://localhost:%d/ws/translate?language=asl" % ml_config.PORT)
+    print(f"🧵 Inference executor: {ml_config.ASGI_EXECUTOR_WORKERS} threads")
+    if ml_config.WORKER_PROCESSES > 0:
+        print(f"⚙️  Worker pool: {ml_config.WORKER_PROCESSES} processes")
+    print("✅ ML Server ready for integration testing!")
+    
+    uvicorn.run(app, host=ml_config.HOST, port=ml_config.PORT,
+                log_level="warning", backlog=4096)
@@ -0,0 +1,411 @@
+#!/usr/bin/env python3
+"""
+LinguaSigna ML Server - Pre-fork Launcher
+Loads the translator once, then forks N servers that share one listening socket
+
+The master process imports the server, loads the in-process translator
+backend(s) and opens the listening socket before forking, so every worker
+inherits the loaded model copy-on-write (NumPy buffers and other untouched
+pages stay shared; gc.freeze() keeps the collector from dirtying them) and
+accepts connections from the same socket.
+
+The socket is inherited rather than bound per worker with SO_REUSEPORT:
+with one shared accept queue, a connection the kernel has queued is never
+tied to a worker that is about to exit, so replacing workers drops nothing.
+
+The master supervises the workers:
+    - a worker that exits unexpectedly is replaced (with backoff when
+      workers die straight after starting)
+    - SIGHUP reloads gracefully: one at a time, a new worker is forked and
+      waited for until it serves, then the old one is sent SIGTERM, stops
+      accepting and finishes its in-flight requests
+    - SIGTERM / SIGINT stop all workers gracefully, then the master exits
+
+Worker-pool backends (ML_WORKER_PROCESSES or pool lanes) spawn their
+processes after the fork, one pool per server worker. So do the health
+probes: each worker runs its own probe listener on ML_PROBE_PORT (bound
+with SO_REUSEPORT) and reports its own load, not the server's (see
+probes.py).
+
+Run with:  python ml_server_prefork.py [--workers 4] [--app flask|asgi]
+"""
+
+import argparse
+import errno
+import gc
+import os
+import random
+import select
+import signal
+import socket
+import sys
+import threading
+import time
+
+import ml_config
+
+# Consecutive quick exits after which respawns back off (up to MAX_BACKOFF_S)
+QUICK_EXIT_S = 2.0
+MAX_BACKOFF_S = 10.0
+
+class _Worker:
+    """Master-side record of one forked server"""
+
+    def __init__(self, pid, ready_fd):
+        self.pid = pid
+        self.ready_fd = ready_fd
+        self.ready = False
+        self.retiring = False
+        self.started_at = time.monotonic()
+
+def load_app(name):
+    """Import the server module for a worker type - returns (module, app)"""
+    if name == "asgi":
+        import ml_server_asgi as module
+    elif name == "flask":
+        import ml_server as module
+    else:
+        raise ValueError(f"Unknown server app: {name} (use flask or asgi)")
+    return module, module.app
+
+def preload_backend():
+    """Load in-process translators in the master so workers inherit them"""
+    from translation_service import router, translator
+    from worker_pool import WorkerPool
+
+    backends = [lane.backend for lane in router.lanes.values()] if router is not None else [translator]
+    for backend in backends:
+        if isinstance(backend, WorkerPool):
+            # Pools own processes and threads - each server worker starts its own after the fork
+            print(f"⚠️  Worker pool backend '{backend.name}' is started per server worker, not shared")
+            continue
+        backend.load()
+
+def serve_flask(app, listener, notify_ready, graceful_timeout):
+    """Worker body for the Flask app: threaded WSGI server on the inherited socket"""
+    from werkzeug.serving import make_server
+    from translation_service import batcher, start_backend, start_probes
+
+    start_backend()
+    start_probes()
+    if ml_config.BATCH_ENABLED:
+        batcher.start()
+    server = make_server(ml_config.HOST, ml_config.PORT, app, threaded=True, fd=listener.fileno())
+    # Let server_close() wait for requests that are still running
+    server.daemon_threads = False
+    server.block_on_close = True
+
+    def stop(signum, frame):
+        # shutdown() blocks until serve_forever() returns - not from its own thread
+        threading.Thread(target=server.shutdown, daemon=True).start()
+        # Idle keep-alive connections would otherwise hold the worker open
+        signal.signal(signal.SIGALRM, lambda *_: os._exit(0))
+        signal.alarm(max(1, int(graceful_timeout)))
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    notify_ready()
+    server.serve_forever()
+    server.server_close()
+    batcher.stop()
+
+def serve_asgi(app, listener, notify_ready, graceful_timeout):
+    """Worker body for the ASGI app: uvicorn on the inherited socket (it handles SIGTERM itself)"""
+    import uvicorn
+
+    config = uvicorn.Config(app, log_level="warning", backlog=ml_config.PREFORK_BACKLOG,
+                            timeout_graceful_shutdown=graceful_timeout)
+    server = uvicorn.Server(config)
+
+    def wait_started():
+        while not server.started and not server.should_exit:
+            time.sleep(0.01)
+        if server.started:
+            notify_ready()
+
+    threading.Thread(target=wait_started, daemon=True).start()
+    server.run(sockets=[listener])
+
+SERVERS = {"flask": serve_flask, "asgi": serve_asgi}
+
+class PreforkMaster:
+    """Forks, supervises and gracefully replaces server workers"""
+
+    def __init__(self, app_name="flask", workers=1, host="0.0.0.0", port=5000, backlog=4096,
+                 graceful_timeout=30.0, ready_timeout=30.0):
+        self.app_name = app_name
+        self.target = max(1, int(workers))
+        self.host = host
+        self.port = port
+        self.backlog = backlog
+        self.graceful_timeout = graceful_timeout
+        self.ready_timeout = ready_timeout
+        self.workers = {}
+        self.listener = None
+        self.app = None
+        self._signals = []
+        self._wakeup = None
+        self._quick_exits = 0
+        self._next_spawn = 0.0
+        self._stopping = False
+
+        # Counters printed on shutdown
+        self.spawned = 0
+        self.crashes = 0
+        self.reloads = 0
+
+    # Setup
+
+    def prepare(self):
+        """Import the app, load the model and open the socket - everything workers inherit"""
+        _, self.app = load_app(self.app_name)
+        from translation_service import probe_server
+        if probe_server is not None:
+            # Every worker starts a probe listener on the same port
+            probe_server.reuse_port = True
+        started = time.perf_counter()
+        preload_backend()
+        print(f"🧠 Translator loaded in the master in {time.perf_counter() - started:.2f}s")
+        self.listener = socket.create_server((self.host, self.port), backlog=self.backlog)
+        # Objects that exist now are never collected - keeps gc from writing to shared pages
+        gc.collect()
+        gc.freeze()
+
+    def install_signals(self):
+        read_fd, write_fd = os.pipe()
+        os.set_blocking(read_fd, False)
+        os.set_blocking(write_fd, False)
+        self._wakeup = read_fd
+        signal.set_wakeup_fd(write_fd)
+        for signum in (signal.SIGCHLD, signal.SIGHUP, signal.SIGTERM, signal.SIGINT):
+            signal.signal(signum, self._on_signal)
+
+    def _on_signal(self, signum, frame):
+        self._signals.append(signum)
+
+    # Workers
+
+    def spawn(self):
+        """Fork one server worker - returns its record"""
+        ready_r, ready_w = os.pipe()
+        # Unflushed output would be printed by the child as well
+        sys.stdout.flush()
+        pid = os.fork()
+        if pid == 0:
+            os.close(ready_r)
+            self._run_worker(ready_w)
+            os._exit(0)
+        os.close(ready_w)
+        worker = _Worker(pid, ready_r)
+        self.workers[pid] = worker
+        self.spawned += 1
+        return worker
+
+    def _run_worker(self, ready_w):
+        """Child side of spawn() - never returns"""
+        code = 0
+        try:
+            signal.set_wakeup_fd(-1)
+            for signum in (signal.SIGCHLD, signal.SIGHUP, signal.SIGTERM, signal.SIGINT):
+                signal.signal(signum, signal.SIG_DFL)
+            os.close(self._wakeup)
+            for worker in self.workers.values():
+                os.close(worker.ready_fd)
+            # Forked workers would otherwise share the master's random sequence
+            random.seed()
+
+            def notify_ready():
+                os.write(ready_w, b"R")
+                os.close(ready_w)
+
+            SERVERS[self.app_name](self.app, self.listener, notify_ready, self.graceful_timeout)
+        except BaseException as e:
+            if not isinstance(e, (KeyboardInterrupt, SystemExit)):
+                print(f"❌ Server worker {os.getpid()} failed: {type(e).__name__}: {e}")
+                code = 1
+        finally:
+            sys.stdout.flush()
+            os._exit(code)
+
+    def retire(self, worker):
+        """Ask a worker to finish its in-flight requests and exit"""
+        worker.retiring = True
+        try:
+            os.kill(worker.pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+
+    def active(self):
+        return [worker for worker in self.workers.values() if not worker.retiring]
+
+    def reap(self):
+        """Collect exited workers - unexpected exits are scheduled for respawn"""
+        while True:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
+            worker = self.workers.pop(pid, None)
+            if worker is None:
+                continue
+            os.close(worker.ready_fd)
+            if worker.retiring or self._stopping:
+                continue
+            self.crashes += 1
+            code = os.waitstatus_to_exitcode(status)
+            print(f"⚠️  Server worker {pid} exited with code {code} - respawning")
+            if time.monotonic() - worker.started_at < QUICK_EXIT_S:
+                self._quick_exits += 1
+                delay = min(MAX_BACKOFF_S, 0.5 * 2 ** (self._quick_exits - 1))
+                self._next_spawn = time.monotonic() + delay
+            else:
+                self._quick_exits = 0
+
+    def manage(self):
+        """Spawn workers until the target count is running (respecting crash backoff)"""
+        if self._stopping or time.monotonic() < self._next_spawn:
+            return
+        for _ in range(self.target - len(self.active())):
+            self.spawn()
+
+    def check_ready(self, timeout=0.0):
+        """Mark workers whose ready pipe fired - waits up to timeout for any"""
+        pending = {worker.ready_fd: worker for worker in self.workers.values() if not worker.ready}
+        if not pending:
+            return
+        try:
+            readable, _, _ = select.select(list(pending), [], [], timeout)
+        except InterruptedError:
+            return
+        for fd in readable:
+            worker = pending[fd]
+            try:
+                data = os.read(fd, 1)
+            except OSError:
+                data = b""
+            if data == b"R":
+                worker.ready = True
+                worker.started_at = time.monotonic()
+                self._quick_exits = 0
+
+    def wait(self, condition, timeout):
+        """Keep reaping and handling readiness until condition() holds - False on timeout"""
+        deadline = time.monotonic() + timeout
+        while not condition():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            self.check_ready(min(0.05, remaining))
+            self.reap()
+            if not self.workers and not condition():
+                time.sleep(min(0.05, remaining))
+        return True
+
+    # Lifecycle
+
+    def reload(self):
+        """Replace every worker, one at a time, without closing the socket"""
+        self.reloads += 1
+        print(f"🔄 Reloading {len(self.active())} server workers")
+        for old in list(self.active()):
+            if old.pid not in self.workers:
+                continue
+            new = self.spawn()
+            if not self.wait(lambda: new.ready or new.pid not in self.workers, self.ready_timeout) or not new.ready:
+                print(f"❌ Replacement worker {new.pid} didn't start - keeping the remaining workers")
+                if new.pid in self.workers:
+                    self.retire(new)
+                return
+            self.retire(old)
+            self.stop_worker(old)
+        print("✅ Reload complete")
+
+    def stop_worker(self, worker):
+        """Wait for a retiring worker to exit, killing it after the graceful timeout"""
+        if not self.wait(lambda: worker.pid not in self.workers, self.graceful_timeout):
+            print(f"⚠️  Server worker {worker.pid} didn't stop in {self.graceful_timeout}s - killing it")
+            try:
+                os.kill(worker.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+            self.wait(lambda: worker.pid not in self.workers, 5.0)
+
+    def stop(self):
+        """Gracefully stop every worker"""
+        self._stopping = True
+        workers = list(self.workers.values())
+        print(f"🛑 Stopping {len(workers)} server workers")
+        for worker in workers:
+            self.retire(worker)
+        if not self.wait(lambda: not self.workers, self.graceful_timeout):
+            for worker in list(self.workers.values()):
+                try:
+                    os.kill(worker.pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+            self.wait(lambda: not self.workers, 5.0)
+        self.listener.close()
+
+    def handle_signals(self):
+        while self._signals:
+            signum = self._signals.pop(0)
+            if signum in (signal.SIGTERM, signal.SIGINT):
+                return False
+            if signum == signal.SIGHUP:
+                self.reload()
+        return True
+
+    def run(self):
+        self.prepare()
+        self.install_signals()
+        self.manage()
+        print(f"👷 Master {os.getpid()} serving with {self.target} {self.app_name} workers "
+              f"({', '.join(str(pid) for pid in self.workers)})")
+        try:
+            while True:
+                self.reap()
+                if not self.handle_signals():
+                    break
+                self.manage()
+                waitables = [self._wakeup] + [w.ready_fd for w in self.workers.values() if not w.ready]
+                try:
+                    select.select(waitables, [], [], 1.0)
+                except InterruptedError:
+                    pass
+                self._drain_wakeup()
+                self.check_ready()
+        finally:
+            self.stop()
+        print(f"👋 Master exiting: {self.spawned} workers spawned, {self.crashes} crashes, "
+              f"{self.reloads} reloads")
+
+    def _drain_wakeup(self):
+        try:
+            while os.read(self._wakeup, 512):
+                pass
+        except OSError as e:
+            if e.errno not in (errno.EAGAIN, errno.EWOULDBLOCK):
+                raise
+
+def main():
+    parser = argparse.ArgumentParser(description="Pre-fork multi-process LinguaSigna ML server")
+    parser.add_argument("--workers", type=int, default=ml_config.PREFORK_WORKERS)
+    parser.add_argument("--app", choices=sorted(SERVERS), default=ml_config.PREFORK_APP)
+    parser.add_argument("--host", default=ml_config.HOST)
+    parser.add_argument("--port", type=int, default=ml_config.PORT)
+    args = parser.parse_args()
+
+    print("🚀 Starting LinguaSigna ML Server (pre-fork)...")
+    print(f"📡 Server will be available at http://localhost:{args.port}")
+    print("🔁 kill -HUP <master pid> reloads workers one at a time, kill -TERM stops")
+    PreforkMaster(
+        args.app, args.workers, args.host, args.port,
+        backlog=ml_config.PREFORK_BACKLOG,
+        graceful_timeout=ml_config.PREFORK_GRACEFUL_TIMEOUT_S,
+        ready_timeout=ml_config.PREFORK_READY_TIMEOUT_S
+    ).run()
+
+if __name__ == "__main__":
+    main()
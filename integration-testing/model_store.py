@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+LinguaSigna ML Server - Memory-Mapped Model Store
+One read-only file of named arrays (weights, vocabulary features, labels)
+that every worker process maps instead of loading its own copy
+
+Layout (little-endian):
+
+    8 bytes   magic b"LSMODEL1"
+    8 bytes   header length (uint64)
+    header    UTF-8 JSON: {"arrays": {name: {"dtype", "shape", "offset"}},
+                           "metadata": {...}}
+    padding   to ARRAY_ALIGNMENT
+    arrays    raw C-order data, each starting on an ARRAY_ALIGNMENT boundary
+
+Opening a store parses only the header and wraps each array as a NumPy view
+of the mmap, so startup costs milliseconds regardless of model size, and
+every process mapping the same file shares the same page-cache pages.
+Strings (e.g. labels) are stored as fixed-width UTF-8 byte arrays.
+
+write_store() writes to a temporary file in the same directory and renames
+it over the target, so readers see either the old or the new store, never a
+partial one. A process holding the old mapping keeps reading the old inode
+until it notices the change (is_stale()) and reopens.
+
+Usage:
+    python model_store.py build --templates vocab_dir/ --out models/templates.lsm
+    python model_store.py info models/templates.lsm
+"""
+
+import argparse
+import json
+import mmap
+import os
+import struct
+
+import numpy as np
+
+MAGIC = b"LSMODEL1"
+ARRAY_ALIGNMENT = 64
+
+class ModelStoreError(ValueError):
+    """Raised for a file that isn't a readable model store"""
+
+def _align(offset):
+    return (offset + ARRAY_ALIGNMENT - 1) // ARRAY_ALIGNMENT * ARRAY_ALIGNMENT
+
+def encode_strings(values):
+    """Fixed-width UTF-8 byte array for a list of strings"""
+    encoded = [str(value).encode("utf-8") for value in values]
+    width = max((len(value) for value in encoded), default=1) or 1
+    return np.array(encoded, dtype=f"S{width}")
+
+def write_store(path, arrays, metadata=None):
+    """Write named arrays (and JSON-able metadata) to path atomically"""
+    arrays = {name: np.ascontiguousarray(array) for name, array in arrays.items()}
+    for name, array in arrays.items():
+        if array.dtype.hasobject:
+            raise ModelStoreError(f"Array {name} has object dtype - use encode_strings() for text")
+
+    # Offsets depend on the header length, which depends on the offsets -
+    # lay out relative to a generously padded header start
+    entries = {}
+    relative = 0
+    for name, array in arrays.items():
+        relative = _align(relative)
+        entries[name] = {"dtype": array.dtype.str, "shape": list(array.shape), "offset": relative}
+        relative += array.nbytes
+
+    header = {"arrays": entries, "metadata": metadata or {}}
+    header_bytes = json.dumps(header, sort_keys=True).encode("utf-8")
+    # Absolute offsets have more digits - leave room for them
+    data_start = _align(len(MAGIC) + 8 + len(header_bytes) + 20 * len(entries) + 32)
+    for entry in entries.values():
+        entry["offset"] += data_start
+    header_bytes = json.dumps(header, sort_keys=True).encode("utf-8")
+    if len(MAGIC) + 8 + len(header_bytes) > data_start:
+        raise ModelStoreError("Header outgrew its reserved space")
+
+    directory = os.path.dirname(os.path.abspath(path))
+    temporary = os.path.join(directory, f".{os.path.basename(path)}.{os.getpid()}.tmp")
+    try:
+        with open(temporary, "wb") as f:
+            f.write(MAGIC)
+            f.write(struct.pack("<Q", len(header_bytes)))
+            f.write(header_bytes)
+            for name, array in arrays.items():
+                f.write(b"\0" * (entries[name]["offset"] - f.tell()))
+                f.write(memoryview(array).cast("B") if array.nbytes else b"")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary, path)
+    except BaseException:
+        if os.path.exists(temporary):
+            os.unlink(temporary)
+        raise
+
+    # Make the rename itself durable
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+class ModelStore:
+    """Read-only mapping of a model store file"""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            stat = os.fstat(f.fileno())
+            self._identity = (stat.st_dev, stat.st_ino)
+            self.size = stat.st_size
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            if self._mmap[:len(MAGIC)] != MAGIC:
+                raise ModelStoreError(f"{path} is not a model store")
+            (header_length,) = struct.unpack_from("<Q", self._mmap, len(MAGIC))
+            start = len(MAGIC) + 8
+            header = json.loads(self._mmap[start:start + header_length].decode("utf-8"))
+        except (struct.error, ValueError) as e:
+            self._mmap.close()
+            raise ModelStoreError(f"{path} has a corrupt header: {e}")
+
+        self.metadata = header.get("metadata", {})
+        self._entries = header["arrays"]
+        self._arrays = {}
+
+    def __contains__(self, name):
+        return name in self._entries
+
+    def __getitem__(self, name):
+        """Zero-copy, read-only view of one array"""
+        array = self._arrays.get(name)
+        if array is None:
+            entry = self._entries[name]
+            dtype = np.dtype(entry["dtype"])
+            shape = tuple(entry["shape"])
+            count = int(np.prod(shape, dtype=np.int64))
+            array = np.frombuffer(self._mmap, dtype=dtype, count=count, offset=entry["offset"]).reshape(shape)
+            self._arrays[name] = array
+        return array
+
+    def names(self):
+        return sorted(self._entries)
+
+    def strings(self, name):
+        """Decode a fixed-width UTF-8 string array into a list"""
+        return [value.decode("utf-8") for value in self[name]]
+
+    def is_stale(self):
+        """True once the path has been replaced (or removed) since this store was opened"""
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return True
+        return (stat.st_dev, stat.st_ino) != self._identity
+
+    def close(self):
+        """Drop the mapping - only safe once no views of its arrays are in use"""
+        self._arrays.clear()
+        self._mmap.close()
+
+    def info(self):
+        return {
+            "path": self.path,
+            "size_bytes": self.size,
+            "arrays": {name: {"dtype": entry["dtype"], "shape": entry["shape"]}
+                       for name, entry in sorted(self._entries.items())},
+            "metadata": self.metadata
+        }
+
+def build_template_store(template_dir, out_path, languages=("asl", "gsl")):
+    """Convert <language>.npz template vocabularies into one store of precomputed features"""
+    from template_translator import TemplateVocabulary
+
+    arrays = {}
+    found = []
+    for language in languages:
+        source = os.path.join(template_dir, f"{language}.npz")
+        if not os.path.exists(source):
+            continue
+        vocabulary = TemplateVocabulary.from_file(source)
+        arrays[f"{language}/features"] = vocabulary.features
+        arrays[f"{language}/labels"] = encode_strings(vocabulary.labels)
+        found.append({"language": language, "templates": len(vocabulary), "dims": vocabulary.dims})
+    if not found:
+        raise ModelStoreError(f"No <language>.npz vocabularies in {template_dir}")
+    write_store(out_path, arrays, {"kind": "templates", "vocabularies": found})
+    return found
+
+def main():
+    parser = argparse.ArgumentParser(description="Build or inspect a memory-mapped model store")
+    commands = parser.add_subparsers(dest="command", required=True)
+    build = commands.add_parser("build", help="convert template vocabularies into a store")
+    build.add_argument("--templates", required=True, help="directory of <language>.npz files")
+    build.add_argument("--out", required=True)
+    info = commands.add_parser("info", help="print a store's header")
+    info.add_argument("path")
+    args = parser.parse_args()
+
+    if args.command == "build":
+        for entry in build_template_store(args.templates, args.out):
+            print(f"📚 {entry['language'].upper()}: {entry['templates']} templates")
+        print(f"✅ Wrote {args.out}")
+    else:
+        print(json.dumps(ModelStore(args.path).info(), indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+LinguaSigna ML Server - Motion Gating
+Skips detection and translation for frames where the signer hasn't moved
+
+Each session keeps a small reference signature of the last frame that was
+actually translated: a 32x24 grayscale thumbnail for images, or the raw
+coordinates for landmark frames. A new frame whose motion score against
+that reference is below the session's threshold reuses the previous
+result. Comparing against the last translated frame (not just the
+previous one) stops slow drift from being reused forever, and max_reuse
+caps how many frames in a row can be skipped.
+"""
+
+import threading
+
+from frame_decoder import decode_gray_thumbnail, is_landmark_array
+
+THUMBNAIL_SIZE = (32, 24)
+
+class MotionGate:
+    """Decides per session whether a frame can reuse the last translation"""
+
+    def __init__(self, threshold=0.02, max_reuse=5):
+        # Defaults for sessions that don't set their own
+        self.threshold = float(threshold)
+        self.max_reuse = int(max_reuse)
+        self._lock = threading.Lock()
+
+        self.frames_checked = 0
+        self.frames_reused = 0
+
+    def signature(self, image_data):
+        """Cheap motion signature for a frame, or None if it can't be computed"""
+        import numpy as np
+
+        if image_data is None:
+            return None
+        if is_landmark_array(image_data):
+            return np.array(image_data, dtype=np.float32)
+
+        thumbnail = decode_gray_thumbnail(image_data, reduction=8)
+        if thumbnail is None:
+            return None
+
+        import cv2
+        small = cv2.resize(thumbnail, THUMBNAIL_SIZE, interpolation=cv2.INTER_AREA)
+        return small.astype(np.float32) * (1.0 / 255.0)
+
+    def motion_score(self, reference, signature):
+        """0 for identical frames; mean pixel change or mean landmark displacement"""
+        import numpy as np
+
+        if reference is None or signature is None or reference.shape != signature.shape:
+            return float("inf")
+        if signature.ndim == 3:
+            # Landmarks: mean Euclidean displacement per point (normalized coords)
+            return float(np.sqrt(((signature - reference) ** 2).sum(axis=-1)).mean()) if signature.size else 0.0
+        return float(np.abs(signature - reference).mean())
+
+    def check(self, session, image_data, language):
+        """Return (signature, reuse) for a frame of this session"""
+        signature = self.signature(image_data)
+        threshold = session.motion_threshold if session.motion_threshold is not None else self.threshold
+        max_reuse = session.motion_max_reuse if session.motion_max_reuse is not None else self.max_reuse
+
+        reuse = (
+            session.motion_reference is not None
+            and session.motion_language == language
+            and session.consecutive_reuse < max_reuse
+            and self.motion_score(session.motion_reference, signature) < threshold
+        )
+
+        with self._lock:
+            self.frames_checked += 1
+            if reuse:
+                self.frames_reused += 1
+        if reuse:
+            session.consecutive_reuse += 1
+            session.frames_reused += 1
+        return signature, reuse
+
+    def record(self, session, signature, language, result):
+        """Make a freshly translated frame the session's new reference"""
+        session.motion_reference = signature
+        session.motion_language = language
+        session.motion_result = result
+        session.consecutive_reuse = 0
+
+    def stats(self):
+        return {
+            "enabled": True,
+            "default_threshold": self.threshold,
+            "default_max_reuse": self.max_reuse,
+            "frames_checked": self.frames_checked,
+            "frames_reused": self.frames_reused,
+            "reuse_rate": round(self.frames_reused / self.frames_checked, 3) if self.frames_checked else 0.0
+        }
@@ -0,0 +1,474 @@
+#!/usr/bin/env python3
+"""
+LinguaSigna ML Server - Health and Saturation Probes
+Liveness, readiness and load answers that never wait behind /translate
+
+A SaturationMonitor thread samples the server every ML_PROBE_REFRESH_MS:
+frames admitted and waiting (admission control), frames queued for
+inference (batcher / worker pool), requests in flight, and the p99 of
+requests that finished in the last ML_PROBE_WINDOW_S seconds. From those it
+derives a 0-1 load score - the tightest of inference slot use, admission
+queue fill and p99 against ML_LOAD_TARGET_P99_MS - that a balancer can use
+for weighted routing (e.g. weight = 1 - load). Every probe body is encoded
+once per sample, so answering a probe is a dictionary lookup.
+
+A ProbeServer answers /health/live, /health/ready and /health/load on its
+own port (ML_PROBE_PORT) from a small listener process that the monitor
+pushes each encoded sample to over a pipe. Probes therefore share neither
+the accept queue, request threads and event loop nor the GIL with
+inference; the listener prebuilds every response when a sample arrives and
+runs at a raised priority (ML_PROBE_NICE), so a probe costs one recv() and
+one send() even with every core busy. Readings are at most one refresh interval old; if samples stop
+arriving (a wedged server) the listener answers 503 "stale", and it exits
+with the server. The main servers expose the same snapshot at /health/load.
+benchmark_probe_latency.py measures the probe port while /translate is
+saturated and exits 1 if its p99 is over 5 ms (--max-ms).
+
+Under ml_server_prefork.py every server worker runs its own monitor and
+listener, all bound to the probe port with SO_REUSEPORT (set only there,
+so a second plain server on the same port fails to start its probes), and
+the kernel hands each probe connection to one of them. A probe response is
+therefore one worker's view - its own in-flight requests, queues, p99 and
+load score, with its pid in the body - not the whole server's; a balancer
+sees every worker over a few probes.
+"""
+
+import argparse
+import os
+import select
+import selectors
+import signal
+import socket
+import struct
+import subprocess
+import sys
+import threading
+import time
+
+from serialization import dumps_json
+
+class SaturationMonitor:
+    """Periodically samples saturation signals and pre-encodes the probe responses"""
+
+    def __init__(self, collect, metrics, target_p99_ms=500.0, window_s=10.0, refresh_ms=100.0):
+        self.collect = collect
+        self.metrics = metrics
+        self.target_p99_ms = max(1.0, float(target_p99_ms))
+        self.window_s = float(window_s)
+        self.refresh_s = max(0.01, float(refresh_ms) / 1000.0)
+        self._snapshot = None
+        self._responses = {}
+        self._lock = threading.Lock()
+        self._thread = None
+        self._running = False
+        self._stopped = threading.Event()
+        self._subscribers = []
+
+        # Stats reported through /status
+        self.samples = 0
+        self.sample_errors = 0
+
+    def start(self):
+        """Start the sampling thread (idempotent)"""
+        with self._lock:
+            if self._running:
+                return
+            self._running = True
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self._run, name="health-probe", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._running = False
+        self._stopped.set()
+
+    def subscribe(self, callback):
+        """Call callback(responses) with the encoded responses after every sample"""
+        self._subscribers.append(callback)
+
+    def _run(self):
+        while self._running:
+            try:
+                self.refresh()
+            except Exception as e:
+                self.sample_errors += 1
+                self.metrics.record_error("probe_sample")
+                print(f"⚠️  Health probe sample failed: {type(e).__name__}: {e}")
+            # An Event wait rather than sleep() so profiles see this thread as parked
+            self._stopped.wait(self.refresh_s)
+
+    def refresh(self):
+        """Take one sample and swap in freshly encoded probe responses"""
+        signals = self.collect()
+        latencies = sorted(self.metrics.recent_latencies(self.window_s))
+        p99_ms = latencies[min(len(latencies) - 1, int(0.99 * len(latencies)))] * 1000.0 if latencies else 0.0
+
+        utilization = signals["admitted"] / signals["capacity"] if signals["capacity"] else 0.0
+        queue_fill = signals["waiting"] / signals["max_queued"] if signals["max_queued"] else 0.0
+        latency_pressure = p99_ms / self.target_p99_ms
+        load = min(1.0, max(utilization, queue_fill, latency_pressure))
+
+        snapshot = {
+            "status": "ready" if signals["ready"] else signals["state"],
+            "ready": signals["ready"],
+            "pid": os.getpid(),
+            "load": round(load, 3),
+            "in_flight": signals["in_flight"],
+            "queue_depth": signals["queue_depth"],
+            "admitted": signals["admitted"],
+            "waiting": signals["waiting"],
+            "capacity": signals["capacity"],
+            "p99_ms": round(p99_ms, 3),
+            "requests_per_s": round(len(latencies) / self.window_s, 2),
+            "window_s": self.window_s,
+            "sampled_at": int(time.time() * 1000)
+        }
+        live = {"status": "alive", "pid": snapshot["pid"], "sampled_at": snapshot["sampled_at"]}
+        ready = {key: snapshot[key] for key in ("status", "ready", "load", "sampled_at")}
+        responses = {
+            "/health/live": (200, dumps_json(live)),
+            "/health/ready": (200 if signals["ready"] else 503, dumps_json(ready)),
+            "/health/load": (200, dumps_json(snapshot)),
+        }
+        self._snapshot = snapshot
+        self._responses = responses
+        self.samples += 1
+        for callback in self._subscribers:
+            callback(responses)
+        return snapshot
+
+    def snapshot(self):
+        """Latest sample (taken now if the sampler hasn't run yet)"""
+        snapshot = self._snapshot
+        if snapshot is None:
+            snapshot = self.refresh()
+        return dict(snapshot)
+
+    def response_map(self):
+        """Latest encoded responses: path -> (status_code, body)"""
+        if not self._responses:
+            self.refresh()
+        return self._responses
+
+    def stats(self):
+        return {
+            "enabled": self._running,
+            "refresh_ms": self.refresh_s * 1000.0,
+            "window_s": self.window_s,
+            "target_p99_ms": self.target_p99_ms,
+            "samples": self.samples,
+            "sample_errors": self.sample_errors
+        }
+
+# Probe listener process: framed snapshots arrive on stdin as
+# <u32 frame length> <u16 ready status> <u32 live, ready, load body lengths> <bodies>
+_FRAME_LENGTH = struct.Struct("<I")
+_FRAME_HEADER = struct.Struct("<HIII")
+
+def encode_frame(responses):
+    """One stdin frame for the listener process from a monitor's encoded responses"""
+    ready_status, ready = responses["/health/ready"]
+    live = responses["/health/live"][1]
+    load = responses["/health/load"][1]
+    payload = _FRAME_HEADER.pack(ready_status, len(live), len(ready), len(load)) + live + ready + load
+    return _FRAME_LENGTH.pack(len(payload)) + payload
+
+def decode_frame(payload):
+    """Inverse of encode_frame() (without the length prefix) - path -> (status, body)"""
+    ready_status, live_length, ready_length, load_length = _FRAME_HEADER.unpack_from(payload)
+    offset = _FRAME_HEADER.size
+    live = payload[offset:offset + live_length]
+    offset += live_length
+    ready = payload[offset:offset + ready_length]
+    offset += ready_length
+    load = payload[offset:offset + load_length]
+    responses = {"/health/live": (200, live), "/health/ready": (ready_status, ready), "/health/load": (200, load)}
+    responses["/health"] = responses["/"] = responses["/health/live"]
+    return responses
+
+_STATUS_TEXT = {200: b"OK", 404: b"Not Found", 503: b"Service Unavailable"}
+
+# Largest request head a probe may send
+_MAX_REQUEST_BYTES = 8192
+
+def http_response(status_code, body, keep_alive=True, head=False):
+    """Complete HTTP/1.1 response bytes for a JSON body"""
+    headers = (
+        b"HTTP/1.1 %d %s\r\n"
+        b"Content-Type: application/json\r\n"
+        b"Content-Length: %d\r\n"
+        b"Cache-Control: no-store\r\n"
+        b"Connection: %s\r\n\r\n"
+    ) % (status_code, _STATUS_TEXT.get(status_code, b"Unknown"), len(body),
+         b"keep-alive" if keep_alive else b"close")
+    return headers if head else headers + body
+
+class _ProbeListener:
+    """Single-threaded probe HTTP server for the listener process
+
+    Responses are prebuilt whenever a snapshot arrives, so a probe costs one
+    recv() and one send(); snapshots are read from stdin in the same
+    selector loop, so no thread ever waits on another for the GIL.
+    """
+
+    def __init__(self, host, port, stale_s, feed, reuse_port=False):
+        self.stale_s = stale_s
+        self.socket = socket.socket(socket.AF_INET6 if ":" in host else socket.AF_INET, socket.SOCK_STREAM)
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if reuse_port and hasattr(socket, "SO_REUSEPORT"):
+            # Forked server workers (ml_server_prefork.py) each run a listener on the probe port
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        self.socket.bind((host, port))
+        self.socket.listen(128)
+        self.socket.setblocking(False)
+        self.feed = feed
+        os.set_blocking(feed, False)
+        self.selector = selectors.DefaultSelector()
+        self.selector.register(self.socket, selectors.EVENT_READ, "accept")
+        self.selector.register(feed, selectors.EVENT_READ, "feed")
+        self._feed_buffer = bytearray()
+        self.responses = {}
+        self.updated = time.monotonic()
+
+    def serve_forever(self):
+        while True:
+            for key, events in self.selector.select():
+                if key.data == "accept":
+                    self._accept()
+                elif key.data == "feed":
+                    self._read_feed()
+                elif events & selectors.EVENT_READ:
+                    self._read(key.fileobj, key.data)
+                else:
+                    self._flush(key.fileobj, key.data)
+
+    def _accept(self):
+        try:
+            connection, _ = self.socket.accept()
+        except (BlockingIOError, InterruptedError):
+            return
+        connection.setblocking(False)
+        connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.selector.register(connection, selectors.EVENT_READ, {"in": bytearray(), "out": bytearray()})
+
+    def _read_feed(self):
+        """Apply framed snapshots from the server; exit once it closes the pipe"""
+        try:
+            data = os.read(self.feed, 65536)
+        except BlockingIOError:
+            return
+        if not data:
+            # The server process stopped or died
+            os._exit(0)
+        buffer = self._feed_buffer
+        buffer += data
+        while len(buffer) >= _FRAME_LENGTH.size:
+            (length,) = _FRAME_LENGTH.unpack_from(buffer)
+            end = _FRAME_LENGTH.size + length
+            if len(buffer) < end:
+                break
+            decoded = decode_frame(bytes(buffer[_FRAME_LENGTH.size:end]))
+            del buffer[:end]
+            self.responses = {path: (status, body, http_response(status, body),
+                                     http_response(status, body, head=True))
+                              for path, (status, body) in decoded.items()}
+            self.updated = time.monotonic()
+
+    def respond(self, method, path, keep_alive):
+        """Response bytes for one request - 503 once the server stops sending snapshots"""
+        age = time.monotonic() - self.updated
+        head = method == b"HEAD"
+        if not self.responses or age > self.stale_s:
+            body = dumps_json({"status": "stale", "ready": False, "age_s": round(age, 3)})
+            return http_response(503, body, keep_alive, head)
+        prebuilt = self.responses.get(path.split(b"?", 1)[0].decode("latin-1"))
+        if prebuilt is None:
+            return http_response(404, dumps_json({"error": "Unknown probe"}), keep_alive, head)
+        status, body, full, headers_only = prebuilt
+        if not keep_alive:
+            return http_response(status, body, keep_alive=False, head=head)
+        return headers_only if head else full
+
+    def _read(self, connection, state):
+        try:
+            data = connection.recv(4096)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            data = b""
+        if not data:
+            self._close(connection)
+            return
+        buffer = state["in"]
+        buffer += data
+        close = False
+        while True:
+            end = buffer.find(b"\r\n\r\n")
+            if end < 0:
+                if len(buffer) > _MAX_REQUEST_BYTES:
+                    self._close(connection)
+                    return
+                break
+            head = bytes(buffer[:end])
+            del buffer[:end + 4]
+            request_line, _, header_block = head.partition(b"\r\n")
+            parts = request_line.split()
+            if len(parts) != 3:
+                state["out"] += http_response(404, b"{}", keep_alive=False)
+                close = True
+                break
+            method, path, version = parts
+            headers = header_block.lower()
+            keep_alive = (b"connection: close" not in headers
+                          and (version == b"HTTP/1.1" or b"connection: keep-alive" in headers))
+            state["out"] += self.respond(method, path, keep_alive)
+            if not keep_alive:
+                close = True
+                break
+        state["close"] = close
+        self._flush(connection, state)
+
+    def _flush(self, connection, state):
+        out = state["out"]
+        try:
+            sent = connection.send(out) if out else 0
+        except (BlockingIOError, InterruptedError):
+            sent = 0
+        except OSError:
+            self._close(connection)
+            return
+        del out[:sent]
+        if out:
+            self.selector.modify(connection, selectors.EVENT_READ | selectors.EVENT_WRITE, state)
+            return
+        if state.get("close"):
+            self._close(connection)
+            return
+        self.selector.modify(connection, selectors.EVENT_READ, state)
+
+    def _close(self, connection):
+        try:
+            self.selector.unregister(connection)
+        except (KeyError, ValueError):
+            pass
+        connection.close()
+
+class ProbeServer:
+    """Dedicated probe listener, run as a small child process fed by the monitor
+
+    The child has its own interpreter, so answering a probe never waits for
+    the GIL of a server busy with inference. It reports "stale" (503) when
+    no snapshot arrived for stale_s seconds, e.g. a wedged server process,
+    and exits when the server does.
+    """
+
+    def __init__(self, monitor, host="0.0.0.0", port=5001, stale_s=5.0, nice=0, reuse_port=False):
+        self.monitor = monitor
+        self.host = host
+        self.port = port
+        self.stale_s = stale_s
+        self.nice = nice
+        # Share the port with sibling listeners - only for pre-forked server workers
+        self.reuse_port = reuse_port
+        self._process = None
+        self._write_lock = threading.Lock()
+        # Tail of a frame a full pipe cut short, sent before the next one
+        self._pending = b""
+        self.publish_errors = 0
+        self.dropped = 0
+
+    def start(self, timeout=5.0):
+        """Start the listener process - False (with a warning) if it can't serve the port"""
+        command = [sys.executable, os.path.abspath(__file__), "--host", self.host, "--port", str(self.port),
+                   "--stale-s", str(self.stale_s), "--nice", str(self.nice)]
+        if self.reuse_port:
+            command.append("--reuse-port")
+        self._process = subprocess.Popen(
+            command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE
+        )
+        ready, _, _ = select.select([self._process.stdout], [], [], timeout)
+        line = self._process.stdout.readline().decode("utf-8", "replace").strip() if ready else ""
+        if line != "ready":
+            print(f"⚠️  Health probe port {self.port} unavailable: {line or 'listener did not start'}")
+            self.stop()
+            return False
+        # publish() runs on the sampler thread - a stalled listener must not block it
+        os.set_blocking(self._process.stdin.fileno(), False)
+        self.monitor.subscribe(self.publish)
+        self.publish(self.monitor.response_map())
+        return True
+
+    def publish(self, responses):
+        """Send a fresh snapshot to the listener - never blocks, drops it if the pipe is full"""
+        process = self._process
+        if process is None:
+            return
+        frame = encode_frame(responses)
+        try:
+            with self._write_lock:
+                fd = process.stdin.fileno()
+                if self._pending:
+                    # Finish the cut-short frame first so the stream stays framed
+                    self._pending = self._pending[os.write(fd, self._pending):]
+                    if self._pending:
+                        self.dropped += 1
+                        return
+                self._pending = frame[os.write(fd, frame):]
+        except BlockingIOError:
+            # The listener is behind - it keeps answering from the snapshot it has
+            self.dropped += 1
+        except (BrokenPipeError, OSError, ValueError):
+            self.publish_errors += 1
+            if self.publish_errors == 1:
+                print(f"⚠️  Health probe listener on port {self.port} exited")
+
+    def stats(self):
+        return {
+            "enabled": self._process is not None,
+            "port": self.port,
+            "dropped": self.dropped,
+            "publish_errors": self.publish_errors
+        }
+
+    def stop(self):
+        process, self._process = self._process, None
+        if process is None:
+            return
+        try:
+            process.stdin.close()
+        except OSError:
+            pass
+        try:
+            process.wait(2.0)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+def main():
+    parser = argparse.ArgumentParser(description="Health probe listener (started by ProbeServer)")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, required=True)
+    parser.add_argument("--stale-s", type=float, default=5.0)
+    parser.add_argument("--nice", type=int, default=0)
+    parser.add_argument("--reuse-port", action="store_true", help="bind with SO_REUSEPORT (pre-forked workers)")
+    args = parser.parse_args()
+
+    # The server's Ctrl+C reaches the whole process group - leave shutdown to stdin EOF
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    if args.nice:
+        try:
+            os.nice(args.nice)
+        except OSError:
+            # Raising priority needs CAP_SYS_NICE - run at the server's priority instead
+            pass
+    try:
+        listener = _ProbeListener(args.host, args.port, args.stale_s, sys.stdin.fileno(), args.reuse_port)
+    except OSError as e:
+        print(f"{type(e).__name__}: {e}", flush=True)
+        sys.exit(1)
+    print("ready", flush=True)
+    listener.serve_forever()
+
+if __name__ == "__main__":
+    main()
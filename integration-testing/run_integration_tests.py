@@ -10,83 +10,151 @@ import sys
 import signal
 import os
 import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from step3_1_integration_test import IntegrationTester
 
+# Both servers print a line containing this once they are up
+READY_MARKER = "ready for integration testing"
+
+# Lines of each server's output kept for dumping on failure
+LOG_TAIL_LINES = 200
+
+# Readiness probe backoff: first retry delay, doubling up to the cap
+PROBE_INITIAL_DELAY = 0.01
+PROBE_MAX_DELAY = 0.5
+
+class OutputDrain:
+    """Reads a child process's output on a background thread into a ring buffer
+    
+    Keeps the pipe from filling up (which would stall the server) and wakes
+    readiness probing as soon as the server prints its ready line or exits.
+    """
+    
+    def __init__(self, name, stream, ready_marker=READY_MARKER, max_lines=LOG_TAIL_LINES):
+        self.name = name
+        self.stream = stream
+        self.ready_marker = ready_marker
+        self.lines = deque(maxlen=max_lines)
+        self.wake = threading.Event()
+        self.thread = threading.Thread(target=self._drain, name=f"drain-{name}", daemon=True)
+        self.thread.start()
+    
+    def _drain(self):
+        try:
+            for line in iter(self.stream.readline, ''):
+                self.lines.append(line.rstrip('\n'))
+                if self.ready_marker in line:
+                    self.wake.set()
+        except (OSError, ValueError):
+            pass
+        finally:
+            self.wake.set()
+    
+    def dump(self):
+        """Print the most recent output lines"""
+        print(f"\n📜 Last {len(self.lines)} lines from {self.name}:")
+        print("-" * 60)
+        for line in list(self.lines):
+            print(f"   {line}")
+        print("-" * 60)
+
 class TestRunner:
     def __init__(self):
         self.ml_process = None
         self.backend_process = None
         self.processes = []
+        self.drains = {}
     
-    def start_ml_server(self):
-        """Start the ML server"""
-        print("🚀 Starting ML Server...")
+    def start_server(self, name, command, env=None):
+        """Start one server with its output drained into a ring buffer"""
+        print(f"🚀 Starting {name}...")
         try:
-            self.ml_process = subprocess.Popen([
-                sys.executable, 'ml_server.py'
-            ], stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
-            self.processes.append(self.ml_process)
-            print("✅ ML Server process started")
-            return True
+            process = subprocess.Popen(
+                command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True,
+                env=dict(os.environ, **(env or {}))
+            )
+            self.processes.append(process)
+            self.drains[name] = OutputDrain(name, process.stdout)
+            print(f"✅ {name} process started")
+            return process
         except Exception as e:
-            print(f"❌ Failed to start ML Server: {e}")
-            return False
+            print(f"❌ Failed to start {name}: {e}")
+            return None
+    
+    def start_ml_server(self):
+        """Start the ML server"""
+        # Unbuffered so the ready line reaches the drain as soon as it's printed
+        self.ml_process = self.start_server(
+            "ML Server", [sys.executable, 'ml_server.py'], {"PYTHONUNBUFFERED": "1"}
+        )
+        return self.ml_process is not None
     
     def start_backend_server(self):
         """Start the Backend server"""
-        print("🚀 Starting Backend Server...")
-        try:
-            self.backend_process = subprocess.Popen([
-                'node', 'backend_server.js'
-            ], stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
-            self.processes.append(self.backend_process)
-            print("✅ Backend Server process started")
-            return True
-        except Exception as e:
-            print(f"❌ Failed to start Backend Server: {e}")
-            return False
+        self.backend_process = self.start_server("Backend Server", ['node', 'backend_server.js'])
+        return self.backend_process is not None
+    
+    def wait_for_server(self, name, url, process, deadline):
+        """Probe url with exponential backoff until it answers 200
+        
+        A ready line on the server's output or the process exiting cuts
+        the current backoff short.
+        """
+        import requests
+        
+        drain = self.drains[name]
+        delay = PROBE_INITIAL_DELAY
+        started = time.perf_counter()
+        while True:
+            if process.poll() is not None:
+                print(f"❌ {name} exited with code {process.returncode}")
+                return False
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                return False
+            try:
+                response = requests.get(url, timeout=min(1.0, remaining))
+                if response.status_code == 200:
+                    print(f"✅ {name} is ready! ({(time.perf_counter() - started) * 1000:.0f} ms)")
+                    return True
+            except requests.exceptions.RequestException:
+                pass
+            drain.wake.wait(min(delay, max(0.0, deadline - time.perf_counter())))
+            drain.wake.clear()
+            delay = min(delay * 2, PROBE_MAX_DELAY)
     
     def wait_for_servers(self, timeout=15):
-        """Wait for both servers to be ready"""
+        """Wait for both servers to be ready, probing them in parallel"""
         print("⏳ Waiting for servers to be ready...")
         
-        import requests
-        ml_ready = False
-        backend_ready = False
+        deadline = time.perf_counter() + timeout
+        checks = {
+            "ML Server": ('http://localhost:5000/health/ready', self.ml_process),
+            "Backend Server": ('http://localhost:3000/health', self.backend_process),
+        }
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            futures = {
+                name: executor.submit(self.wait_for_server, name, url, process, deadline)
+                for name, (url, process) in checks.items()
+            }
+            ready = {name: future.result() for name, future in futures.items()}
         
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            # Check ML server
-            if not ml_ready:
-                try:
-                    response = requests.get('http://localhost:5000/health', timeout=2)
-                    if response.status_code == 200:
-                        ml_ready = True
-                        print("✅ ML Server is ready!")
-                except:
-                    pass
-            
-            # Check Backend server
-            if not backend_ready:
-                try:
-                    response = requests.get('http://localhost:3000/health', timeout=2)
-                    if response.status_code == 200:
-                        backend_ready = True
-                        print("✅ Backend Server is ready!")
-                except:
-                    pass
-            
-            if ml_ready and backend_ready:
-                print("🎉 Both servers are ready!")
-                return True
-            
-            time.sleep(1)
+        if all(ready.values()):
+            print("🎉 Both servers are ready!")
+            return True
         
         print(f"❌ Servers not ready after {timeout}s")
-        print(f"   ML Server ready: {ml_ready}")
-        print(f"   Backend Server ready: {backend_ready}")
+        for name, is_ready in ready.items():
+            print(f"   {name} ready: {is_ready}")
+        self.dump_logs()
         return False
     
+    def dump_logs(self):
+        """Print the buffered output of every server"""
+        for drain in self.drains.values():
+            drain.dump()
+    
     def stop_servers(self):
         """Stop all server processes"""
         print("🛑 Stopping servers...")
@@ -131,7 +199,7 @@ class TestRunner:
         print("=" * 60)
         
         try:
-            tester = IntegrationTester()
+            tester = IntegrationTester(concurrent=True)
             test_success = tester.run_integration_tests()
             
             print("\n" + "=" * 60)
@@ -142,11 +210,13 @@ class TestRunner:
             else:
                 print("❌ INTEGRATION TESTS FAILED!")
                 print("🔧 Review the errors above and fix before proceeding")
+                self.dump_logs()
             
             return test_success
         
         except Exception as e:
             print(f"💥 Integration test error: {e}")
+            self.dump_logs()
             return False
         
         finally:
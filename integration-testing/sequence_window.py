@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+LinguaSigna ML Server - Sliding-Window Sequence Recognition
+Recognizes dynamic signs from the last N landmark frames of a session
+
+Single frames can't tell a wave from a raised hand. Each session keeps a
+LandmarkWindow: a ring buffer of its signer's last N hand poses in one
+preallocated (N, 21, dims) array, plus the frame-to-frame velocities. The
+window features - mean pose, pose spread, mean velocity, path length per
+landmark and net displacement - are kept as running sums that are updated
+in O(1) per frame (add the new frame, subtract the one falling out) instead
+of being recomputed over the whole window.
+
+A SequenceClassifier matches the window features against a vocabulary of
+recorded signs with one cosine-similarity product, the same way the
+template translator matches single poses. Windows live on the session, so
+they are freed with it when the registry evicts idle sessions.
+"""
+
+import os
+import threading
+
+import numpy as np
+
+from landmark_features import LANDMARKS_PER_HAND
+
+# Rebuild the running sums from the ring after this many windows' worth of
+# updates so float rounding can't drift
+_RESYNC_WINDOWS = 64
+
+class LandmarkWindow:
+    """Ring buffer of one signer's recent hand poses with incremental window features"""
+
+    def __init__(self, size=30, dims=2, max_gap=5):
+        self.size = max(2, int(size))
+        self.dims = dims
+        self.max_gap = max(0, int(max_gap))
+        shape = (self.size, LANDMARKS_PER_HAND, dims)
+        self.poses = np.zeros(shape, dtype=np.float32)
+        self.velocities = np.zeros(shape, dtype=np.float32)
+        self.speeds = np.zeros((self.size, LANDMARKS_PER_HAND), dtype=np.float32)
+
+        # Running sums over the frames in the window
+        self._pose_sum = np.zeros((LANDMARKS_PER_HAND, dims), dtype=np.float64)
+        self._pose_sq_sum = np.zeros((LANDMARKS_PER_HAND, dims), dtype=np.float64)
+        self._velocity_sum = np.zeros((LANDMARKS_PER_HAND, dims), dtype=np.float64)
+        self._speed_sum = np.zeros(LANDMARKS_PER_HAND, dtype=np.float64)
+        self._scratch = np.empty((LANDMARKS_PER_HAND, dims), dtype=np.float32)
+
+        self.count = 0
+        self.head = 0  # slot the next frame is written to
+        self.gap = 0
+        self.updates = 0
+
+    def clear(self):
+        self.count = 0
+        self.head = 0
+        self.gap = 0
+        for total in (self._pose_sum, self._pose_sq_sum, self._velocity_sum, self._speed_sum):
+            total.fill(0.0)
+
+    def push(self, hand):
+        """Add one (21, dims) hand pose, or None for a frame without hands"""
+        if hand is None:
+            self.gap += 1
+            if self.gap > self.max_gap:
+                self.clear()
+            return
+        self.gap = 0
+
+        slot = self.head
+        if self.count == self.size:
+            # Oldest frame falls out of the window; velocity of the frame after
+            # it is no longer a step inside the window either
+            old = self.poses[slot]
+            self._pose_sum -= old
+            self._pose_sq_sum -= old * old
+            following = (slot + 1) % self.size
+            self._velocity_sum -= self.velocities[following]
+            self._speed_sum -= self.speeds[following]
+
+        pose = self.poses[slot]
+        pose[...] = hand[:, :self.dims]
+        self._pose_sum += pose
+        np.multiply(pose, pose, out=self._scratch)
+        self._pose_sq_sum += self._scratch
+
+        if self.count > 0:
+            previous = self.poses[(slot - 1) % self.size]
+            velocity = self.velocities[slot]
+            np.subtract(pose, previous, out=velocity)
+            speed = self.speeds[slot]
+            np.einsum('ld,ld->l', velocity, velocity, out=speed)
+            np.sqrt(speed, out=speed)
+            self._velocity_sum += velocity
+            self._speed_sum += speed
+        else:
+            self.velocities[slot].fill(0.0)
+            self.speeds[slot].fill(0.0)
+
+        self.head = (slot + 1) % self.size
+        self.count = min(self.count + 1, self.size)
+        self.updates += 1
+        if self.updates % (self.size * _RESYNC_WINDOWS) == 0:
+            self._resync()
+
+    def _resync(self):
+        """Recompute the running sums from the ring contents"""
+        order = self.order()
+        poses = self.poses[order].astype(np.float64)
+        self._pose_sum[...] = poses.sum(axis=0)
+        self._pose_sq_sum[...] = (poses * poses).sum(axis=0)
+        # The oldest frame's velocity points outside the window
+        steps = order[1:]
+        self._velocity_sum[...] = self.velocities[steps].sum(axis=0, dtype=np.float64)
+        self._speed_sum[...] = self.speeds[steps].sum(axis=0, dtype=np.float64)
+
+    def order(self):
+        """Ring slots from oldest to newest"""
+        start = (self.head - self.count) % self.size
+        return (start + np.arange(self.count)) % self.size
+
+    def is_full(self):
+        return self.count == self.size
+
+    def features(self, out=None):
+        """Window feature row: mean pose, pose spread, mean velocity, path length, displacement"""
+        if out is None:
+            out = np.empty(window_feature_size(self.dims), dtype=np.float32)
+        if self.count == 0:
+            out.fill(0.0)
+            return out
+
+        points = LANDMARKS_PER_HAND * self.dims
+        count = self.count
+        steps = max(1, count - 1)
+        mean = self._pose_sum / count
+        variance = np.maximum(self._pose_sq_sum / count - mean * mean, 0.0)
+        newest = self.poses[(self.head - 1) % self.size]
+        oldest = self.poses[(self.head - count) % self.size]
+
+        out[:points] = mean.ravel()
+        out[points:2 * points] = np.sqrt(variance).ravel()
+        out[2 * points:3 * points] = (self._velocity_sum / steps).ravel()
+        out[3 * points:3 * points + LANDMARKS_PER_HAND] = self._speed_sum
+        np.subtract(newest, oldest, out=out[3 * points + LANDMARKS_PER_HAND:].reshape(LANDMARKS_PER_HAND, self.dims))
+        return out
+
+def window_feature_size(dims=2):
+    """Length of a window feature row"""
+    return 4 * LANDMARKS_PER_HAND * dims + LANDMARKS_PER_HAND
+
+def sequence_features(sequence, window_size=None):
+    """Window features of a recorded (frames, 21, dims) sign, as a server window would see it"""
+    sequence = np.asarray(sequence, dtype=np.float32)
+    window = LandmarkWindow(size=window_size or len(sequence), dims=sequence.shape[-1])
+    for pose in sequence:
+        window.push(pose)
+    return window.features()
+
+class SequenceClassifier:
+    """Cosine nearest-neighbour over window features of recorded signs"""
+
+    def __init__(self, labels, sequences, window_size=None):
+        if len(labels) != len(sequences):
+            raise ValueError("Sequence labels and recordings differ in length")
+        self.labels = np.asarray(labels, dtype=object)
+        self.dims = np.asarray(sequences[0]).shape[-1] if len(sequences) else 2
+        rows = [sequence_features(sequence, window_size) for sequence in sequences]
+        self.features = _unit_rows(np.array(rows, dtype=np.float32).reshape(len(rows), -1))
+
+    @classmethod
+    def from_file(cls, path, window_size=None):
+        """Load "labels" (M,) and "sequences" (M, frames, 21, dims) from an .npz file"""
+        with np.load(path, allow_pickle=False) as data:
+            return cls(data["labels"].astype(str), data["sequences"], window_size)
+
+    @classmethod
+    def synthetic(cls, words, frames=30, dims=2, seed=0):
+        """Random hand trajectories for a word list (for tests and benchmarks)"""
+        rng = np.random.default_rng(seed)
+        start = rng.random((len(words), 1, LANDMARKS_PER_HAND, dims), dtype=np.float32)
+        drift = rng.normal(0.0, 0.01, (len(words), 1, 1, dims)).astype(np.float32)
+        steps = np.arange(frames, dtype=np.float32)[None, :, None, None]
+        return cls(words, start + drift * steps, frames)
+
+    def __len__(self):
+        return len(self.labels)
+
+    def classify(self, features):
+        """(label, similarity) of the best match for one window feature row"""
+        if not len(self):
+            return None, 0.0
+        row = _unit_rows(features.reshape(1, -1).copy())
+        scores = self.features @ row[0]
+        best = int(np.argmax(scores))
+        return str(self.labels[best]), float(scores[best])
+
+def _unit_rows(rows):
+    norms = np.sqrt(np.einsum('nf,nf->n', rows, rows))
+    np.maximum(norms, 1e-6, out=norms)
+    rows /= norms[:, None]
+    return rows
+
+class SequenceRecognizer:
+    """Feeds each session's window and classifies it once enough frames arrived"""
+
+    def __init__(self, window_size=30, min_frames=None, min_confidence=0.9, max_gap=5,
+                 sequence_dir="", words=None):
+        self.window_size = max(2, int(window_size))
+        self.min_frames = min(self.window_size, int(min_frames or self.window_size))
+        self.min_confidence = float(min_confidence)
+        self.max_gap = int(max_gap)
+        self.sequence_dir = sequence_dir
+        self.classifiers = {language: self._load_classifier(language, language_words)
+                            for language, language_words in (words or {}).items()}
+        self._lock = threading.Lock()
+
+        self.frames_pushed = 0
+        self.windows_classified = 0
+        self.sequences_recognized = 0
+
+    def _load_classifier(self, language, words):
+        path = os.path.join(self.sequence_dir, f"{language}.npz") if self.sequence_dir else None
+        if path and os.path.exists(path):
+            classifier = SequenceClassifier.from_file(path, self.window_size)
+            print(f"📚 Loaded {len(classifier)} {language.upper()} sequences from {path}")
+            return classifier
+        return SequenceClassifier.synthetic(words, self.window_size)
+
+    def add_language(self, language, words):
+        """Recognize sequences of a language added while the server runs"""
+        if language not in self.classifiers:
+            # Swap in a new table - update() reads it without the lock
+            self.classifiers = dict(self.classifiers, **{language: self._load_classifier(language, words)})
+
+    def window(self, session, dims):
+        window = session.sequence_window
+        if window is None or window.dims != dims:
+            window = session.sequence_window = LandmarkWindow(self.window_size, dims, self.max_gap)
+        return window
+
+    def update(self, session, language, hands):
+        """Push a frame's primary hand (or None) - returns {"text", "confidence"} or None"""
+        if session.sequence_language != language:
+            # A new language starts a new sequence
+            session.sequence_language = language
+            if session.sequence_window is not None:
+                session.sequence_window.clear()
+
+        classifier = self.classifiers.get(language)
+        if hands is None or len(hands) == 0:
+            if session.sequence_window is not None:
+                session.sequence_window.push(None)
+            return None
+
+        dims = classifier.dims if classifier is not None else hands.shape[-1]
+        if hands.shape[-1] < dims:
+            return None
+        window = self.window(session, dims)
+        window.push(hands[0])
+        with self._lock:
+            self.frames_pushed += 1
+        if classifier is None or window.count < self.min_frames:
+            return None
+
+        label, confidence = classifier.classify(window.features())
+        with self._lock:
+            self.windows_classified += 1
+            if confidence >= self.min_confidence:
+                self.sequences_recognized += 1
+        if confidence < self.min_confidence:
+            return None
+        return {"text": label, "confidence": round(min(1.0, confidence), 4), "frames": window.count}
+
+    def stats(self):
+        return {
+            "enabled": True,
+            "window_size": self.window_size,
+            "min_frames": self.min_frames,
+            "min_confidence": self.min_confidence,
+            "vocabulary": {language: len(classifier) for language, classifier in self.classifiers.items()},
+            "frames_pushed": self.frames_pushed,
+            "windows_classified": self.windows_classified,
+            "sequences_recognized": self.sequences_recognized
+        }
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+LinguaSigna ML Server - Response Serialization
+Content negotiation and fast encoding for every JSON-shaped response
+
+Clients choose the wire format with the Accept header: MessagePack
+(application/msgpack, application/x-msgpack or application/vnd.msgpack)
+or compact JSON (the default). JSON is encoded with orjson when it is
+installed, else the standard library without whitespace; MessagePack needs
+the msgpack package and is only offered when it imports.
+
+Payload builders put RESPONSE_TIME where a response timestamp belongs and
+the encoder fills it in once per response: an ISO-8601 string by default,
+or integer epoch milliseconds when the client sends
+X-Timestamp-Format: epoch (or ?timestamps=epoch), which is cheaper to
+produce and to parse on the client.
+"""
+
+import json
+import time
+from datetime import datetime
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+JSON_CONTENT_TYPE = "application/json"
+MSGPACK_CONTENT_TYPE = "application/msgpack"
+MSGPACK_TYPES = ("application/msgpack", "application/x-msgpack", "application/vnd.msgpack")
+JSON_TYPES = ("application/json", "application/*", "*/*")
+
+TIMESTAMP_HEADER = "X-Timestamp-Format"
+TIMESTAMP_PARAM = "timestamps"
+
+class _ResponseTime:
+    """Placeholder for "the time this response is sent" - see stamp()"""
+
+    __slots__ = ()
+
+    def __repr__(self):
+        return "RESPONSE_TIME"
+
+RESPONSE_TIME = _ResponseTime()
+
+@lru_cache(maxsize=256)
+def negotiate(accept):
+    """"msgpack" or "json" for an Accept header value (cached - clients repeat theirs)"""
+    if not accept or msgpack is None:
+        return "json"
+    best_msgpack = 0.0
+    best_json = 0.0
+    for item in accept.split(","):
+        media_type, *params = item.strip().split(";")
+        media_type = media_type.strip().lower()
+        quality = 1.0
+        for param in params:
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if media_type in MSGPACK_TYPES:
+            best_msgpack = max(best_msgpack, quality)
+        elif media_type in JSON_TYPES:
+            best_json = max(best_json, quality)
+    return "msgpack" if best_msgpack > best_json else "json"
+
+def wants_epoch(value):
+    """True for an X-Timestamp-Format / ?timestamps= value asking for epoch integers"""
+    return bool(value) and value.strip().lower() in ("epoch", "epoch_ms", "unix")
+
+def response_time(epoch=False):
+    return int(time.time() * 1000) if epoch else datetime.now().isoformat()
+
+def stamp(body, epoch=False):
+    """Replace RESPONSE_TIME placeholders (top level and "results" items) in place"""
+    now = None
+    if body.get("timestamp") is RESPONSE_TIME:
+        now = response_time(epoch)
+        body["timestamp"] = now
+    for item in body.get("results") or ():
+        if isinstance(item, dict) and item.get("timestamp") is RESPONSE_TIME:
+            if now is None:
+                now = response_time(epoch)
+            item["timestamp"] = now
+    return body
+
+def _default(value):
+    """Fallback for values the encoders don't know (NumPy scalars and arrays)"""
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    if value is RESPONSE_TIME:
+        return response_time()
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+def dumps_json(body):
+    if orjson is not None:
+        return orjson.dumps(body, default=_default,
+                            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(body, separators=(",", ":"), ensure_ascii=False, default=_default).encode("utf-8")
+
+def dumps_msgpack(body):
+    return msgpack.packb(body, use_bin_type=True, default=_default)
+
+def encode(body, fmt="json", epoch=False):
+    """Stamp and encode a response body - returns (bytes, content type)"""
+    stamp(body, epoch)
+    if fmt == "msgpack" and msgpack is not None:
+        return dumps_msgpack(body), MSGPACK_CONTENT_TYPE
+    return dumps_json(body), JSON_CONTENT_TYPE
+
+def response_format(headers, query=None):
+    """(format, epoch) a request asked for through its headers / query string"""
+    epoch = wants_epoch(headers.get(TIMESTAMP_HEADER) or (query.get(TIMESTAMP_PARAM) if query else None))
+    return negotiate(headers.get("Accept")), epoch
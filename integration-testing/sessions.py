@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+LinguaSigna ML Server - Translation Sessions
+Per-client state that lives across frames of one streaming session
+"""
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+def parse_motion_options(threshold=None, max_reuse=None):
+    """Validate motion gate overrides - (threshold, max_reuse), None where not given
+
+    Raises TypeError / ValueError before anything is applied.
+    """
+    if threshold is not None:
+        threshold = max(0.0, float(threshold))
+    if max_reuse is not None:
+        max_reuse = max(0, int(max_reuse))
+    return threshold, max_reuse
+
+class TranslationSession:
+    """State kept for one signer between frames"""
+
+    def __init__(self, language="asl", session_id=None):
+        self.session_id = session_id or uuid.uuid4().hex
+        self.language = language
+        self.created_at = time.time()
+        self.last_seen = time.monotonic()
+
+        # Held while the hand track and sequence window below are read or
+        # updated - requests naming the same session can run in parallel
+        self.state_lock = threading.Lock()
+
+        # Sequence numbers: frames are numbered in arrival order, and a
+        # result older than the newest one already sent is dropped
+        self.next_seq = 1
+        self.last_sent_seq = 0
+
+        self.frames_received = 0
+        self.results_sent = 0
+        self.results_dropped = 0
+        self.last_result = None
+
+        # Motion gating (see motion_gate.py); None means use the server default
+        self.motion_threshold = None
+        self.motion_max_reuse = None
+        self.motion_reference = None
+        self.motion_language = None
+        self.motion_result = None
+        self.consecutive_reuse = 0
+        self.frames_reused = 0
+
+        # Hand ROI tracking (see hand_tracking.py): last hand box, normalized x,y,w,h
+        self.hand_box = None
+        self.hand_language = None
+        self.hand_tracked_frames = 0
+
+        # Dynamic sign recognition (see sequence_window.py), created on first use
+        self.sequence_window = None
+        self.sequence_language = None
+
+    def touch(self):
+        self.last_seen = time.monotonic()
+
+    def next_frame(self):
+        """Assign the next sequence number to an incoming frame"""
+        seq = self.next_seq
+        self.next_seq += 1
+        self.frames_received += 1
+        self.touch()
+        return seq
+
+    def accept_result(self, seq, result):
+        """Record a finished result; False if a newer one was already sent"""
+        if seq <= self.last_sent_seq:
+            self.results_dropped += 1
+            return False
+        self.last_sent_seq = seq
+        self.last_result = result
+        self.results_sent += 1
+        return True
+
+    def configure_motion(self, threshold=None, max_reuse=None):
+        """Override the motion gate threshold / reuse window for this session"""
+        threshold, max_reuse = parse_motion_options(threshold, max_reuse)
+        if threshold is not None:
+            self.motion_threshold = threshold
+        if max_reuse is not None:
+            self.motion_max_reuse = max_reuse
+
+    def to_dict(self):
+        return {
+            "session_id": self.session_id,
+            "language": self.language,
+            "frames_received": self.frames_received,
+            "results_sent": self.results_sent,
+            "results_dropped": self.results_dropped,
+            "frames_reused": self.frames_reused,
+            "idle_seconds": round(time.monotonic() - self.last_seen, 1)
+        }
+
+class SessionRegistry:
+    """Thread-safe session table with idle eviction and a size bound"""
+
+    def __init__(self, idle_timeout=60.0, max_sessions=10000, session_factory=TranslationSession):
+        self.idle_timeout = idle_timeout
+        self.max_sessions = max_sessions
+        self.session_factory = session_factory
+        self._sessions = OrderedDict()
+        self._lock = threading.Lock()
+        self.evicted = 0
+        # Lookups sweep the whole table at most this often, so idle sessions
+        # (and their frame windows) are freed even when no new ones open
+        self.sweep_interval = max(1.0, idle_timeout / 4)
+        self._next_sweep = time.monotonic() + self.sweep_interval
+
+    def create(self, language="asl", session_id=None):
+        """Open a new session, evicting idle or oldest sessions if needed"""
+        session = self.session_factory(language=language, session_id=session_id)
+        with self._lock:
+            self._evict_idle_locked()
+            while len(self._sessions) >= self.max_sessions:
+                self._sessions.popitem(last=False)
+                self.evicted += 1
+            self._sessions[session.session_id] = session
+        return session
+
+    def get(self, session_id):
+        """Look up a live session and mark it as recently used"""
+        with self._lock:
+            if time.monotonic() >= self._next_sweep:
+                self._evict_idle_locked()
+            session = self._sessions.get(session_id)
+            if session is None:
+                return None
+            if time.monotonic() - session.last_seen > self.idle_timeout:
+                del self._sessions[session_id]
+                self.evicted += 1
+                return None
+            self._sessions.move_to_end(session_id)
+            session.touch()
+            return session
+
+    def get_or_create(self, session_id, language="asl"):
+        """Return the named session, creating it if it doesn't exist"""
+        return self.get(session_id) or self.create(language, session_id)
+
+    def remove(self, session_id):
+        with self._lock:
+            return self._sessions.pop(session_id, None)
+
+    def evict_idle(self):
+        """Drop sessions idle for longer than idle_timeout"""
+        with self._lock:
+            return self._evict_idle_locked()
+
+    def _evict_idle_locked(self):
+        now = time.monotonic()
+        self._next_sweep = now + self.sweep_interval
+        cutoff = now - self.idle_timeout
+        # Streaming sessions touch themselves without going through get(),
+        # so the table order is only approximately LRU - check every entry
+        idle = [session_id for session_id, session in self._sessions.items()
+                if session.last_seen <= cutoff]
+        for session_id in idle:
+            del self._sessions[session_id]
+        self.evicted += len(idle)
+        return len(idle)
+
+    def __len__(self):
+        return len(self._sessions)
+
+    def stats(self):
+        return {
+            "active_sessions": len(self._sessions),
+            "max_sessions": self.max_sessions,
+            "idle_timeout_s": self.idle_timeout,
+            "evicted": self.evicted
+        }
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+LinguaSigna ML Server - Sign Translator
+Mock translator used by the integration-testing ML server
+"""
+
+import random
+import time
+from datetime import datetime
+
+ASL_WORDS = [
+    "Hello", "Thank you", "Please", "Sorry", "Yes", "No",
+    "Good morning", "How are you?", "Nice to meet you"
+]
+GSL_WORDS = [
+    "Akwaaba", "Medaase", "Mepa wo kyɛw", "Kafra", "Aane", "Daabi",
+    "Mema wo akye", "Wo ho te sɛn?", "Me ani agye"
+]
+
+WORDS = {"asl": ASL_WORDS, "gsl": GSL_WORDS}
+
+def words_for(language):
+    """Built-in vocabulary for a language (ASL's for languages without one)"""
+    return WORDS.get(language, ASL_WORDS)
+
+def frame_error(message, language):
+    """Result for a frame the backend can't classify - the rest of its batch still is"""
+    return {"error": message, "language": language}
+
+class SimpleSignTranslator:
+    def __init__(self, languages=None):
+        # Languages this instance serves - None for all of them
+        self.languages = list(languages) if languages else None
+    
+    def translate(self, image_data, language="asl"):
+        """Mock translation - returns random sign language word"""
+        return self.translate_batch([(image_data, language)])[0]
+    
+    def translate_batch(self, frames):
+        """Translate a list of (image_data, language) pairs in one call
+        
+        image_data is either encoded image bytes or a (hands, 21, 2|3)
+        landmark array from the landmark API.
+        """
+        # Simulate processing time - paid once per batch, not per frame
+        time.sleep(0.1)
+        
+        return self._translate_frames(frames)
+    
+    def _translate_frames(self, frames):
+        features = self._landmark_features(frames)
+        return [
+            self._translate_one(image_data, language, features.get(index))
+            for index, (image_data, language) in enumerate(frames)
+        ]
+    
+    def _landmark_features(self, frames):
+        """Hand features for every landmark frame in the batch, in one vectorized pass"""
+        landmark_frames = [
+            (index, image_data) for index, (image_data, _) in enumerate(frames)
+            if self._is_landmarks(image_data) and image_data.shape[0] > 0
+        ]
+        if not landmark_frames:
+            return {}
+        
+        from landmark_features import extract_features
+        import numpy as np
+        
+        features = {}
+        # 2D and 3D landmarks have different feature widths - one pass per kind
+        for dims in {hands.shape[-1] for _, hands in landmark_frames}:
+            group = [(index, hands) for index, hands in landmark_frames if hands.shape[-1] == dims]
+            rows = extract_features(np.concatenate([hands for _, hands in group]))
+            start = 0
+            for index, hands in group:
+                features[index] = rows[start:start + len(hands)]
+                start += len(hands)
+        return features
+    
+    def _is_landmarks(self, image_data):
+        shape = getattr(image_data, "shape", None)
+        return shape is not None and len(shape) == 3
+    
+    def _has_hands(self, image_data):
+        if image_data is None:
+            return False
+        if self._is_landmarks(image_data):
+            # Landmark array - one entry per detected hand
+            return image_data.shape[0] > 0
+        return len(image_data) > 10  # Basic validation
+    
+    def _translate_one(self, image_data, language, features=None):
+        # features: (hands, feature_size) rows from landmark_features for
+        # landmark frames - unused by the mock, consumed by real classifiers
+        # Simple logic: if image_data exists, return translation
+        if self.languages is not None and language not in self.languages:
+            # A per-language lane only answers for its own language
+            return frame_error(f"Unsupported language: {language}", language)
+        if self._has_hands(image_data):
+            translation = random.choice(words_for(language))
+            confidence = random.uniform(0.80, 0.95)
+            
+            return {
+                "text": translation,
+                "confidence": confidence,
+                "language": language,
+                "timestamp": datetime.now().isoformat()
+            }
+        else:
+            return None
@@ -15,33 +15,106 @@ import os
 from datetime import datetime
 import base64
 import random
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import lru_cache
 
 # Test configuration
 BACKEND_URL = "http://localhost:3000"
 ML_URL = "http://localhost:5000"
 TEST_TIMEOUT = 30  # seconds
 
+# Shared test user - logged in once and reused by the tests that need a user
+TEST_USER = {
+    "email": "integration_test@example.com",
+    "password": "test123"
+}
+
+# test method -> tests that must have passed before it runs (concurrent mode)
+TEST_DEPENDENCIES = {
+    "test_translation_session": ["test_user_authentication"],
+    "test_video_room_creation": ["test_user_authentication"],
+    "test_end_to_end_flow": ["test_backend_health", "test_ml_health", "test_user_authentication"],
+}
+
+@lru_cache(maxsize=1)
+def make_test_image():
+    """Synthetic hand frame as JPEG bytes (also used by benchmark_translate_load.py)
+    
+    Encoded once per process - the bytes are immutable, so callers share them.
+    """
+    # Create test image (simple black square with white circle)
+    import numpy as np
+    test_image = np.zeros((100, 100, 3), dtype=np.uint8)
+    
+    # Add a white circle to simulate hand
+    center = (50, 50)
+    radius = 20
+    y, x = np.ogrid[:100, :100]
+    mask = (x - center[0])**2 + (y - center[1])**2 <= radius**2
+    test_image[mask] = [255, 255, 255]
+    
+    import cv2
+    _, buffer = cv2.imencode('.jpg', test_image)
+    return buffer.tobytes()
+
 class IntegrationTester:
-    def __init__(self):
+    def __init__(self, concurrent=False, max_workers=4):
         self.backend_process = None
         self.ml_process = None
         self.test_results = []
+        self.concurrent = concurrent
+        self.max_workers = max_workers
+        
+        # One pooled session for every request, so connections are reused
+        self.http = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=2, pool_maxsize=max(4, max_workers))
+        self.http.mount("http://", adapter)
+        
+        # Login response for TEST_USER, cached by login()
+        self.auth = None
+        self.auth_lock = threading.Lock()
+        self.output_lock = threading.Lock()
+        self.current = threading.local()
     
     def log_test(self, test_name, success, message=""):
         """Log test results"""
         status = "✅ PASS" if success else "❌ FAIL"
-        print(f"{status}: {test_name}")
-        if message:
-            print(f"    {message}")
+        started = getattr(self.current, "started", None)
+        duration_ms = round((time.perf_counter() - started) * 1000.0, 1) if started else None
         
-        self.test_results.append({
-            "test": test_name,
-            "success": success,
-            "message": message,
-            "timestamp": datetime.now().isoformat()
-        })
+        with self.output_lock:
+            print(f"{status}: {test_name}" + (f" ({duration_ms:.0f} ms)" if duration_ms is not None else ""))
+            if message:
+                print(f"    {message}")
+            
+            self.test_results.append({
+                "test": test_name,
+                "success": success,
+                "message": message,
+                "duration_ms": duration_ms,
+                "timestamp": datetime.now().isoformat()
+            })
         return success
     
+    def login(self):
+        """Log TEST_USER in once and reuse the user and token - None if login fails"""
+        with self.auth_lock:
+            if self.auth is None:
+                response = self.http.post(f"{BACKEND_URL}/auth/login", 
+                                          json=TEST_USER, timeout=10)
+                if response.status_code == 200:
+                    self.remember_auth(response.json())
+            return self.auth
+    
+    def remember_auth(self, data):
+        """Cache a successful login for the tests that need a user"""
+        if data.get("success") and data.get("user") and data.get("token"):
+            self.auth = data
+    
+    def auth_headers(self, auth):
+        """Bearer header for one request - the shared session is used by parallel tests, so it never carries one"""
+        return {"Authorization": f"Bearer {auth['token']}"}
+    
     def wait_for_server(self, url, timeout=10, server_name="Server"):
         """Wait for server to be ready"""
         print(f"🔄 Waiting for {server_name} at {url}...")
@@ -49,7 +122,7 @@ class IntegrationTester:
         start_time = time.time()
         while time.time() - start_time < timeout:
             try:
-                response = requests.get(url, timeout=2)
+                response = self.http.get(url, timeout=2)
                 print(f"✅ {server_name} is ready!")
                 return True
             except requests.exceptions.RequestException:
@@ -61,11 +134,11 @@ class IntegrationTester:
     def test_backend_health(self):
         """Test 1: Backend server health check"""
         try:
-            response = requests.get(f"{BACKEND_URL}/health", timeout=5)
+            response = self.http.get(f"{BACKEND_URL}/health", timeout=5)
             
             if response.status_code == 404:
                 # Health endpoint doesn't exist, try root
-                response = requests.get(BACKEND_URL, timeout=5)
+                response = self.http.get(BACKEND_URL, timeout=5)
             
             if response.status_code in [200, 404]:  # Server responding
                 return self.log_test("Backend Health Check", True, 
@@ -80,11 +153,11 @@ class IntegrationTester:
     def test_ml_health(self):
         """Test 2: ML server health check"""
         try:
-            response = requests.get(f"{ML_URL}/health", timeout=5)
+            response = self.http.get(f"{ML_URL}/health", timeout=5)
             
             if response.status_code == 404:
                 # Health endpoint doesn't exist, try root
-                response = requests.get(ML_URL, timeout=5)
+                response = self.http.get(ML_URL, timeout=5)
             
             if response.status_code in [200, 404]:  # Server responding
                 return self.log_test("ML Server Health Check", True, 
@@ -99,16 +172,13 @@ class IntegrationTester:
     def test_user_authentication(self):
         """Test 3: User authentication flow"""
         try:
-            user_data = {
-                "email": "integration_test@example.com",
-                "password": "test123"
-            }
-            
-            response = requests.post(f"{BACKEND_URL}/auth/login", 
-                                   json=user_data, timeout=10)
+            with self.auth_lock:
+                response = self.http.post(f"{BACKEND_URL}/auth/login", 
+                                       json=TEST_USER, timeout=10)
+                data = response.json() if response.status_code == 200 else {}
+                self.remember_auth(data)
             
             if response.status_code == 200:
-                data = response.json()
                 if data.get("success") and data.get("user") and data.get("token"):
                     return self.log_test("User Authentication", True, 
                                        f"User created: {data['user']['email']}")
@@ -125,20 +195,14 @@ class IntegrationTester:
     def test_translation_session(self):
         """Test 4: Translation session creation"""
         try:
-            # First authenticate to get user
-            user_data = {
-                "email": "integration_test@example.com",
-                "password": "test123"
-            }
-            
-            auth_response = requests.post(f"{BACKEND_URL}/auth/login", 
-                                        json=user_data, timeout=10)
+            # Reuse the authenticated test user
+            auth = self.login()
             
-            if auth_response.status_code != 200:
+            if auth is None:
                 return self.log_test("Translation Session", False, 
                                    "Authentication failed")
             
-            user = auth_response.json()["user"]
+            user = auth["user"]
             
             # Create translation session
             session_data = {
@@ -146,8 +210,8 @@ class IntegrationTester:
                 "language": "asl"
             }
             
-            response = requests.post(f"{BACKEND_URL}/translation/start", 
-                                   json=session_data, timeout=10)
+            response = self.http.post(f"{BACKEND_URL}/translation/start", 
+                                   json=session_data, headers=self.auth_headers(auth), timeout=10)
             
             if response.status_code == 200:
                 data = response.json()
@@ -167,21 +231,8 @@ class IntegrationTester:
     def test_ml_translation(self):
         """Test 5: ML translation API"""
         try:
-            # Create test image (simple black square with white circle)
-            import numpy as np
-            test_image = np.zeros((100, 100, 3), dtype=np.uint8)
-            
-            # Add a white circle to simulate hand
-            center = (50, 50)
-            radius = 20
-            y, x = np.ogrid[:100, :100]
-            mask = (x - center[0])**2 + (y - center[1])**2 <= radius**2
-            test_image[mask] = [255, 255, 255]
-            
             # Convert to base64
-            import cv2
-            _, buffer = cv2.imencode('.jpg', test_image)
-            image_base64 = base64.b64encode(buffer).decode('utf-8')
+            image_base64 = base64.b64encode(make_test_image()).decode('utf-8')
             
             # Send to ML API
             payload = {
@@ -189,7 +240,7 @@ class IntegrationTester:
                 'language': 'asl'
             }
             
-            response = requests.post(f"{ML_URL}/translate", 
+            response = self.http.post(f"{ML_URL}/translate", 
                                    json=payload, timeout=10)
             
             if response.status_code == 200:
@@ -214,26 +265,20 @@ class IntegrationTester:
     def test_video_room_creation(self):
         """Test 6: Video room creation and joining"""
         try:
-            # Authenticate first
-            user_data = {
-                "email": "integration_test@example.com", 
-                "password": "test123"
-            }
-            
-            auth_response = requests.post(f"{BACKEND_URL}/auth/login", 
-                                        json=user_data, timeout=10)
+            # Reuse the authenticated test user
+            auth = self.login()
             
-            if auth_response.status_code != 200:
+            if auth is None:
                 return self.log_test("Video Room Creation", False, 
                                    "Authentication failed")
             
-            user = auth_response.json()["user"]
+            user = auth["user"]
             
             # Create room
             room_data = {"userId": user["id"]}
             
-            response = requests.post(f"{BACKEND_URL}/rooms/create", 
-                                   json=room_data, timeout=10)
+            response = self.http.post(f"{BACKEND_URL}/rooms/create", 
+                                   json=room_data, headers=self.auth_headers(auth), timeout=10)
             
             if response.status_code == 200:
                 data = response.json()
@@ -254,20 +299,15 @@ class IntegrationTester:
     def test_end_to_end_flow(self):
         """Test 7: Complete end-to-end user flow"""
         try:
-            # Step 1: User authentication
-            user_data = {
-                "email": f"e2e_test_{int(time.time())}@example.com",
-                "password": "test123"
-            }
+            # Step 1: User authentication (the shared test user)
+            auth = self.login()
             
-            auth_response = requests.post(f"{BACKEND_URL}/auth/login", 
-                                        json=user_data, timeout=10)
-            
-            if auth_response.status_code != 200:
+            if auth is None:
                 return self.log_test("End-to-End Flow", False, 
                                    "Step 1: Authentication failed")
             
-            user = auth_response.json()["user"]
+            user = auth["user"]
+            headers = self.auth_headers(auth)
             
             # Step 2: Create translation session
             session_data = {
@@ -275,8 +315,8 @@ class IntegrationTester:
                 "language": "asl"
             }
             
-            session_response = requests.post(f"{BACKEND_URL}/translation/start", 
-                                           json=session_data, timeout=10)
+            session_response = self.http.post(f"{BACKEND_URL}/translation/start", 
+                                           json=session_data, headers=headers, timeout=10)
             
             if session_response.status_code != 200:
                 return self.log_test("End-to-End Flow", False, 
@@ -285,8 +325,8 @@ class IntegrationTester:
             # Step 3: Create video room
             room_data = {"userId": user["id"]}
             
-            room_response = requests.post(f"{BACKEND_URL}/rooms/create", 
-                                        json=room_data, timeout=10)
+            room_response = self.http.post(f"{BACKEND_URL}/rooms/create", 
+                                        json=room_data, headers=headers, timeout=10)
             
             if room_response.status_code != 200:
                 return self.log_test("End-to-End Flow", False, 
@@ -300,7 +340,7 @@ class IntegrationTester:
                 'language': 'asl'
             }
             
-            ml_response = requests.post(f"{ML_URL}/translate", 
+            ml_response = self.http.post(f"{ML_URL}/translate", 
                                       json=test_payload, timeout=10)
             
             if ml_response.status_code != 200:
@@ -313,6 +353,51 @@ class IntegrationTester:
         except Exception as e:
             return self.log_test("End-to-End Flow", False, str(e))
     
+    def run_test(self, test):
+        """Run one test, timing it for test_results"""
+        self.current.started = time.perf_counter()
+        try:
+            return test()
+        finally:
+            self.current.started = None
+    
+    def run_tests_concurrently(self, tests):
+        """Run tests on a thread pool, each starting once its TEST_DEPENDENCIES pass"""
+        names = {test.__name__ for test in tests}
+        results = {}
+        remaining = list(tests)
+        running = {}
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers,
+                                thread_name_prefix="integration-test") as executor:
+            while remaining or running:
+                progressed = False
+                for test in list(remaining):
+                    dependencies = [name for name in TEST_DEPENDENCIES.get(test.__name__, [])
+                                    if name in names]
+                    if any(name not in results for name in dependencies):
+                        continue
+                    remaining.remove(test)
+                    progressed = True
+                    failed = [name for name in dependencies if not results[name]]
+                    if failed:
+                        # Docstrings read "Test N: <name>"
+                        title = test.__doc__.split(": ", 1)[-1]
+                        results[test.__name__] = self.log_test(
+                            title, False, f"Skipped - depends on {', '.join(failed)}"
+                        )
+                        continue
+                    running[executor.submit(self.run_test, test)] = test
+                
+                if not running:
+                    if not progressed:
+                        break  # Circular dependencies - nothing left can start
+                    continue
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    results[running.pop(future).__name__] = future.result()
+        return results
+    
     def run_integration_tests(self):
         """Run all integration tests"""
         print("🚀 LinguaSigna ML + Backend Integration Testing")
@@ -340,18 +425,24 @@ class IntegrationTester:
             self.test_end_to_end_flow
         ]
         
-        print(f"\n🧪 Running {len(tests)} integration tests...")
+        mode = f"concurrently on {self.max_workers} threads" if self.concurrent else "serially"
+        print(f"\n🧪 Running {len(tests)} integration tests {mode}...")
         print("-" * 55)
         
-        for test in tests:
-            test()
-            print("-" * 55)
+        started = time.perf_counter()
+        if self.concurrent:
+            self.run_tests_concurrently(tests)
+        else:
+            for test in tests:
+                self.run_test(test)
+                print("-" * 55)
+        wall_ms = (time.perf_counter() - started) * 1000.0
         
         # Summary
         passed = sum(1 for result in self.test_results if result['success'])
         total = len(self.test_results)
         
-        print(f"\n📊 INTEGRATION TEST RESULTS: {passed}/{total} PASSED")
+        print(f"\n📊 INTEGRATION TEST RESULTS: {passed}/{total} PASSED in {wall_ms:.0f} ms")
         
         if passed == total:
             print("🎉 ALL INTEGRATION TESTS PASSED!")
@@ -365,7 +456,14 @@ class IntegrationTester:
 
 def main():
     """Main integration test runner"""
-    tester = IntegrationTester()
+    import argparse
+    parser = argparse.ArgumentParser(description="LinguaSigna ML + Backend integration tests")
+    parser.add_argument("--concurrent", action="store_true",
+                        help="run independent tests in parallel (dependencies still ordered)")
+    parser.add_argument("--workers", type=int, default=4, help="threads for --concurrent")
+    args = parser.parse_args()
+    
+    tester = IntegrationTester(concurrent=args.concurrent, max_workers=args.workers)
     
     try:
         success = tester.run_integration_tests()
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+LinguaSigna Integration Test - Step 3.2
+ML server behaviour that needs no backend server: each test spawns its own
+ML server (or drives the translation service in-process) with the settings
+it checks, so they run independently of run_integration_tests.py
+"""
+
+import base64
+import glob
+import importlib.util
+import os
+import subprocess
+import sys
+import threading
+import time
+from collections import Counter
+
+import requests
+
+from step3_1_integration_test import make_test_image
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Ports well away from the defaults (5000 / 5001) and from the benchmarks
+BASE_PORT = 5600
+
+ADMIN_TOKEN = "step3-2-admin-token"
+
+def start_ml_server(port, env=None, script="ml_server.py", timeout=20):
+    """Spawn an ML server with extra settings and wait until /health answers"""
+    # No probe listener unless a test asks for one
+    env = dict(dict(os.environ, ML_PORT=str(port), ML_PROBE_PORT="0"), **(env or {}))
+    process = subprocess.Popen(
+        [sys.executable, script],
+        cwd=HERE,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"{script} exited with code {process.returncode}")
+        try:
+            if requests.get(f"http://127.0.0.1:{port}/health", timeout=1).status_code == 200:
+                return process
+        except requests.exceptions.RequestException:
+            time.sleep(0.1)
+    process.kill()
+    raise RuntimeError(f"{script} did not start on port {port}")
+
+def stop_ml_server(process):
+    process.terminate()
+    try:
+        process.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        process.kill()
+
+def translate_payload(language):
+    return {"image": base64.b64encode(make_test_image()).decode("utf-8"), "language": language}
+
+def test_add_language_keeps_lanes_serving():
+    """Test 1: A language lane added at runtime while ASL and GSL keep serving"""
+    print("🧪 Testing POST /admin/languages under load...")
+    port = BASE_PORT
+    url = f"http://127.0.0.1:{port}"
+    server = start_ml_server(port, {
+        "ML_LANGUAGE_WORKERS": "asl=0,gsl=0",
+        "ML_ADMIN_TOKEN": ADMIN_TOKEN,
+        "ML_CACHE_ENABLED": "0",
+    })
+    stop = threading.Event()
+    served = Counter()
+    failures = []
+
+    def keep_translating(language):
+        http = requests.Session()
+        while not stop.is_set():
+            try:
+                response = http.post(f"{url}/translate", json=translate_payload(language), timeout=10)
+                if response.status_code == 200 and response.json().get("success"):
+                    served[language] += 1
+                else:
+                    failures.append(f"{language}: HTTP {response.status_code} {response.text[:100]}")
+            except requests.exceptions.RequestException as e:
+                failures.append(f"{language}: {e}")
+
+    try:
+        threads = [threading.Thread(target=keep_translating, args=(language,)) for language in ("asl", "gsl")]
+        for thread in threads:
+            thread.start()
+        time.sleep(1.0)
+
+        before = requests.post(f"{url}/translate", json=translate_payload("bsl"), timeout=10)
+        assert before.status_code == 400, f"BSL before it was added: HTTP {before.status_code}"
+        denied = requests.post(f"{url}/admin/languages", json={"language": "bsl"}, timeout=10)
+        assert denied.status_code == 401, f"Admin call without token: HTTP {denied.status_code}"
+
+        served_before_add = dict(served)
+        added = requests.post(f"{url}/admin/languages", json={"language": "bsl", "processes": 0},
+                              headers={"Authorization": f"Bearer {ADMIN_TOKEN}"}, timeout=30)
+        assert added.status_code == 201, f"Adding BSL: HTTP {added.status_code} {added.text}"
+        assert "bsl" in added.json()["languages_supported"], "BSL missing from languages_supported"
+
+        after = requests.post(f"{url}/translate", json=translate_payload("bsl"), timeout=10)
+        assert after.status_code == 200 and after.json().get("success"), f"BSL after adding: {after.text}"
+        time.sleep(1.0)
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+        status = requests.get(f"{url}/status", timeout=10).json()
+        stop_ml_server(server)
+
+    try:
+        assert not failures, f"{len(failures)} ASL/GSL requests failed, first: {failures[0]}"
+        for language in ("asl", "gsl"):
+            assert served[language] > served_before_add.get(language, 0), \
+                f"{language.upper()} stopped serving after BSL was added"
+        assert "bsl" in status["languages_supported"], "/status doesn't list BSL"
+        print(f"✅ ASL {served['asl']} / GSL {served['gsl']} requests served, none failed, BSL added: PASS")
+        return True
+    except AssertionError as e:
+        print(f"❌ Adding a language FAILED: {e}")
+        return False
+
+def wait_for_probe(url, timeout=10):
+    """First answer from the probe listener, which starts a moment after the server"""
+    deadline = time.time() + timeout
+    while True:
+        try:
+            return requests.get(url, timeout=1)
+        except requests.exceptions.RequestException:
+            if time.time() > deadline:
+                raise
+            time.sleep(0.1)
+
+def test_lazy_backend_ready_on_both_ports():
+    """Test 2: A lazy backend reads as ready on the main and the probe port"""
+    print("🧪 Testing readiness with ML_BACKEND_WARMUP=lazy...")
+    results = {}
+    for script in ("ml_server.py", "ml_server_asgi.py"):
+        port = BASE_PORT + 10
+        server = start_ml_server(port, {
+            "ML_BACKEND_WARMUP": "lazy",
+            "ML_PROBE_PORT": str(port + 1),
+            "ML_PROBE_REFRESH_MS": "50",
+        }, script)
+        try:
+            main = requests.get(f"http://127.0.0.1:{port}/health/ready", timeout=5)
+            probe = wait_for_probe(f"http://127.0.0.1:{port + 1}/health/ready")
+            state = requests.get(f"http://127.0.0.1:{port}/status", timeout=5).json()["backend"]["state"]
+            results[script] = (main.status_code, probe.status_code, probe.json().get("status"), state)
+        finally:
+            stop_ml_server(server)
+
+    try:
+        for script, (main_status, probe_status, probe_state, backend_state) in results.items():
+            # Nothing has loaded the backend yet - that's the case that must read as ready
+            assert backend_state == "unloaded", f"{script}: backend already {backend_state}"
+            assert main_status == 200, f"{script}: main port /health/ready HTTP {main_status}"
+            assert probe_status == 200 and probe_state == "ready", \
+                f"{script}: probe port /health/ready HTTP {probe_status} ({probe_state})"
+        print("✅ Unloaded lazy backend is ready on both ports (flask and asgi): PASS")
+        return True
+    except AssertionError as e:
+        print(f"❌ Lazy readiness FAILED: {e}")
+        return False
+
+def test_mediapipe_sessions_independent():
+    """Test 3: Interleaved sessions and crops don't change each other's MediaPipe detections"""
+    print("🧪 Testing MediaPipe detection across interleaved sessions...")
+    if importlib.util.find_spec("mediapipe") is None:
+        print("⏭️  Skipped - mediapipe not installed (pip install mediapipe opencv-python)")
+        return None
+    from frame_decoder import CroppedFrame
+    from mediapipe_translator import MediaPipeSignTranslator
+    import numpy as np
+
+    # Real hand photos make this meaningful: ML_TEST_HAND_FRAMES='frames/*.jpg'
+    paths = sorted(glob.glob(os.environ.get("ML_TEST_HAND_FRAMES", "")))[:2]
+    frames = []
+    for path in paths:
+        with open(path, "rb") as f:
+            frames.append(f.read())
+    while len(frames) < 2:
+        frames.append(make_test_image())
+    session_a = frames[0]
+    # The second session sends another frame, and the tracker crops it to one corner
+    session_b = CroppedFrame(frames[1], (0.5, 0.5, 0.5, 0.5), fallback=False)
+
+    alone = MediaPipeSignTranslator().find_hands(session_a)
+    shared = MediaPipeSignTranslator()
+    interleaved = []
+    for _ in range(3):
+        interleaved.append(shared.find_hands(session_a))
+        shared.find_hands(session_b)
+    try:
+        for hands in interleaved:
+            assert hands.shape == alone.shape and np.allclose(hands, alone, atol=1e-4), \
+                f"session A found {hands.shape[0]} hand(s) interleaved, {alone.shape[0]} alone"
+        print(f"✅ Session A's {alone.shape[0]} hand(s) unchanged by session B ({len(paths)} real frames): PASS")
+        return True
+    except AssertionError as e:
+        print(f"❌ MediaPipe session isolation FAILED: {e}")
+        return False
+
+def test_cache_keeps_crops_apart():
+    """Test 4: The same frame cropped two ways doesn't share a cached result"""
+    print("🧪 Testing the frame cache with two crops of one frame...")
+    results = {}
+    for script in ("ml_server.py", "ml_server_asgi.py"):
+        port = BASE_PORT + 20
+        server = start_ml_server(port, {"ML_CACHE_ENABLED": "1", "ML_CACHE_TTL_S": "60"}, script)
+        try:
+            http = requests.Session()
+            cached = []
+            for crop in ("0,0,0.5,0.5", "0.5,0.5,0.5,0.5", "0,0,0.5,0.5"):
+                response = http.post(f"http://127.0.0.1:{port}/translate",
+                                     json=dict(translate_payload("asl"), crop=crop), timeout=10)
+                assert response.status_code == 200, f"{script}: HTTP {response.status_code} {response.text}"
+                cached.append(bool(response.json().get("cached")))
+            results[script] = cached
+        finally:
+            stop_ml_server(server)
+
+    try:
+        for script, (first, other_crop, same_crop) in results.items():
+            assert not first, f"{script}: first frame came from the cache"
+            assert not other_crop, f"{script}: second crop reused the first crop's result"
+            assert same_crop, f"{script}: repeating the first crop missed the cache"
+        print("✅ Each crop gets its own cache entry (flask and asgi): PASS")
+        return True
+    except AssertionError as e:
+        print(f"❌ Cache crop keys FAILED: {e}")
+        return False
+
+def main():
+    """Run every behaviour test"""
+    print("🚀 LinguaSigna ML Server Behaviour Tests")
+    print("=" * 55)
+    tests = [
+        test_add_language_keeps_lanes_serving,
+        test_lazy_backend_ready_on_both_ports,
+        test_mediapipe_sessions_independent,
+        test_cache_keeps_crops_apart,
+    ]
+    results = []
+    for test in tests:
+        try:
+            results.append(test())
+        except Exception as e:
+            print(f"❌ {test.__doc__.split(': ', 1)[-1]} FAILED: {type(e).__name__}: {e}")
+            results.append(False)
+        print("-" * 55)
+
+    # None is a test skipped for a missing optional dependency
+    passed = sum(1 for result in results if result)
+    skipped = sum(1 for result in results if result is None)
+    ran = len(results) - skipped
+    print(f"\n📊 ML SERVER BEHAVIOUR TESTS: {passed}/{ran} PASSED" + (f", {skipped} skipped" if skipped else ""))
+    sys.exit(0 if passed == ran else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+LinguaSigna ML Server - Template Matching Translator
+Classifies hands against a vocabulary of landmark templates per language
+
+Each language's vocabulary is one contiguous float32 matrix of unit-length
+feature rows (see landmark_features.py), so a whole batch of hands is
+scored against every sign with a single matrix product (cosine similarity)
+and the top-k matches are picked with argpartition - no Python loop over
+the vocabulary. With scipy installed, ML_TEMPLATE_INDEX=kdtree searches a
+cKDTree instead (Euclidean distance between unit vectors ranks the same as
+cosine similarity); at these feature widths the brute-force product is
+usually as fast, so it stays the default.
+
+Vocabularies are loaded from ML_TEMPLATE_DIR/<language>.npz holding
+"labels" (N,) and "landmarks" (N, 21, 2|3), one template hand per entry
+(several entries may share a label), or - preferably - from a model store
+(ML_TEMPLATE_STORE, see model_store.py) of precomputed features that all
+worker processes map instead of copying; the translator reopens the store
+when the file is replaced. Languages with neither get a small synthetic
+vocabulary built from the mock word list, so the backend works out of the
+box. Select with ML_TRANSLATOR_BACKEND=template (landmark
+frames only) or mediapipe-template (MediaPipe detection on images).
+"""
+
+import os
+import time
+from datetime import datetime
+
+import numpy as np
+
+import ml_config
+from landmark_features import LANDMARKS_PER_HAND, extract_features
+from mediapipe_translator import MediaPipeSignTranslator
+from model_store import ModelStore
+from sign_translator import SimpleSignTranslator, frame_error, words_for
+
+class TemplateVocabulary:
+    """Unit-length template features and their labels for one language"""
+
+    def __init__(self, labels, features, dims=2, index="brute"):
+        """labels and unit-length feature rows - both may be read-only store views"""
+        if len(labels) != len(features):
+            raise ValueError("Template labels and features differ in length")
+        self.labels = labels
+        self.dims = dims
+        self.features = features
+        self.tree = None
+        if index == "kdtree":
+            from scipy.spatial import cKDTree
+            self.tree = cKDTree(self.features)
+
+    @classmethod
+    def from_landmarks(cls, labels, landmarks, index="brute"):
+        landmarks = np.asarray(landmarks, dtype=np.float32)
+        if landmarks.ndim != 3 or landmarks.shape[1] != LANDMARKS_PER_HAND:
+            raise ValueError(f"Expected (N, 21, dims) template landmarks, got {landmarks.shape}")
+        features = normalize_rows(extract_features(landmarks))
+        return cls(list(labels), features, landmarks.shape[-1], index)
+
+    @classmethod
+    def from_file(cls, path, index="brute"):
+        with np.load(path, allow_pickle=False) as data:
+            return cls.from_landmarks(data["labels"].astype(str), data["landmarks"], index)
+
+    @classmethod
+    def from_store(cls, store, language, index="brute"):
+        """Precomputed features mapped from a model store - nothing is copied"""
+        dims = next((entry["dims"] for entry in store.metadata["vocabularies"]
+                     if entry["language"] == language), None)
+        if dims is None:
+            raise ValueError(f"Model store has no vocabulary entry for language: {language}")
+        return cls(store[f"{language}/labels"], store[f"{language}/features"], dims, index)
+
+    def label(self, index):
+        label = self.labels[index]
+        return label.decode("utf-8") if isinstance(label, bytes) else str(label)
+
+    @classmethod
+    def synthetic(cls, words, per_word=1, dims=2, seed=0, index="brute"):
+        """Random template hands for a word list (for tests and benchmarks)"""
+        rng = np.random.default_rng(seed)
+        labels = [word for word in words for _ in range(per_word)]
+        landmarks = rng.random((len(labels), LANDMARKS_PER_HAND, dims), dtype=np.float32)
+        return cls.from_landmarks(labels, landmarks, index)
+
+    def __len__(self):
+        return len(self.labels)
+
+    def search(self, features, k=3):
+        """Top-k (indices, similarities) for each unit-length feature row, best first"""
+        k = max(1, min(int(k), len(self)))
+        if self.tree is not None:
+            distances, indices = self.tree.query(features, k=k)
+            distances = np.asarray(distances, dtype=np.float32).reshape(len(features), k)
+            indices = np.asarray(indices).reshape(len(features), k)
+            # |a - b|^2 = 2 - 2 cos(a, b) for unit vectors
+            return indices, 1.0 - distances * distances / 2.0
+
+        scores = features @ self.features.T
+        if k < scores.shape[1]:
+            top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        else:
+            top = np.broadcast_to(np.arange(scores.shape[1]), scores.shape)
+        top_scores = np.take_along_axis(scores, top, axis=1)
+        order = np.argsort(-top_scores, axis=1)
+        return np.take_along_axis(top, order, axis=1), np.take_along_axis(top_scores, order, axis=1)
+
+def normalize_rows(features):
+    """Scale each row to unit length (in place) so dot products are cosines"""
+    norms = np.sqrt(np.einsum('nf,nf->n', features, features))
+    np.maximum(norms, 1e-6, out=norms)
+    features /= norms[:, None]
+    return features
+
+class TemplateSignTranslator(SimpleSignTranslator):
+    """Nearest-template classifier over landmark frames"""
+
+    def __init__(self, template_dir=None, top_k=None, index=None, store_path=None, languages=None):
+        super().__init__(languages=languages)
+        # A per-language lane only loads its own vocabulary
+        self.languages = list(languages or ml_config.LANGUAGES)
+        self.template_dir = template_dir if template_dir is not None else ml_config.TEMPLATE_DIR
+        self.store_path = store_path if store_path is not None else ml_config.TEMPLATE_STORE
+        self.top_k = top_k or ml_config.TEMPLATE_TOP_K
+        self.index = index or ml_config.TEMPLATE_INDEX
+        self.store = None
+        self._next_store_check = 0.0
+        self.vocabularies = self._load_vocabularies()
+
+    def _load_vocabularies(self):
+        if self.store_path and os.path.exists(self.store_path):
+            self.store = ModelStore(self.store_path)
+        return {language: self._load_vocabulary(language, words_for(language)) for language in self.languages}
+
+    def _load_vocabulary(self, language, words):
+        if self.store is not None and f"{language}/features" in self.store:
+            vocabulary = TemplateVocabulary.from_store(self.store, language, self.index)
+            print(f"📚 Mapped {len(vocabulary)} {language.upper()} templates from {self.store_path}")
+            return vocabulary
+        path = os.path.join(self.template_dir, f"{language}.npz") if self.template_dir else None
+        if path and os.path.exists(path):
+            vocabulary = TemplateVocabulary.from_file(path, self.index)
+            print(f"📚 Loaded {len(vocabulary)} {language.upper()} templates from {path}")
+            return vocabulary
+        return TemplateVocabulary.synthetic(words, index=self.index)
+
+    def translate_batch(self, frames):
+        started = time.perf_counter()
+        results = self._translate_frames(frames)
+        timings = {"classify": (time.perf_counter() - started) * 1000.0}
+        for result in results:
+            if result:
+                result["stage_ms"] = timings
+                result["stage_frames"] = len(frames)
+        return results
+
+    def _check_store(self):
+        """Pick up a store that was replaced on disk (at most every ML_MODEL_STORE_CHECK_S)"""
+        if not self.store_path:
+            return
+        now = time.monotonic()
+        if now < self._next_store_check:
+            return
+        self._next_store_check = now + ml_config.MODEL_STORE_CHECK_S
+        if self.store is not None and not self.store.is_stale():
+            return
+        if self.store is None and not os.path.exists(self.store_path):
+            return
+        # The old mapping is released once no batch holds its arrays any more
+        self.vocabularies = self._load_vocabularies()
+
+    def _translate_frames(self, frames):
+        """Classify every hand in the batch with one search per language"""
+        self._check_store()
+        vocabularies = self.vocabularies
+        results = [None] * len(frames)
+        by_language = {}
+        for index, (image_data, language) in enumerate(frames):
+            if self._is_landmarks(image_data) and image_data.shape[0] > 0:
+                by_language.setdefault(language, []).append((index, image_data))
+
+        for language, group in by_language.items():
+            vocabulary = vocabularies.get(language)
+            if vocabulary is None:
+                for index, _ in group:
+                    results[index] = frame_error(f"Unsupported language: {language}", language)
+                continue
+            # Templates fix the landmark dims - 3D hands are matched on x, y,
+            # but 2D hands can't be matched against 3D templates
+            for index, frame_hands in group:
+                if frame_hands.shape[-1] < vocabulary.dims:
+                    results[index] = frame_error(
+                        f"{language.upper()} templates need {vocabulary.dims} coordinates per landmark, "
+                        f"got {frame_hands.shape[-1]}", language
+                    )
+            group = [(index, frame_hands) for index, frame_hands in group if results[index] is None]
+            if not group:
+                continue
+            hands = np.concatenate([hands[..., :vocabulary.dims] for _, hands in group])
+            features = normalize_rows(extract_features(hands))
+            indices, scores = vocabulary.search(features, self.top_k)
+
+            start = 0
+            for index, frame_hands in group:
+                rows = slice(start, start + len(frame_hands))
+                start += len(frame_hands)
+                # Several hands in one frame - report the most confident one
+                best = rows.start + int(np.argmax(scores[rows, 0]))
+                results[index] = self._result(vocabulary, indices[best], scores[best], language)
+        return results
+
+    def _result(self, vocabulary, indices, scores, language):
+        matches = []
+        seen = set()
+        for index, score in zip(indices, scores):
+            label = vocabulary.label(index)
+            if label not in seen:
+                seen.add(label)
+                matches.append({"text": label, "confidence": round(min(1.0, max(0.0, float(score))), 4)})
+        return {
+            "text": matches[0]["text"],
+            "confidence": matches[0]["confidence"],
+            "alternatives": matches[1:],
+            "language": language,
+            "timestamp": datetime.now().isoformat()
+        }
+
+class MediaPipeTemplateTranslator(MediaPipeSignTranslator, TemplateSignTranslator):
+    """MediaPipe hand detection on image frames, template matching on the landmarks"""
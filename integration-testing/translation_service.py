@@ -0,0 +1,868 @@
+#!/usr/bin/env python3
+"""
+LinguaSigna ML Server - Translation Service
+Framework-independent request handling shared by the Flask and ASGI servers
+"""
+
+import base64
+import hmac
+import re
+from contextlib import contextmanager
+
+import ml_config
+from admission import AdmissionController, AdmissionRejected, FrameSuperseded
+from batching import MicroBatcher
+from frame_cache import FrameResultCache
+from frame_decoder import CroppedFrame, is_landmark_array, parse_crop_box
+from hand_tracking import HandTracker
+from language_router import LanguageRouter
+from metrics import NULL_TIMER, MetricsRegistry
+from motion_gate import MotionGate
+from probes import ProbeServer, SaturationMonitor
+from profiler import ProfilerBusy, SamplingProfiler
+from landmark_codec import (
+    LandmarkFormatError,
+    decode_landmarks,
+    parse_dims,
+    parse_frame_hands,
+    split_frames,
+)
+from sequence_window import SequenceRecognizer
+from serialization import RESPONSE_TIME
+from sign_translator import words_for
+from sessions import SessionRegistry, parse_motion_options
+from translator_backends import TranslatorBackend
+from worker_pool import WorkerPool
+
+# Shared with the router - add_language() appends to it
+SUPPORTED_LANGUAGES = list(ml_config.LANGUAGES)
+
+# Content types accepted as a raw binary frame body on /translate
+BINARY_IMAGE_TYPES = ("image/jpeg", "image/png", "image/webp", "application/octet-stream")
+
+# Header carrying the language for binary uploads (query ?language= also works)
+LANGUAGE_HEADER = "X-Language"
+
+# Optional per-session headers (JSON bodies use session_id / motion_threshold / max_reuse)
+SESSION_HEADER = "X-Session-Id"
+MOTION_THRESHOLD_HEADER = "X-Motion-Threshold"
+MOTION_MAX_REUSE_HEADER = "X-Motion-Max-Reuse"
+
+# Profiler token header (alternative to "Authorization: Bearer <token>")
+PROFILER_TOKEN_HEADER = "X-Profiler-Token"
+ADMIN_TOKEN_HEADER = "X-Admin-Token"
+
+# Language codes accepted by POST /admin/languages
+LANGUAGE_CODE = re.compile(r"[a-z]{2,8}")
+
+# Optional region of interest, normalized "x,y,w,h" (JSON bodies use "crop")
+CROP_HEADER = "X-Crop-Box"
+
+# Request counters and latency histograms (/metrics)
+metrics = MetricsRegistry()
+
+# Admission control settings (one controller, or one per language lane)
+ADMISSION_OPTIONS = {
+    "max_active": ml_config.ADMISSION_MAX_ACTIVE,
+    "max_queued": ml_config.ADMISSION_MAX_QUEUED,
+    "wait_timeout": ml_config.ADMISSION_WAIT_TIMEOUT_S,
+    "retry_after": ml_config.ADMISSION_RETRY_AFTER_S
+} if ml_config.ADMISSION_ENABLED else None
+
+if ml_config.LANGUAGE_ROUTING:
+    # One backend, queue and admission controller per language, so a burst
+    # in one language doesn't delay the others
+    translator = batcher = LanguageRouter(
+        ml_config.TRANSLATOR_BACKEND,
+        SUPPORTED_LANGUAGES,
+        workers=ml_config.LANGUAGE_WORKERS,
+        default_workers=ml_config.WORKER_PROCESSES,
+        max_batch=ml_config.BATCH_MAX_SIZE,
+        max_wait_ms=ml_config.BATCH_MAX_WAIT_MS,
+        pool_options={
+            "slots": ml_config.WORKER_SLOTS or None,
+            "slot_bytes": ml_config.WORKER_SLOT_BYTES,
+            "slot_timeout": ml_config.BATCH_RESULT_TIMEOUT_S,
+            "start_method": ml_config.WORKER_START_METHOD
+        },
+        admission_options=ADMISSION_OPTIONS
+    )
+elif ml_config.WORKER_PROCESSES > 0:
+    # Worker processes each load the backend and batch their own frames, so
+    # the pool stands in for both the translator and the batcher
+    translator = batcher = WorkerPool(
+        ml_config.TRANSLATOR_BACKEND,
+        processes=ml_config.WORKER_PROCESSES,
+        max_batch=ml_config.BATCH_MAX_SIZE,
+        slots=ml_config.WORKER_SLOTS or None,
+        slot_bytes=ml_config.WORKER_SLOT_BYTES,
+        slot_timeout=ml_config.BATCH_RESULT_TIMEOUT_S,
+        start_method=ml_config.WORKER_START_METHOD
+    )
+else:
+    # Translator backend - loaded lazily or by start_backend() at server startup
+    translator = TranslatorBackend(ml_config.TRANSLATOR_BACKEND)
+    
+    # Batch concurrent frames in front of the translator
+    batcher = MicroBatcher(
+        translator,
+        max_size=ml_config.BATCH_MAX_SIZE,
+        max_wait_ms=ml_config.BATCH_MAX_WAIT_MS
+    )
+
+# Per-language lanes (None when one translator serves every language)
+router = translator if isinstance(translator, LanguageRouter) else None
+
+# Bound queued translation work and shed stale session frames under overload
+# (language lanes bring their own controllers)
+admission = AdmissionController(**ADMISSION_OPTIONS) if ADMISSION_OPTIONS and router is None else None
+
+# Streaming sessions (WebSocket clients)
+sessions = SessionRegistry(
+    idle_timeout=ml_config.SESSION_IDLE_TIMEOUT_S,
+    max_sessions=ml_config.SESSION_MAX_COUNT
+)
+
+# Reuse results for near-identical consecutive frames
+frame_cache = FrameResultCache(
+    max_entries=ml_config.CACHE_MAX_ENTRIES,
+    ttl_seconds=ml_config.CACHE_TTL_S,
+    hamming_threshold=ml_config.CACHE_HAMMING_THRESHOLD,
+    landmark_quantum=ml_config.CACHE_LANDMARK_QUANTUM
+) if ml_config.CACHE_ENABLED else None
+
+# Skip static frames within a session
+motion_gate = MotionGate(
+    threshold=ml_config.MOTION_THRESHOLD,
+    max_reuse=ml_config.MOTION_MAX_REUSE
+) if ml_config.MOTION_GATE_ENABLED else None
+
+# Detect only around each session's last hand position
+hand_tracker = HandTracker(
+    margin=ml_config.HAND_TRACKING_MARGIN,
+    redetect_every=ml_config.HAND_TRACKING_REDETECT_EVERY,
+    min_side=ml_config.HAND_TRACKING_MIN_SIDE
+) if ml_config.HAND_TRACKING_ENABLED else None
+
+# Recognize dynamic signs over a sliding window of each session's hand poses
+sequence_recognizer = SequenceRecognizer(
+    window_size=ml_config.SEQUENCE_WINDOW,
+    min_frames=ml_config.SEQUENCE_MIN_FRAMES,
+    min_confidence=ml_config.SEQUENCE_MIN_CONFIDENCE,
+    max_gap=ml_config.SEQUENCE_MAX_GAP,
+    sequence_dir=ml_config.SEQUENCE_DIR,
+    words={language: words_for(language) for language in SUPPORTED_LANGUAGES}
+) if ml_config.SEQUENCE_ENABLED else None
+
+def backend_ready():
+    """True when /translate can be served - readiness for every probe
+    
+    Lazy mode loads on the first request, so an unloaded backend counts as
+    ready; otherwise a balancer would never send the request that loads it.
+    """
+    return translator.is_ready() or (
+        ml_config.BACKEND_WARMUP == "lazy" and translator.state == "unloaded"
+    )
+
+def saturation():
+    """Raw saturation signals for the probes - lock-free reads, may be a frame stale"""
+    controllers = [lane.admission for lane in router.lanes.values()] if router is not None else [admission]
+    admitted = waiting = capacity = max_queued = 0
+    for controller in controllers:
+        if controller is None:
+            continue
+        active, queued = controller.load()
+        admitted += active
+        waiting += queued
+        capacity += controller.max_active
+        max_queued += controller.max_queued
+    queue_depth = batcher.queue_depth() if ml_config.BATCH_ENABLED or batcher is translator else 0
+    return {
+        "ready": backend_ready(),
+        "state": translator.state,
+        "in_flight": metrics.in_flight,
+        "admitted": admitted,
+        "waiting": waiting,
+        "queue_depth": waiting + queue_depth,
+        # Without admission control, batch slots are the closest thing to a capacity
+        "capacity": capacity or batcher.max_size,
+        "max_queued": max_queued
+    }
+
+# Liveness / readiness / load answered from a periodic sample (see probes.py)
+probe_monitor = SaturationMonitor(
+    saturation,
+    metrics,
+    target_p99_ms=ml_config.LOAD_TARGET_P99_MS,
+    window_s=ml_config.PROBE_WINDOW_S,
+    refresh_ms=ml_config.PROBE_REFRESH_MS
+)
+probe_server = ProbeServer(
+    probe_monitor,
+    ml_config.HOST,
+    ml_config.PROBE_PORT,
+    stale_s=ml_config.PROBE_STALE_S,
+    nice=ml_config.PROBE_NICE
+) if ml_config.PROBE_PORT else None
+
+# On-demand stack sampling for /debug/profile - needs both the flag and a token
+profiler = SamplingProfiler(
+    rate_hz=ml_config.PROFILER_RATE_HZ,
+    max_seconds=ml_config.PROFILER_MAX_SECONDS,
+    max_overhead=ml_config.PROFILER_MAX_OVERHEAD
+) if ml_config.PROFILER_ENABLED and ml_config.PROFILER_TOKEN else None
+if ml_config.PROFILER_ENABLED and not ml_config.PROFILER_TOKEN:
+    print("⚠️  ML_PROFILER_ENABLED is set without ML_PROFILER_TOKEN - /debug/profile stays off")
+
+def start_probes():
+    """Start the saturation sampler and the dedicated probe listener"""
+    probe_monitor.start()
+    if probe_server is not None and probe_server.start():
+        print(f"🩺 Health probes on port {probe_server.port} (/health/live, /health/ready, /health/load)")
+
+def start_backend():
+    """Kick off translator loading according to ML_BACKEND_WARMUP"""
+    if ml_config.BACKEND_WARMUP == "background":
+        translator.start_warm_up()
+    elif ml_config.BACKEND_WARMUP == "eager":
+        translator.load()
+
+def add_language(language, processes=None):
+    """Start serving a new language on its own lane while the others keep serving - True if it's new
+    
+    Only the new lane is built and started; the language becomes routable
+    (SUPPORTED_LANGUAGES) last, once its lane and sequence vocabulary exist.
+    """
+    if router is None:
+        raise RuntimeError("Adding languages needs per-language lanes (ML_LANGUAGE_WORKERS)")
+    language = language.lower()
+    if language in SUPPORTED_LANGUAGES:
+        return False
+    router.add_language(language, processes)
+    if sequence_recognizer is not None:
+        sequence_recognizer.add_language(language, words_for(language))
+    if language not in SUPPORTED_LANGUAGES:
+        SUPPORTED_LANGUAGES.append(language)
+    return True
+
+def backend_for(language=None):
+    """The backend serving a language - its own lane's when languages are routed"""
+    if router is not None and language is not None:
+        return router.lane(language).backend
+    return translator
+
+def admission_for(language=None):
+    """The admission controller a language's frames queue on (None when disabled)"""
+    if router is not None and language is not None:
+        return router.lane(language).admission
+    return admission
+
+def backend_not_ready(language=None):
+    """503 error response if the translator (for this language) isn't loaded yet, else None"""
+    backend = backend_for(language)
+    if backend.wait_ready(ml_config.BACKEND_READY_TIMEOUT_S):
+        return None
+    if backend.state == "failed":
+        return error_response(f"Translator backend failed to load: {backend.error}", 503)
+    return error_response("Translator backend is still loading", 503)
+
+def session_options(source):
+    """Session id, motion settings and crop box from a JSON body or request headers"""
+    if source is None:
+        return {}
+    if isinstance(source, dict):
+        return {
+            "session_id": source.get('session_id'),
+            "motion_threshold": source.get('motion_threshold'),
+            "max_reuse": source.get('max_reuse'),
+            "crop": source.get('crop')
+        }
+    return {
+        "session_id": source.get(SESSION_HEADER),
+        "motion_threshold": source.get(MOTION_THRESHOLD_HEADER),
+        "max_reuse": source.get(MOTION_MAX_REUSE_HEADER),
+        "crop": source.get(CROP_HEADER)
+    }
+
+def split_options(options):
+    """Separate the crop box from the session options - returns (session_options, crop, error)"""
+    options = dict(options or {})
+    crop = options.pop("crop", None)
+    if crop is None:
+        return options, None, None
+    try:
+        return options, parse_crop_box(crop), None
+    except ValueError as e:
+        return options, None, error_response(str(e))
+
+def with_crop(image_data, crop, fallback=False):
+    """Attach a crop box to an encoded frame for the decoder (landmarks are left alone)"""
+    if crop is None or image_data is None or is_landmark_array(image_data):
+        return image_data
+    return CroppedFrame(image_data, crop, fallback)
+
+def resolve_session(language, session_id=None, motion_threshold=None, max_reuse=None):
+    """Find or open the session a client named - returns (session, error)"""
+    if not session_id:
+        return None, None
+    # Validate before registering, so a rejected request leaves no session behind
+    try:
+        motion_threshold, max_reuse = parse_motion_options(motion_threshold, max_reuse)
+    except (TypeError, ValueError):
+        return None, error_response("Invalid motion_threshold or max_reuse")
+    session = sessions.get_or_create(str(session_id), language)
+    session.configure_motion(motion_threshold, max_reuse)
+    return session, None
+
+def motion_check(session, image_data, language):
+    """Motion gate a session frame - returns (signature, reused, result)"""
+    if session is None or motion_gate is None:
+        return None, False, None
+    signature, reused = motion_gate.check(session, image_data, language)
+    if not reused:
+        return signature, False, None
+    result = session.motion_result
+    if result:
+        result = dict(result)
+    return signature, True, result
+
+def motion_record(session, signature, language, result):
+    """Remember a freshly translated session frame as the motion reference"""
+    if session is not None and motion_gate is not None:
+        motion_gate.record(session, signature, language, result)
+
+def hand_roi(session, image_data, language, crop=None):
+    """Tracked detection region for a session frame - None for full-frame detection.
+
+    A crop the client sent itself always wins over tracking.
+    """
+    if (session is None or hand_tracker is None or crop is not None
+            or is_landmark_array(image_data)):
+        return None
+    with session.state_lock:
+        return hand_tracker.roi(session, language)
+
+def hand_record(session, language, roi, result):
+    """Move the session's hand track to where this frame's hands were found"""
+    if session is not None and hand_tracker is not None:
+        hand_tracker.record(session, language, roi, result)
+
+def sequence_update(session, image_data, language, result):
+    """Feed a translated session frame's hand into its window - returns result, with "sequence" if recognized
+
+    Landmark frames carry their hands directly; image backends report the
+    hands they detected under "hands".
+    """
+    if session is None or sequence_recognizer is None:
+        return result
+    if is_landmark_array(image_data):
+        hands = image_data
+    else:
+        hands = result.get("hands") if result else None
+    sequence = sequence_recognizer.update(session, language, hands)
+    if sequence is None or not result:
+        return result
+    return dict(result, sequence=sequence)
+
+def session_record(session, image_data, language, roi, result):
+    """Move a session's hand track and feed its window from a frame's result - returns result, with "sequence" if recognized
+
+    A cache hit was computed for some other request, maybe under another
+    session's crop, so its hands and hand_box don't describe this frame
+    and leave the session alone. Landmark frames still feed the window,
+    since their hands come from the frame itself.
+    """
+    if session is None:
+        return result
+    fresh = not (result and result.get("cached"))
+    with session.state_lock:
+        if fresh:
+            hand_record(session, language, roi, result)
+        if fresh or is_landmark_array(image_data):
+            return sequence_update(session, image_data, language, result)
+    return result
+
+def cache_lookup(image_data, language, region=None):
+    """Check the frame cache - returns (key, found, result)
+    
+    region is the crop box (client crop or tracked hand roi) the frame
+    will be translated in, so differently cropped frames don't share results.
+    """
+    if frame_cache is None:
+        return None, False, None
+    key, found, result = frame_cache.lookup(image_data, language, region)
+    if found and result:
+        # Hand back a copy so the cached entry isn't mutated by callers
+        result = dict(result, cached=True)
+    return key, found, result
+
+def cache_store(key, result, image_data=None):
+    """Remember a fresh translation for later near-duplicate frames"""
+    if frame_cache is not None:
+        frame_cache.store(key, result, image_data)
+
+def admission_key(session):
+    """Admission queue key - one waiting frame per session"""
+    return session.session_id if session is not None else None
+
+@contextmanager
+def admitted(session=None, timer=NULL_TIMER, language=None):
+    """Hold an admission slot (in the language's queue) while a frame is translated"""
+    controller = admission_for(language)
+    if controller is None:
+        yield
+        return
+    with timer.stage("admission_wait"):
+        controller.admit(admission_key(session))
+    try:
+        yield
+    finally:
+        controller.release()
+
+def record_batch_timing(timer, future):
+    """Copy queue wait and inference time measured by the batcher onto a request timer"""
+    timer.add("queue_wait", future.queue_ms)
+    timer.add("inference", future.inference_ms)
+
+def record_backend_stages(timer, results):
+    """Split the backend's own stage timings (decode, detect, classify) out of "inference"
+    
+    Backends that time their stages attach them to each result as
+    "stage_ms" (batch totals) with the batch's frame count as
+    "stage_frames". Each result is charged an even share of its batch, so
+    a request's stages add up to its frames' part of the backend time
+    rather than the whole batch. Both keys are removed here so they never
+    reach the cache or the client.
+    """
+    shares = {}
+    for result in results:
+        if not result:
+            continue
+        stage_ms = result.pop("stage_ms", None)
+        frames = max(1, result.pop("stage_frames", 1))
+        for stage, milliseconds in (stage_ms or {}).items():
+            shares[stage] = shares.get(stage, 0.0) + milliseconds / frames
+    if shares:
+        timer.split("inference", shares, "batch share")
+
+def run_translation(image_data, language, timer=NULL_TIMER, session=None, crop=None, roi=None):
+    """Translate one frame, going through the micro-batcher when enabled
+    
+    Cache misses need an admission slot first, so this can raise
+    AdmissionRejected or FrameSuperseded. A crop box (or tracked hand roi)
+    narrows where the backend decodes and detects, so it is part of the
+    cache key; motion keys use the full frame.
+    """
+    with timer.stage("cache_lookup"):
+        key, found, result = cache_lookup(image_data, language, roi or crop)
+    if found:
+        return result
+    
+    frame = with_crop(image_data, roi or crop, fallback=roi is not None)
+    with admitted(session, timer, language):
+        if ml_config.BATCH_ENABLED:
+            future = batcher.submit(frame, language)
+            result = future.result(ml_config.BATCH_RESULT_TIMEOUT_S)
+            record_batch_timing(timer, future)
+        else:
+            with timer.stage("inference"):
+                result = translator.translate(frame, language)
+    record_backend_stages(timer, [result])
+    cache_store(key, result, image_data)
+    return result
+
+def run_session_translation(session, image_data, language, timer=NULL_TIMER, crop=None):
+    """Translate a frame, reusing the session's last result if nothing moved.
+
+    Returns (result, reused).
+    """
+    with timer.stage("motion_check"):
+        signature, reused, result = motion_check(session, image_data, language)
+    if reused:
+        return result, True
+    
+    roi = hand_roi(session, image_data, language, crop)
+    result = run_translation(image_data, language, timer, session, crop, roi)
+    motion_record(session, signature, language, result)
+    return session_record(session, image_data, language, roi, result), False
+
+def run_translation_many(frames, language, timer=NULL_TIMER):
+    """Translate several frames, letting the batcher group them in one call"""
+    with timer.stage("cache_lookup"):
+        lookups = [cache_lookup(frame, language) for frame in frames]
+    misses = [index for index, (_, found, _) in enumerate(lookups) if not found]
+    results = [result for _, _, result in lookups]
+    
+    if not misses:
+        fresh = []
+    elif ml_config.BATCH_ENABLED:
+        # One admission slot covers the whole payload
+        with admitted(None, timer, language):
+            futures = [batcher.submit(frames[index], language) for index in misses]
+            fresh = [future.result(ml_config.BATCH_RESULT_TIMEOUT_S) for future in futures]
+        # Frames usually share one batch - report the slowest
+        slowest = max(futures, key=lambda future: future.queue_ms + future.inference_ms)
+        record_batch_timing(timer, slowest)
+    else:
+        with admitted(None, timer, language), timer.stage("inference"):
+            fresh = translator.translate_batch([(frames[index], language) for index in misses])
+    record_backend_stages(timer, fresh)
+    
+    for index, result in zip(misses, fresh):
+        results[index] = result
+        cache_store(lookups[index][0], result, frames[index])
+    return results
+
+# Parts of /health and /status that never change while the server runs
+HEALTH_STATIC = {
+    "status": "healthy",
+    "service": "LinguaSigna ML Server",
+    "backend": translator.name,
+    "version": "1.0.0"
+}
+STATUS_STATIC = {
+    "server": "ML Translation Server",
+    "status": "running",
+    "endpoints": [
+        "/health - Health check (liveness)",
+        "/health/ready - Readiness (503 until the translator backend is loaded)",
+        "/health/load - Saturation: queue depth, in-flight, recent p99, 0-1 load score",
+        "/translate - POST translation endpoint",
+        "/translate/landmarks - POST packed float32 landmarks",
+        "/status - This status endpoint",
+        "/metrics - Prometheus metrics",
+        "/debug/profile - Sampling profiler (token required, off unless ML_PROFILER_ENABLED)",
+        "/admin/languages - POST opens a lane for a new language (token required, off unless ML_ADMIN_TOKEN)",
+        "/ws/translate - WebSocket streaming sessions (async mode)"
+    ],
+    "languages_supported": SUPPORTED_LANGUAGES
+}
+
+def health_payload():
+    """Body for the health check endpoints (liveness, with readiness info)"""
+    return dict(HEALTH_STATIC, ready=translator.is_ready(), timestamp=RESPONSE_TIME)
+
+def readiness_payload():
+    """Body and status code for the readiness probe - 503 until the backend loads"""
+    ready = backend_ready()
+    return {
+        "status": "ready" if ready else translator.state,
+        "ready": ready,
+        "backend": translator.stats(),
+        "timestamp": RESPONSE_TIME
+    }, 200 if ready else 503
+
+def status_payload():
+    """Body for the status endpoint - only the live counters are built per call"""
+    return dict(
+        STATUS_STATIC,
+        backend=translator.stats(),
+        batching=batcher.stats() if ml_config.BATCH_ENABLED and batcher is not translator
+                 else {"enabled": ml_config.BATCH_ENABLED, "per_language": True} if router is not None
+                 else {"enabled": False},
+        sessions=sessions.stats(),
+        cache=frame_cache.stats() if frame_cache is not None else {"enabled": False},
+        motion_gate=motion_gate.stats() if motion_gate is not None else {"enabled": False},
+        hand_tracking=hand_tracker.stats() if hand_tracker is not None else {"enabled": False},
+        sequences=sequence_recognizer.stats() if sequence_recognizer is not None else {"enabled": False},
+        admission=admission_stats(),
+        probes=dict(probe_monitor.stats(),
+                    listener=probe_server.stats() if probe_server is not None else {"enabled": False}),
+        profiler=profiler.stats() if profiler is not None else {"enabled": False},
+        latency=metrics.snapshot(),
+        timestamp=RESPONSE_TIME
+    )
+
+def admission_stats():
+    """Admission counters for /status - per language when languages are routed"""
+    if admission is not None:
+        return admission.stats()
+    if router is not None and ADMISSION_OPTIONS is not None:
+        # Each lane's counters are under backend.languages
+        return {"enabled": True, "per_language": True}
+    return {"enabled": False}
+
+def error_response(message, status_code=400):
+    """Standard error body and status code"""
+    return {
+        "success": False,
+        "error": message
+    }, status_code
+
+def token_authorized(headers, token, header):
+    """True when the request carries token as a bearer token or in header (constant-time compare)"""
+    authorization = headers.get("Authorization") or ""
+    scheme, _, credentials = authorization.partition(" ")
+    supplied = credentials.strip() if scheme.lower() == "bearer" else headers.get(header) or ""
+    return hmac.compare_digest(supplied.encode("utf-8"), token.encode("utf-8"))
+
+def profiler_authorized(headers):
+    """True when the request carries the profiler token"""
+    return token_authorized(headers, ml_config.PROFILER_TOKEN, PROFILER_TOKEN_HEADER)
+
+def handle_add_language(headers, data):
+    """Open a lane for a new language for POST /admin/languages - returns (body, status_code)
+    
+    Body: {"language": "bsl", "processes": 1}; processes defaults to
+    ML_WORKER_PROCESSES like any language missing from ML_LANGUAGE_WORKERS.
+    Under ml_server_prefork.py this reaches one worker only.
+    """
+    if not ml_config.ADMIN_TOKEN:
+        # Don't advertise the endpoint when it's off
+        return error_response("Not found", 404)
+    if not token_authorized(headers, ml_config.ADMIN_TOKEN, ADMIN_TOKEN_HEADER):
+        return error_response("Invalid or missing admin token", 401)
+    if router is None:
+        return error_response("Adding languages needs per-language lanes (ML_LANGUAGE_WORKERS)", 409)
+    data = data or {}
+    language = str(data.get("language") or "").lower()
+    if not LANGUAGE_CODE.fullmatch(language):
+        return error_response("language must be 2-8 letters")
+    processes = data.get("processes")
+    try:
+        processes = max(0, int(processes)) if processes is not None else None
+    except (TypeError, ValueError):
+        return error_response("processes must be a whole number")
+    added = add_language(language, processes)
+    return {
+        "success": True,
+        "language": language,
+        "added": added,
+        "languages_supported": SUPPORTED_LANGUAGES
+    }, 201 if added else 200
+
+def handle_profile(headers, query):
+    """Run a profile for /debug/profile - returns (body, status_code)
+    
+    Blocks the calling thread for ?seconds= (default ML_PROFILER_DEFAULT_SECONDS)
+    while the rest of the server keeps serving. ?rate= sets samples per
+    second and ?idle=1 keeps threads parked in a wait in the stacks.
+    """
+    if profiler is None:
+        # Don't advertise the endpoint when it's off
+        return error_response("Not found", 404)
+    if not profiler_authorized(headers):
+        return error_response("Invalid or missing profiler token", 401)
+    try:
+        seconds = float(query.get('seconds') or ml_config.PROFILER_DEFAULT_SECONDS)
+        rate_hz = float(query.get('rate') or profiler.rate_hz)
+    except ValueError:
+        return error_response("seconds and rate must be numbers")
+    include_idle = (query.get('idle') or '').lower() in ('1', 'true', 'yes')
+    try:
+        return profiler.profile(seconds, rate_hz, include_idle), 200
+    except ProfilerBusy as e:
+        return error_response(str(e), 409)
+    except ValueError as e:
+        return error_response(str(e))
+
+def shed_response(error, language, timer=NULL_TIMER):
+    """Response for a frame shed by admission control - returns (body, status_code)
+    
+    A full queue is a 429 with retry_after (sent as Retry-After); a frame
+    replaced by a newer one from the same session is a 200 "dropped" result.
+    Both are counted in ml_errors_total by type.
+    """
+    timer.fail("frame_superseded" if isinstance(error, FrameSuperseded) else "admission_rejected")
+    if isinstance(error, FrameSuperseded):
+        return {
+            "success": False,
+            "dropped": True,
+            "message": str(error),
+            "language": language,
+            "timestamp": RESPONSE_TIME
+        }, 200
+    body, status_code = error_response(str(error), 429)
+    body["retry_after"] = error.retry_after
+    return body, status_code
+
+def parse_translate_request(data, timer=NULL_TIMER):
+    """Validate a /translate JSON body and decode its image.
+
+    Returns (decoded_data, language, None) on success or
+    (None, None, (body, status_code)) when the request is invalid.
+    """
+    if not data:
+        return None, None, error_response("No JSON data provided")
+    
+    # Extract image and language
+    image_data = data.get('image', '')
+    language = data.get('language', 'asl').lower()
+    
+    # Validate language
+    if language not in SUPPORTED_LANGUAGES:
+        return None, None, error_response(f"Unsupported language: {language}")
+    
+    # Try to decode base64 image (basic validation)
+    try:
+        with timer.stage("base64_decode"):
+            if image_data:
+                decoded_data = base64.b64decode(image_data)
+            else:
+                decoded_data = None
+    except Exception:
+        return None, None, error_response("Invalid base64 image data")
+    
+    return decoded_data, language, None
+
+def is_binary_upload(content_type):
+    """True when the request body is a raw image rather than JSON"""
+    mimetype = (content_type or "").split(";", 1)[0].strip().lower()
+    return mimetype in BINARY_IMAGE_TYPES
+
+def is_multipart_upload(content_type):
+    """True for multipart/form-data frame uploads"""
+    return (content_type or "").lower().startswith("multipart/form-data")
+
+def parse_binary_request(body, language):
+    """Validate a binary frame upload.
+
+    The body is wrapped in a memoryview so the bytes read off the socket
+    are handed to the decoder without another copy. Returns the same
+    (image_data, language, error) triple as parse_translate_request.
+    """
+    language = (language or 'asl').lower()
+    
+    # Validate language
+    if language not in SUPPORTED_LANGUAGES:
+        return None, None, error_response(f"Unsupported language: {language}")
+    
+    if not body:
+        return None, None, error_response("No image data provided")
+    
+    return memoryview(body), language, None
+
+def parse_landmark_request(body, language, dims_header=None, frame_hands_header=None):
+    """Validate a /translate/landmarks upload.
+
+    Returns (frames, language, batched, error) where frames is a list of
+    (hands, 21, dims) float32 views into the request body.
+    """
+    language = (language or 'asl').lower()
+    
+    # Validate language
+    if language not in SUPPORTED_LANGUAGES:
+        return None, None, False, error_response(f"Unsupported language: {language}")
+    
+    if not body:
+        return None, None, False, error_response("No landmark data provided")
+    
+    try:
+        dims = parse_dims(dims_header)
+        frame_hands = parse_frame_hands(frame_hands_header)
+        frames = split_frames(decode_landmarks(body, dims), frame_hands)
+    except LandmarkFormatError as e:
+        return None, None, False, error_response(str(e))
+    
+    return frames, language, frame_hands is not None, None
+
+def translation_response(result, language, reused=False, timer=NULL_TIMER):
+    """Turn a translator result into the /translate response body"""
+    if result and result.get("error"):
+        # The backend refused this frame (no vocabulary for the language, wrong landmark dims)
+        return {
+            "success": False,
+            "error": result["error"],
+            "language": language,
+            "timestamp": RESPONSE_TIME
+        }
+    if result:
+        response = {
+            "success": True,
+            "translation": result["text"],
+            "confidence": result["confidence"],
+            "language": result["language"],
+            "timestamp": RESPONSE_TIME
+        }
+        if timer is not NULL_TIMER:
+            response["processing_time_ms"] = round(timer.elapsed_ms(), 3)
+            response["timings_ms"] = timer.timings_ms()
+        if result.get("alternatives"):
+            response["alternatives"] = result["alternatives"]
+        if result.get("sequence"):
+            response["sequence"] = result["sequence"]
+        if result.get("cached"):
+            response["cached"] = True
+        if reused:
+            response["reused"] = True
+        return response
+    response = {
+        "success": False,
+        "message": "No hands detected or invalid image",
+        "language": language,
+        "timestamp": RESPONSE_TIME
+    }
+    if reused:
+        response["reused"] = True
+    return response
+
+def handle_translate(data, timer=NULL_TIMER):
+    """Full blocking /translate pipeline - returns (body, status_code)"""
+    decoded_data, language, error = parse_translate_request(data, timer)
+    return _translate_parsed(decoded_data, language, error, session_options(data), timer)
+
+def handle_translate_binary(body, language, options=None, timer=NULL_TIMER):
+    """Blocking /translate pipeline for binary uploads - returns (body, status_code)"""
+    image_data, language, error = parse_binary_request(body, language)
+    return _translate_parsed(image_data, language, error, options, timer)
+
+def handle_translate_landmarks(body, language, dims_header=None, frame_hands_header=None,
+                               options=None, timer=NULL_TIMER):
+    """Blocking /translate/landmarks pipeline - returns (body, status_code)
+    
+    A single-frame payload gets the usual /translate response; a batched
+    payload (X-Frame-Hands set) gets one response per frame under "results".
+    """
+    with timer.stage("landmark_decode"):
+        frames, language, batched, error = parse_landmark_request(
+            body, language, dims_header, frame_hands_header
+        )
+    if error:
+        return error
+    
+    if not batched:
+        return _translate_parsed(frames[0], language, None, options, timer)
+    
+    error = backend_not_ready(language)
+    if error:
+        return error
+    
+    try:
+        results = run_translation_many(frames, language, timer)
+    except AdmissionRejected as e:
+        return shed_response(e, language, timer)
+    return landmark_batch_response(results, language, timer), 200
+
+def landmark_batch_response(results, language, timer=NULL_TIMER):
+    """Response body for a multi-frame landmark payload"""
+    return {
+        "success": True,
+        "frames": len(results),
+        "language": language,
+        "processing_time_ms": round(timer.elapsed_ms(), 3),
+        "timings_ms": timer.timings_ms(),
+        "results": [translation_response(result, language) for result in results]
+    }
+
+def _translate_parsed(decoded_data, language, error, options=None, timer=NULL_TIMER):
+    if error:
+        return error
+    
+    options, crop, error = split_options(options)
+    if error:
+        return error
+    
+    error = backend_not_ready(language)
+    if error:
+        return error
+    
+    session, error = resolve_session(language, **options)
+    if error:
+        return error
+    
+    # Perform translation
+    try:
+        result, reused = run_session_translation(session, decoded_data, language, timer, crop)
+    except (AdmissionRejected, FrameSuperseded) as e:
+        return shed_response(e, language, timer)
+    return translation_response(result, language, reused, timer), 200
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+LinguaSigna ML Server - Translator Backends
+Registry of translator implementations, loaded lazily by name
+
+Backends are registered as "module:Class" strings so nothing heavy
+(MediaPipe, OpenCV, model files) is imported until the backend is actually
+loaded. The server picks one with ML_TRANSLATOR_BACKEND and loads it in a
+background warm-up thread, so the process accepts connections right away
+and reports readiness separately through /health/ready.
+"""
+
+import importlib
+import threading
+import time
+
+# name -> "module:Class"
+BACKENDS = {
+    "mock": "sign_translator:SimpleSignTranslator",
+    "mediapipe": "mediapipe_translator:MediaPipeSignTranslator",
+    "template": "template_translator:TemplateSignTranslator",
+    "mediapipe-template": "template_translator:MediaPipeTemplateTranslator",
+}
+
+class BackendNotReady(RuntimeError):
+    """Raised when a request needs the translator before it has loaded"""
+
+def register_backend(name, target):
+    """Add or replace a backend ("module:Class" string or a factory callable)"""
+    BACKENDS[name] = target
+
+def available_backends():
+    return sorted(BACKENDS)
+
+def resolve_backend(name):
+    """Import a registered backend's factory"""
+    try:
+        target = BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"Unknown translator backend: {name} (available: {', '.join(available_backends())})")
+    if callable(target):
+        return target
+    module_name, _, class_name = target.partition(":")
+    return getattr(importlib.import_module(module_name), class_name)
+
+class TranslatorBackend:
+    """Lazily loaded translator with explicit loading/ready/failed states.
+
+    Exposes translate() and translate_batch() so it can stand in for the
+    translator itself (the micro-batcher holds one of these).
+    """
+
+    def __init__(self, name="mock", options=None):
+        self.name = name
+        self.options = options or {}
+        self.state = "unloaded"
+        self.error = None
+        self.load_seconds = None
+        self._instance = None
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self._thread = None
+
+    def _load(self):
+        started = time.perf_counter()
+        try:
+            factory = resolve_backend(self.name)
+            instance = factory(**self.options)
+            # Optional hook: run a dummy frame so first real requests aren't slow
+            warm_up = getattr(instance, "warm_up", None)
+            if warm_up is not None:
+                warm_up()
+        except Exception as e:
+            self.state = "failed"
+            self.error = f"{type(e).__name__}: {e}"
+            print(f"❌ Translator backend '{self.name}' failed to load: {self.error}")
+        else:
+            self._instance = instance
+            self.state = "ready"
+            print(f"✅ Translator backend '{self.name}' ready")
+        finally:
+            self.load_seconds = time.perf_counter() - started
+            self._ready.set()
+
+    def start_warm_up(self):
+        """Load the backend on a background thread (idempotent)"""
+        with self._lock:
+            if self.state != "unloaded":
+                return
+            self.state = "loading"
+            self._thread = threading.Thread(
+                target=self._load, name=f"warm-up-{self.name}", daemon=True
+            )
+            self._thread.start()
+
+    def load(self):
+        """Load the backend on the calling thread (idempotent)"""
+        with self._lock:
+            if self.state != "unloaded":
+                return
+            self.state = "loading"
+        self._load()
+
+    def is_ready(self):
+        return self.state == "ready"
+
+    def wait_ready(self, timeout=None):
+        """Block until loaded (loading lazily on first use) - True if ready"""
+        if self.state == "unloaded":
+            self.load()
+        self._ready.wait(timeout)
+        return self.state == "ready"
+
+    def get(self, timeout=None):
+        """The loaded translator instance, or BackendNotReady"""
+        if not self.wait_ready(timeout):
+            raise BackendNotReady(self.error or f"Translator backend '{self.name}' is still loading")
+        return self._instance
+
+    def translate(self, image_data, language="asl"):
+        return self.get().translate(image_data, language)
+
+    def translate_batch(self, frames):
+        return self.get().translate_batch(frames)
+
+    def stats(self):
+        return {
+            "name": self.name,
+            "state": self.state,
+            "ready": self.state == "ready",
+            "load_seconds": round(self.load_seconds, 3) if self.load_seconds is not None else None,
+            "error": self.error,
+            "available": available_backends()
+        }
@@ -0,0 +1,476 @@
+#!/usr/bin/env python3
+"""
+LinguaSigna ML Server - Inference Worker Pool
+Runs the translator in separate processes so decoding and detection can use
+more than one core
+
+The front end copies each frame into a slot of one multiprocessing
+shared_memory block and sends the worker only the slot index and a little
+metadata, so pixel data is never pickled. Every worker process loads its own
+translator backend, drains whatever frames are waiting on its pipe into one
+translate_batch() call, and sends the results back. A collector thread in the
+server resolves the Futures handed out by submit(), notices workers that die
+(their result pipe closes) and respawns them.
+
+Enable with ML_WORKER_PROCESSES=N. The pool stands in for both the
+translator backend and the micro-batcher (same submit()/translate() and
+readiness interface).
+"""
+
+import atexit
+import multiprocessing
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from multiprocessing import connection, shared_memory
+
+from frame_decoder import CroppedFrame
+from translator_backends import BACKENDS, TranslatorBackend, available_backends, register_backend
+
+# Give up on a worker slot after this many exits in a row before it gets ready
+MAX_STARTUP_FAILURES = 3
+
+class WorkerCrashed(RuntimeError):
+    """Raised for frames that were in flight on a worker process that died"""
+
+def _frame_from_task(buffer, task):
+    """Rebuild a frame from its shared-memory slot (a view, not a copy)"""
+    _, offset, kind, meta, _, inline, crop = task
+    if inline is not None:
+        frame = inline
+    elif kind == "array":
+        import numpy as np
+        shape, dtype = meta
+        frame = np.ndarray(shape, dtype=dtype, buffer=buffer, offset=offset)
+    else:
+        frame = buffer[offset:offset + meta]
+    return CroppedFrame(frame, *crop) if crop is not None else frame
+
+def _worker_main(index, generation, backend_name, backend_target, backend_options, shm_name,
+                 task_conn, result_conn, max_batch):
+    """Worker process: load a translator, then translate frames until told to stop"""
+    if isinstance(backend_target, str):
+        register_backend(backend_name, backend_target)
+    backend = TranslatorBackend(backend_name, backend_options)
+    backend.load()
+    result_conn.send(("ready", index, generation, backend.is_ready(), backend.error))
+    if not backend.is_ready():
+        return
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    buffer = shm.buf
+    try:
+        while True:
+            task = task_conn.recv()
+            if task is None:
+                break
+            batch = [task]
+            stopping = False
+            # Whatever queued up while the last batch ran goes into this one
+            while len(batch) < max_batch and task_conn.poll():
+                task = task_conn.recv()
+                if task is None:
+                    stopping = True
+                    break
+                batch.append(task)
+
+            frames = [(_frame_from_task(buffer, task), task[4]) for task in batch]
+            started = time.perf_counter()
+            try:
+                results = backend.translate_batch(frames)
+                error = None
+            except Exception as e:
+                results = [None] * len(batch)
+                error = f"{type(e).__name__}: {e}"
+            inference_ms = (time.perf_counter() - started) * 1000.0
+            # Drop slot views before the parent reuses the slots
+            del frames
+
+            items = [(task[0], result) for task, result in zip(batch, results)]
+            result_conn.send(("done", index, generation, items, error, inference_ms))
+            if stopping:
+                break
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        buffer = None
+        try:
+            shm.close()
+        except BufferError:
+            pass
+
+class _Worker:
+    """Parent-side handle for one worker process"""
+
+    def __init__(self, index):
+        self.index = index
+        self.generation = 0
+        self.process = None
+        self.task_conn = None
+        self.result_conn = None
+        self.send_lock = threading.Lock()
+        self.in_flight = set()
+        self.ready = False
+        self.failed = False
+        self.error = None
+        self.frames = 0
+        self.batches = 0
+        self.restarts = 0
+        # Consecutive exits before reporting ready - stops a crash loop
+        self.startup_failures = 0
+
+class WorkerPool:
+    """Process-pool translator fed through shared-memory frame slots
+
+    Image slots hold the frame as the client encoded it (JPEG/PNG bytes),
+    not decoded pixels - each worker decodes its own frames, so decoding
+    runs on the worker's core and a slot stays small. Landmark frames are
+    copied as raw float32 arrays.
+
+    Scaling past one core is unverified: benchmark_worker_pool.py was only
+    run on a 1-CPU machine, where processes and threads both stayed flat
+    at about 300 frames/s.
+    """
+
+    def __init__(self, backend_name="mock", processes=2, max_batch=16, slots=None,
+                 slot_bytes=1 << 20, slot_timeout=10.0, start_method="spawn",
+                 backend_options=None, label=None):
+        self.name = backend_name
+        self.backend_target = BACKENDS.get(backend_name)
+        # Passed to the backend factory in every worker (e.g. languages=[...])
+        self.backend_options = backend_options or {}
+        # Names the worker processes, e.g. a language lane
+        self.label = label
+        self.processes = max(1, int(processes))
+        self.max_size = max(1, int(max_batch))
+        self.slot_count = int(slots or self.processes * self.max_size * 2)
+        self.slot_bytes = int(slot_bytes)
+        self.slot_timeout = slot_timeout
+        self._context = multiprocessing.get_context(start_method)
+
+        self.state = "unloaded"
+        self.error = None
+        self.load_seconds = None
+        self._started_at = None
+        self._ready = threading.Event()
+        self._lock = threading.Lock()
+        self._running = False
+        self._shm = None
+        self._free_slots = queue.Queue()
+        self._workers = []
+        self._pending = {}
+        self._next_task_id = 0
+        self._collector = None
+
+        # Stats reported through /status
+        self.frames_processed = 0
+        self.inline_frames = 0
+        self.crashes = 0
+
+    def start(self):
+        """Create the shared-memory slots and spawn the workers (idempotent)"""
+        with self._lock:
+            if self._running:
+                return
+            self._running = True
+            self.state = "loading"
+            self._started_at = time.perf_counter()
+            self._shm = shared_memory.SharedMemory(create=True, size=self.slot_count * self.slot_bytes)
+            for slot in range(self.slot_count):
+                self._free_slots.put(slot)
+            self._workers = [_Worker(index) for index in range(self.processes)]
+            for worker in self._workers:
+                self._spawn(worker)
+
+        self._collector = threading.Thread(target=self._collect, name="worker-pool", daemon=True)
+        self._collector.start()
+        atexit.register(self.stop)
+
+    # Same warm-up interface as TranslatorBackend - workers load in the background
+    start_warm_up = start
+
+    def load(self):
+        self.start()
+        self._ready.wait()
+
+    def _spawn(self, worker):
+        task_recv, task_send = self._context.Pipe(duplex=False)
+        result_recv, result_send = self._context.Pipe(duplex=False)
+        worker.generation += 1
+        worker.ready = False
+        worker.task_conn = task_send
+        worker.result_conn = result_recv
+        worker.process = self._context.Process(
+            target=_worker_main,
+            args=(worker.index, worker.generation, self.name, self.backend_target,
+                  self.backend_options, self._shm.name, task_recv, result_send, self.max_size),
+            name=f"ml-worker-{self.label}-{worker.index}" if self.label else f"ml-worker-{worker.index}",
+            daemon=True
+        )
+        worker.process.start()
+        # The child holds its own copies of these ends
+        task_recv.close()
+        result_send.close()
+
+    def stop(self, timeout=2.0):
+        """Stop the workers and release the shared memory"""
+        with self._lock:
+            if not self._running:
+                return
+            self._running = False
+            workers = list(self._workers)
+        for worker in workers:
+            try:
+                with worker.send_lock:
+                    worker.task_conn.send(None)
+            except OSError:
+                pass
+        for worker in workers:
+            worker.process.join(timeout)
+            if worker.process.is_alive():
+                worker.process.terminate()
+        if self._collector:
+            self._collector.join(timeout)
+
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        for future, _ in pending.values():
+            if not future.done():
+                future.set_exception(WorkerCrashed("Worker pool stopped"))
+        self._shm.close()
+        self._shm.unlink()
+        self.state = "unloaded"
+
+    def is_ready(self):
+        return self.state == "ready"
+
+    def wait_ready(self, timeout=None):
+        """Block until at least one worker has loaded its backend - True if ready"""
+        if not self._running:
+            self.start()
+        self._ready.wait(timeout)
+        return self.state == "ready"
+
+    def _write_slot(self, slot, image_data):
+        """Copy a frame into its slot - returns (kind, meta, inline)"""
+        offset = slot * self.slot_bytes
+        shape = getattr(image_data, "shape", None)
+        if shape is not None:
+            import numpy as np
+            array = np.ascontiguousarray(image_data)
+            if array.nbytes > self.slot_bytes:
+                self.inline_frames += 1
+                return "array", None, array
+            target = np.ndarray(array.shape, dtype=array.dtype, buffer=self._shm.buf, offset=offset)
+            target[...] = array
+            return "array", (array.shape, array.dtype.str), None
+
+        if image_data is None:
+            return "bytes", 0, None
+        view = memoryview(image_data).cast("B")
+        if view.nbytes > self.slot_bytes:
+            # Oversized frame - fall back to sending it through the pipe
+            self.inline_frames += 1
+            return "bytes", view.nbytes, bytes(view)
+        self._shm.buf[offset:offset + view.nbytes] = view
+        return "bytes", view.nbytes, None
+
+    def submit(self, image_data, language="asl"):
+        """Queue one frame on the least busy worker and return a Future for its result"""
+        if not self._running:
+            self.start()
+        future = Future()
+        future.submitted_at = time.perf_counter()
+        future.queue_ms = 0.0
+        future.inference_ms = 0.0
+        future.batch_size = 0
+
+        try:
+            slot = self._free_slots.get(timeout=self.slot_timeout)
+        except queue.Empty:
+            future.set_exception(TimeoutError("No free frame slots - all workers are busy"))
+            return future
+        crop = None
+        if isinstance(image_data, CroppedFrame):
+            # Only the encoded bytes go through the slot - the box rides along in the task
+            image_data, crop = image_data.data, (image_data.box, image_data.fallback)
+        try:
+            kind, meta, inline = self._write_slot(slot, image_data)
+        except Exception as e:
+            self._free_slots.put(slot)
+            future.set_exception(e)
+            return future
+
+        with self._lock:
+            candidates = [w for w in self._workers if w.ready] or self._workers
+            worker = min(candidates, key=lambda w: len(w.in_flight))
+            task_id = self._next_task_id
+            self._next_task_id += 1
+            self._pending[task_id] = (future, slot)
+            worker.in_flight.add(task_id)
+
+        task = (task_id, slot * self.slot_bytes, kind, meta, language, inline, crop)
+        try:
+            with worker.send_lock:
+                worker.task_conn.send(task)
+        except OSError:
+            # Worker died - fail the frame here rather than leave it to the collector,
+            # which may already have handled the exit (or be stopped)
+            with self._lock:
+                worker.in_flight.discard(task_id)
+                self._finish(task_id, error=WorkerCrashed(f"Worker {worker.index} is not running"))
+        return future
+
+    def translate(self, image_data, language="asl", timeout=None):
+        return self.submit(image_data, language).result(timeout)
+
+    def translate_batch(self, frames):
+        futures = [self.submit(image_data, language) for image_data, language in frames]
+        return [future.result() for future in futures]
+
+    def _finish(self, task_id, result=None, error=None, inference_ms=0.0, batch_size=0):
+        """Resolve one task's Future and give its slot back"""
+        entry = self._pending.pop(task_id, None)
+        if entry is None:
+            return
+        future, slot = entry
+        self._free_slots.put(slot)
+        future.inference_ms = inference_ms
+        future.queue_ms = max(0.0, (time.perf_counter() - future.submitted_at) * 1000.0 - inference_ms)
+        future.batch_size = batch_size
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def _collect(self):
+        """Collector thread: read worker results and respawn dead workers"""
+        while self._running:
+            with self._lock:
+                waitables = {
+                    worker.result_conn: worker
+                    for worker in self._workers if worker.result_conn is not None
+                }
+
+            for conn in connection.wait(list(waitables), timeout=0.5):
+                worker = waitables[conn]
+                try:
+                    message = conn.recv()
+                except (EOFError, OSError):
+                    # The worker's end only closes when its process exits
+                    self._handle_exit(worker)
+                    continue
+                self._handle_message(worker, message)
+
+    def _handle_message(self, worker, message):
+        kind, _, generation = message[:3]
+        if generation != worker.generation:
+            return
+        if kind == "ready":
+            _, _, _, ok, error = message
+            with self._lock:
+                worker.ready = ok
+                worker.failed = not ok
+                worker.error = error
+                if ok:
+                    worker.startup_failures = 0
+                self._update_state()
+            return
+
+        _, _, _, items, error, inference_ms = message
+        exception = RuntimeError(error) if error else None
+        with self._lock:
+            for task_id, result in items:
+                worker.in_flight.discard(task_id)
+                self._finish(task_id, result, exception, inference_ms, len(items))
+            worker.frames += len(items)
+            worker.batches += 1
+            self.frames_processed += len(items)
+
+    def _handle_exit(self, worker):
+        """A worker process exited - fail its frames and start a replacement"""
+        worker.process.join(1.0)
+        with self._lock:
+            worker.result_conn.close()
+            worker.result_conn = None
+            worker.task_conn.close()
+            exit_code = worker.process.exitcode
+            # Whatever happens next, nobody will answer these frames
+            self._fail_in_flight(worker, f"Worker {worker.index} exited with code {exit_code} while translating")
+            if not self._running:
+                return
+            if not worker.ready and not worker.failed:
+                worker.startup_failures += 1
+                if worker.startup_failures >= MAX_STARTUP_FAILURES:
+                    worker.failed = True
+                    worker.error = f"Worker exited with code {exit_code} during startup"
+            if worker.failed:
+                # Backend never loaded - respawning would just fail again
+                self._update_state()
+                return
+            self.crashes += 1
+            print(f"⚠️  ML worker {worker.index} (pid {worker.process.pid}) exited with code {exit_code} - respawning")
+            worker.restarts += 1
+            self._spawn(worker)
+            self._update_state()
+
+    def _fail_in_flight(self, worker, message):
+        """Fail every frame sent to a worker and free its slots (call with the lock held)"""
+        for task_id in list(worker.in_flight):
+            self._finish(task_id, error=WorkerCrashed(message))
+        worker.in_flight.clear()
+
+    def _update_state(self):
+        """Pool state from worker states (call with the lock held)"""
+        if any(w.ready for w in self._workers):
+            if self.state != "ready":
+                self.load_seconds = time.perf_counter() - self._started_at
+            self.state = "ready"
+            self._ready.set()
+        elif all(w.failed for w in self._workers):
+            self.state = "failed"
+            self.error = self._workers[0].error
+            self._ready.set()
+        else:
+            self.state = "loading"
+
+    def queue_depth(self):
+        """Frames handed to the workers and not answered yet (lock-free read for health probes)"""
+        return len(self._pending)
+
+    def stats(self):
+        """Backend and per-worker counters for the status endpoint"""
+        with self._lock:
+            workers = [{
+                "index": w.index,
+                "pid": w.process.pid if w.process else None,
+                "alive": bool(w.process and w.process.is_alive()),
+                "ready": w.ready,
+                "in_flight": len(w.in_flight),
+                "frames": w.frames,
+                "batches": w.batches,
+                "restarts": w.restarts,
+                "error": w.error
+            } for w in self._workers]
+        return {
+            "name": self.name,
+            "state": self.state,
+            "ready": self.state == "ready",
+            "load_seconds": round(self.load_seconds, 3) if self.load_seconds is not None else None,
+            "error": self.error,
+            "available": available_backends(),
+            "mode": "worker_pool",
+            "label": self.label,
+            "processes": self.processes,
+            "max_batch_size": self.max_size,
+            "slots": self.slot_count,
+            "free_slots": self._free_slots.qsize(),
+            "slot_bytes": self.slot_bytes,
+            "frames_processed": self.frames_processed,
+            "inline_frames": self.inline_frames,
+            "crashes": self.crashes,
+            "workers": workers
+        }